@@ -1,3 +1,5 @@
+import os
+
 import dash
 from dash import html
 import dash_bootstrap_components as dbc
@@ -9,6 +11,7 @@ app = dash.Dash(
     external_stylesheets=[dbc.themes.BOOTSTRAP],
     title="Demands Forecasting Dashboard"
 )
+server = app.server      # WSGI entry point, e.g. gunicorn app:server
 
 # ⭐ Inject background.html vào cuối <body> bằng index_string
 background_html = open("assets/background.html", "r", encoding="utf-8").read()
@@ -66,5 +69,17 @@ app.layout = html.Div(
     ]
 )
 
+# ------------------------------------------------------
+# Data watcher
+# ------------------------------------------------------
+# DATA_WATCH=1 picks up data changes without a restart (core/reload.py),
+# whatever serves the app: python app.py, flask run, gunicorn. Off by
+# default, so importing the app (export, tests) starts no thread
+if os.environ.get("DATA_WATCH", "0") == "1":
+    from core.reload import start_watcher
+
+    start_watcher()
+
 if __name__ == "__main__":
-    app.run(debug=True)
+    # the debug reloader would re-import and retrain everything on each edit
+    app.run(debug=True, use_reloader=False)
@@ -0,0 +1,51 @@
+import importlib
+
+# =========================================================
+# Headless core library
+# =========================================================
+# Load, clean, enrich, backtest and model code shared by the Dash pages,
+# the batch CLIs and the notebooks — nothing here needs Dash or Plotly.
+# `import core` itself is free: the names below are resolved on first
+# access, and heavy dependencies (sklearn, joblib, plotly) are imported
+# inside the functions that use them. `python -m core.imports` measures it.
+#
+# core.export and core.reload are app tooling and do import Dash;
+# core.lazypage loads the heavy page bodies on first visit.
+
+_EXPORTS = {
+    # load / clean / enrich
+    "connect": "core.store",
+    "daily_frame": "core.store",
+    "enriched_frame": "core.store",
+    "enrich_daily": "core.enrich",
+    "open_plane": "core.shared",
+    "lag_features": "core.features",
+    # design and features
+    "encode": "core.design",
+    "load_design": "core.design",
+    "FeaturePipeline": "core.pipeline",
+    "SparseEncoder": "core.encoding",
+    # backtest
+    "block_splits": "core.tuning",
+    "tuned_params": "core.tuning",
+    # models
+    "normal_solve": "core.design",
+    "NormalEquationRegression": "core.design",
+    "SparseLinearRegression": "core.encoding",
+    "HurdleRegressor": "core.hurdle",
+    "GrowingForest": "core.forest",
+    "IntermittentForecaster": "core.intermittent",
+    "SmoothingForecaster": "core.smoothing",
+    # forecasting
+    "future_frame": "core.scenario",
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name):
+    if name not in _EXPORTS:
+        raise AttributeError(f"module 'core' has no attribute {name!r}")
+    value = getattr(importlib.import_module(_EXPORTS[name]), name)
+    globals()[name] = value
+    return value
@@ -0,0 +1,140 @@
+import numpy as np
+import pandas as pd
+
+from core.shared import open_plane
+
+# =========================================================
+# Cross-product analytics: correlation, promotion uplift,
+# feature importance
+# =========================================================
+# Every product shares the same daily timeline, so the enriched table
+# stacks into a (products × days × features) array. All products are
+# handled at once:
+#
+#   correlation : C = Zᵀ Z / n with Z = A − mean, R = C / σσᵀ     (one batched matmul)
+#   importance  : standardized OLS coefficients β = R_xx⁺ r_xy      (batched from R)
+#   uplift      : mean demand on promotion vs non-promotion days    (masked sums)
+
+TARGET = "Total_Order_Demand"
+CORR_COLUMNS = [TARGET, "Order_Count", "Holiday", "Black_Friday", "Promotion"]
+
+
+def stacked_array(con, columns=CORR_COLUMNS):
+    # read-only view of the shared data plane (no per-process copy)
+    plane = open_plane(con)
+    return np.array(plane.products), plane.stacked(columns)
+
+
+def batched_corr(A):
+    # A: (products × days × k) → (products × k × k); constant columns give NaN
+    n = A.shape[1]
+    Z = A - A.mean(axis=1, keepdims=True)
+    C = np.swapaxes(Z, 1, 2) @ Z / n
+    std = np.sqrt(np.diagonal(C, axis1=1, axis2=2))
+    with np.errstate(invalid="ignore", divide="ignore"):
+        return C / (std[:, :, None] * std[:, None, :])
+
+
+def feature_importance(R, target=0):
+    # standardized coefficients of the target on the other columns, from the
+    # correlation matrices alone; constant features get 0
+    k = R.shape[-1]
+    features = [j for j in range(k) if j != target]
+    R = np.nan_to_num(R)
+    R_xx = R[:, features][:, :, features]
+    r_xy = R[:, features, target]
+    beta = (np.linalg.pinv(R_xx) @ r_xy[..., None])[..., 0]
+    r2 = np.sum(beta * r_xy, axis=1)
+    return beta, r2
+
+
+def promotion_uplift(A, columns=CORR_COLUMNS):
+    demand = A[..., columns.index(TARGET)]
+    promo = A[..., columns.index("Promotion")] > 0
+
+    n_promo = promo.sum(axis=1)
+    n_base = (~promo).sum(axis=1)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        mean_promo = np.where(promo, demand, 0).sum(axis=1) / n_promo
+        mean_base = np.where(promo, 0, demand).sum(axis=1) / n_base
+        pct = 100 * (mean_promo - mean_base) / mean_base
+
+    return pd.DataFrame({
+        "Promo days": n_promo,
+        "Mean demand (promo)": mean_promo,
+        "Mean demand (no promo)": mean_base,
+        "Uplift": mean_promo - mean_base,
+        "Uplift %": pct,
+    })
+
+
+def uplift_summary(uplift):
+    # aggregate across products (products without promotion days are skipped)
+    valid = uplift.dropna(subset=["Uplift"])
+    pct = valid["Uplift %"].replace([np.inf, -np.inf], np.nan).dropna()
+    return pd.DataFrame({
+        "Statistic": ["Products", "With promotion days", "Positive uplift",
+                      "Median uplift %", "Mean uplift %", "P10 uplift %", "P90 uplift %"],
+        "Value": [len(uplift), len(valid), int((valid["Uplift"] > 0).sum()),
+                  pct.median(), pct.mean(), pct.quantile(0.1), pct.quantile(0.9)],
+    })
+
+
+def product_analytics(con, columns=CORR_COLUMNS):
+    products, A = stacked_array(con, columns)
+    R = batched_corr(A)
+    beta, r2 = feature_importance(R, target=columns.index(TARGET))
+
+    features = [c for c in columns if c != TARGET]
+    importance = pd.DataFrame(np.abs(beta), columns=features)
+    importance.insert(0, "Product_Code", products)
+    importance["R²"] = r2
+
+    uplift = promotion_uplift(A, columns)
+    uplift.insert(0, "Product_Code", products)
+
+    return {"products": products, "corr": R, "importance": importance, "uplift": uplift}
+
+
+# =========================================================
+# FIGURES
+# =========================================================
+# plotly is imported inside the figure functions, so the analytics above
+# stay usable without it
+
+
+def corr_heatmap(R, columns, title="Correlation Matrix"):
+    # single product; values drawn by the trace itself (texttemplate)
+    # instead of one layout annotation per cell
+    import plotly.graph_objects as go
+
+    fig = go.Figure(go.Heatmap(
+        z=np.round(R, 2), x=columns, y=columns,
+        colorscale="PuBu", zmin=-1, zmax=1,
+        texttemplate="%{z}", hovertemplate="%{y} × %{x}: %{z}<extra></extra>",
+    ))
+    fig.update_layout(title=title, template="plotly_white")
+    return fig
+
+
+def product_corr_heatmap(products, R, columns, title="Pairwise Correlations — All Products"):
+    # one row per product, one column per feature pair (upper triangle);
+    # a single heatmap trace, no per-cell text, so hundreds of rows stay light
+    import plotly.graph_objects as go
+
+    i, j = np.triu_indices(len(columns), k=1)
+    pairs = [f"{columns[a]} × {columns[b]}" for a, b in zip(i, j)]
+    z = np.round(R[:, i, j], 3)
+
+    fig = go.Figure(go.Heatmap(
+        z=z, x=pairs, y=list(products),
+        colorscale="RdBu", zmid=0, zmin=-1, zmax=1,
+        hovertemplate="%{y}<br>%{x}: %{z}<extra></extra>",
+    ))
+    fig.update_layout(
+        title=title, template="plotly_white",
+        height=min(250 + 14 * len(products), 900),
+        yaxis=dict(showticklabels=len(products) <= 60, autorange="reversed"),
+        xaxis=dict(tickangle=-30),
+    )
+    return fig
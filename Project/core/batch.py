@@ -0,0 +1,246 @@
+import argparse
+import glob
+import importlib
+import json
+import os
+import shutil
+import time
+
+import numpy as np
+import pandas as pd
+import pyarrow.parquet as pq
+from joblib import Parallel, delayed
+
+from core import store
+from core.design import PRECISION
+from core.pipeline import FeaturePipeline
+from core.scenario import future_frame
+from core.shared import DataPlane, open_plane
+from core.tuning import DT_GRID, HGB_GRID, RF_GRID, block_splits, tuned_params
+
+# =========================================================
+# Nightly batch forecasting
+# =========================================================
+# Headless run over every product in the store: for each configured model,
+# the rolling-block backtest of the Model page plus a forecast of the next
+# `horizon` days from a fit on the full history (future rows come from the
+# product's fitted FeaturePipeline). Data and design come from the shared
+# data plane, published once by the parent and mapped by every worker.
+#
+# The parent also opens (and if needed rebuilds) the store and resolves the
+# tuned hyperparameters of every pending product before dispatch: workers
+# never touch SQLite, so the registry has a single writer, and the only
+# process pool running is the one over chunks.
+#
+# Products are split into fixed chunks that run in parallel worker
+# processes. Each finished chunk writes its own Parquet files (metrics
+# first, forecasts last, both via rename), and a chunk counts as done once
+# its forecasts file exists — so an interrupted run picks up at the first
+# unfinished chunk. run.json pins the store version and settings; a run
+# with different ones starts over. The chunk files are finally merged into
+# metrics.parquet and forecasts.parquet.
+
+BATCH_DIR = os.path.join(store.DATA_DIR, "batch")
+CHUNK_SIZE = 25
+HORIZON = 28
+TARGET = "Total_Order_Demand"
+
+# name → ("module:class" of the estimator, tuning grid or None); classes
+# are imported when a run uses them. Tuned hyperparameters come from the
+# registry, searched and registered by the parent on first use for a product
+MODELS = {
+    "LinearRegression": ("core.design:NormalEquationRegression", None),
+    "DecisionTree": ("sklearn.tree:DecisionTreeRegressor", DT_GRID),
+    "RandomForest": ("core.forest:GrowingForest", RF_GRID),
+    "HistGradientBoosting": ("sklearn.ensemble:HistGradientBoostingRegressor", HGB_GRID),
+    "Hurdle": ("core.hurdle:HurdleRegressor", None),
+}
+DEFAULT_MODELS = ["LinearRegression", "DecisionTree", "HistGradientBoosting", "Hurdle"]
+
+
+def estimator_class(name):
+    module, cls = MODELS[name][0].split(":")
+    return getattr(importlib.import_module(module), cls)
+
+
+def _chunk_paths(out_dir, index):
+    base = os.path.join(out_dir, "chunks", f"chunk_{index:05d}")
+    return base + ".metrics.parquet", base + ".forecasts.parquet"
+
+
+def _write_parquet(frame, path):
+    tmp_path = path + ".tmp"
+    frame.to_parquet(tmp_path, index=False)
+    os.replace(tmp_path, path)
+
+
+def _product_data(plane, product):
+    X = plane.design[plane.rows(product), 1:]
+    df = plane.enriched_frame(product)
+    return X, df, df[TARGET].to_numpy(dtype=PRECISION)
+
+
+def resolve_params(con, plane, products, models, n_jobs=-1):
+    # {product: {model: params}}; registry hits are reused, misses searched
+    # here (one search at a time, parallel over its configurations)
+    tuned = [name for name in models if MODELS[name][1] is not None]
+    params = {}
+    for product in products:
+        params[product] = {name: {} for name in models}
+        if not tuned:
+            continue
+        X, _, y = _product_data(plane, product)
+        splits = block_splits(len(y))
+        for name in tuned:
+            params[product][name] = tuned_params(
+                con, name, estimator_class(name), MODELS[name][1], X, y, splits,
+                product=product, n_jobs=n_jobs,
+            )
+    return params
+
+
+def product_forecasts(plane, product, models, params, horizon):
+    # (metrics rows, forecast frame) for one product; params: {model: params}
+    from sklearn.metrics import mean_absolute_error, mean_squared_error, r2_score
+
+    X, df, y = _product_data(plane, product)
+    splits = block_splits(len(y))
+
+    pipeline = FeaturePipeline().fit(df)
+    future = future_frame(start=df["Date"].max() + pd.Timedelta(days=1), periods=horizon)
+    X_future = pipeline.transform(future, PRECISION)
+
+    rows, forecasts = [], []
+    for name in models:
+        estimator = estimator_class(name)
+        for b, (train, test) in enumerate(splits):
+            t0 = time.perf_counter()
+            model = estimator(**params[name]).fit(X[train], y[train])
+            fit_time = time.perf_counter() - t0
+            pred = model.predict(X[test])
+            rows.append([
+                product, name, b + 1,
+                r2_score(y[test], pred),
+                mean_absolute_error(y[test], pred),
+                np.sqrt(mean_squared_error(y[test], pred)),
+                fit_time,
+            ])
+
+        model = estimator(**params[name]).fit(X, y)
+        forecasts.append(pd.DataFrame({
+            "Product_Code": product,
+            "Model": name,
+            "Date": future["Date"],
+            "Forecast": np.maximum(model.predict(X_future), 0.0),
+        }))
+
+    return rows, pd.concat(forecasts, ignore_index=True)
+
+
+def run_chunk(index, plane_path, products, params, models, horizon, out_dir=BATCH_DIR):
+    # runs in a worker: maps the plane main published, no store access
+    plane = DataPlane(plane_path)
+    rows, forecasts = [], []
+    for product in products:
+        r, f = product_forecasts(plane, product, models, params[product], horizon)
+        rows += r
+        forecasts.append(f)
+
+    metrics_path, forecasts_path = _chunk_paths(out_dir, index)
+    _write_parquet(
+        pd.DataFrame(rows, columns=["Product_Code", "Model", "Block", "R2", "MAE", "RMSE", "Fit_s"]),
+        metrics_path,
+    )
+    _write_parquet(pd.concat(forecasts, ignore_index=True), forecasts_path)
+    return index, len(products)
+
+
+def plan_run(con, models, horizon, chunk_size, out_dir=BATCH_DIR):
+    # chunks of the current run; a checkpoint from other data or settings
+    # is discarded
+    products = [r[0] for r in con.execute(
+        "SELECT DISTINCT Product_Code FROM enriched ORDER BY Product_Code"
+    )]
+    run = {
+        "source_version": store.source_version(con),
+        "models": list(models),
+        "horizon": horizon,
+        "chunks": [products[i:i + chunk_size] for i in range(0, len(products), chunk_size)],
+    }
+    run_path = os.path.join(out_dir, "run.json")
+    previous = None
+    if os.path.exists(run_path):
+        with open(run_path, encoding="utf-8") as f:
+            previous = json.load(f)
+    if previous != run:
+        shutil.rmtree(os.path.join(out_dir, "chunks"), ignore_errors=True)
+        os.makedirs(os.path.join(out_dir, "chunks"), exist_ok=True)
+        with open(run_path, "w", encoding="utf-8") as f:
+            json.dump(run, f)
+    return run["chunks"]
+
+
+def pending_chunks(chunks, out_dir=BATCH_DIR):
+    return [i for i in range(len(chunks)) if not os.path.exists(_chunk_paths(out_dir, i)[1])]
+
+
+def merge_chunks(out_dir=BATCH_DIR):
+    # stream chunk files into one Parquet file per output, one chunk in memory
+    for kind in ("metrics", "forecasts"):
+        paths = sorted(glob.glob(os.path.join(out_dir, "chunks", f"chunk_*.{kind}.parquet")))
+        out_path = os.path.join(out_dir, f"{kind}.parquet")
+        tmp_path = out_path + ".tmp"
+        writer = None
+        for path in paths:
+            table = pq.read_table(path)
+            if writer is None:
+                writer = pq.ParquetWriter(tmp_path, table.schema)
+            writer.write_table(table)
+        if writer is not None:
+            writer.close()
+            os.replace(tmp_path, out_path)
+
+
+# =========================================================
+# CLI
+# =========================================================
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Batch backtest and forecast of all products, resumable by chunk"
+    )
+    parser.add_argument("--models", nargs="+", choices=list(MODELS), default=DEFAULT_MODELS)
+    parser.add_argument("--horizon", type=int, default=HORIZON)
+    parser.add_argument("--chunk-size", type=int, default=CHUNK_SIZE)
+    parser.add_argument("--jobs", type=int, default=-1)
+    parser.add_argument("--out", default=BATCH_DIR)
+    args = parser.parse_args(argv)
+
+    con = store.connect()                # the only process that may rebuild the store
+    plane = open_plane(con)              # publish once, workers attach to it
+    chunks = plan_run(con, args.models, args.horizon, args.chunk_size, args.out)
+    todo = pending_chunks(chunks, args.out)
+    print(f"{sum(map(len, chunks))} products in {len(chunks)} chunks, "
+          f"{len(chunks) - len(todo)} already done", flush=True)
+
+    t0 = time.perf_counter()
+    params = resolve_params(con, plane, [p for i in todo for p in chunks[i]], args.models, args.jobs)
+    con.close()
+    print(f"hyperparameters resolved   {time.perf_counter() - t0:8.1f} s", flush=True)
+
+    done = Parallel(n_jobs=args.jobs, return_as="generator_unordered")(
+        delayed(run_chunk)(
+            i, plane.path, chunks[i], {p: params[p] for p in chunks[i]},
+            args.models, args.horizon, args.out,
+        )
+        for i in todo
+    )
+    for i, n in done:
+        print(f"chunk {i:5d}: {n} products   {time.perf_counter() - t0:8.1f} s", flush=True)
+
+    merge_chunks(args.out)
+    print(f"wrote {os.path.join(args.out, 'metrics.parquet')} and "
+          f"{os.path.join(args.out, 'forecasts.parquet')}")
+
+
+if __name__ == "__main__":
+    main()
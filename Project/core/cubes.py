@@ -0,0 +1,259 @@
+import numpy as np
+import pandas as pd
+
+# =========================================================
+# Precomputed aggregate cubes for the Story page
+# =========================================================
+# Materialized once per store build, so the Story figures are drawn from
+# small summaries and their payload does not grow with history length.
+
+HIST_BINS = 50
+MAX_OUTLIERS = 25   # most extreme outliers kept per side (low / high) per box group
+CUBE_VERSION = "2"  # bump when the cube tables change; stale cubes are rebuilt
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS cube_month (
+    Product_Code TEXT    NOT NULL,
+    Year         INTEGER NOT NULL,
+    Month        INTEGER NOT NULL,
+    Season       TEXT    NOT NULL,
+    Days         INTEGER NOT NULL,
+    Total        REAL    NOT NULL,
+    Mean         REAL    NOT NULL,
+    Max          REAL    NOT NULL,
+    Zero_Days    INTEGER NOT NULL,
+    Promo_Days   INTEGER NOT NULL,
+    PRIMARY KEY (Product_Code, Year, Month)
+);
+CREATE INDEX IF NOT EXISTS idx_cube_month_season ON cube_month (Product_Code, Season);
+
+CREATE TABLE IF NOT EXISTS cube_hist (
+    Product_Code TEXT    NOT NULL,
+    Bin          INTEGER NOT NULL,
+    Bin_Left     REAL    NOT NULL,
+    Bin_Right    REAL    NOT NULL,
+    Count        INTEGER NOT NULL,
+    PRIMARY KEY (Product_Code, Bin)
+);
+
+CREATE TABLE IF NOT EXISTS cube_box (
+    Product_Code TEXT    NOT NULL,
+    Grp          TEXT    NOT NULL,
+    N            INTEGER NOT NULL,
+    Q1           REAL,
+    Median       REAL,
+    Q3           REAL,
+    Lowerfence   REAL,
+    Upperfence   REAL,
+    Mean         REAL,
+    Outliers     INTEGER,
+    PRIMARY KEY (Product_Code, Grp)
+);
+
+CREATE TABLE IF NOT EXISTS cube_box_outliers (
+    Product_Code TEXT NOT NULL,
+    Grp          TEXT NOT NULL,
+    Value        REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_cube_box_outliers ON cube_box_outliers (Product_Code, Grp);
+"""
+
+# box groups: name → Promotion filter (None = all days)
+BOX_GROUPS = {"All": None, "Promotion=0": 0, "Promotion=1": 1}
+
+
+# =========================================================
+# BUILD
+# =========================================================
+def _demand_matrix(con):
+    # enriched rows share one daily timeline → (products × days) matrix
+    df = pd.read_sql_query(
+        """
+        SELECT Product_Code, Total_Order_Demand, Promotion
+        FROM enriched
+        ORDER BY Product_Code, Date
+        """,
+        con,
+    )
+    products = df["Product_Code"].unique()
+    shape = (len(products), -1)
+    demand = df["Total_Order_Demand"].to_numpy(dtype=float).reshape(shape)
+    promo = df["Promotion"].to_numpy().reshape(shape)
+    return products, demand, promo
+
+
+def _histograms(demand, bins=HIST_BINS):
+    lo = demand.min(axis=1, keepdims=True)
+    hi = demand.max(axis=1, keepdims=True)
+    width = np.where(hi > lo, (hi - lo) / bins, 1.0)
+
+    idx = np.minimum(((demand - lo) / width).astype(int), bins - 1)
+    flat = idx + bins * np.arange(len(demand))[:, None]
+    counts = np.bincount(flat.ravel(), minlength=bins * len(demand)).reshape(-1, bins)
+
+    left = lo + width * np.arange(bins)
+    return left, left + width, counts
+
+
+def _box_stats(values):
+    # values: (products × days) with NaN outside the group
+    q1, median, q3 = np.nanquantile(values, [0.25, 0.5, 0.75], axis=1)
+    iqr = q3 - q1
+    lo_lim = (q1 - 1.5 * iqr)[:, None]
+    hi_lim = (q3 + 1.5 * iqr)[:, None]
+
+    inside = (values >= lo_lim) & (values <= hi_lim)
+    lowerfence = np.nanmin(np.where(inside, values, np.nan), axis=1)
+    upperfence = np.nanmax(np.where(inside, values, np.nan), axis=1)
+    outliers = np.where(inside | np.isnan(values), np.nan, values)
+
+    return {
+        "N": np.sum(~np.isnan(values), axis=1),
+        "Q1": q1, "Median": median, "Q3": q3,
+        "Lowerfence": lowerfence, "Upperfence": upperfence,
+        "Mean": np.nanmean(values, axis=1),
+        "Outliers": np.sum(~np.isnan(outliers), axis=1),
+    }, outliers, lo_lim, hi_lim
+
+
+def _extreme_outliers(outliers, lo_lim, hi_lim, k=MAX_OUTLIERS):
+    # (product index, value) of the k lowest low-side and the k highest
+    # high-side outliers of each product
+    high = np.where(outliers > hi_lim, outliers, -np.inf)
+    low = np.where(outliers < lo_lim, outliers, np.inf)
+    top = -np.sort(-high, axis=1)[:, :k]
+    bottom = np.sort(low, axis=1)[:, :k]
+    kept = np.hstack([bottom, top])
+    p_idx, _ = np.nonzero(np.isfinite(kept))
+    return p_idx, kept[np.isfinite(kept)]
+
+
+def cubes_stale(con):
+    row = con.execute("SELECT value FROM meta WHERE key = 'cube_version'").fetchone()
+    return row is None or row[0] != CUBE_VERSION
+
+
+def build_cubes(con):
+    for table in ["cube_month", "cube_hist", "cube_box", "cube_box_outliers"]:
+        con.execute(f"DROP TABLE IF EXISTS {table}")
+    con.executescript(SCHEMA)
+    con.execute("INSERT OR REPLACE INTO meta VALUES ('cube_version', ?)", (CUBE_VERSION,))
+
+    # month cube (season / year roll up from it)
+    con.execute(
+        """
+        INSERT INTO cube_month
+        SELECT Product_Code, Year, Month, Season,
+               COUNT(*),
+               SUM(Total_Order_Demand),
+               AVG(Total_Order_Demand),
+               MAX(Total_Order_Demand),
+               SUM(Total_Order_Demand = 0),
+               SUM(Promotion = 1)
+        FROM enriched
+        GROUP BY Product_Code, Year, Month
+        """
+    )
+
+    products, demand, promo = _demand_matrix(con)
+    if len(products) == 0:
+        con.commit()
+        return
+
+    # histogram bin counts
+    left, right, counts = _histograms(demand)
+    hist = pd.DataFrame({
+        "Product_Code": np.repeat(products, HIST_BINS),
+        "Bin": np.tile(np.arange(HIST_BINS), len(products)),
+        "Bin_Left": left.ravel(),
+        "Bin_Right": right.ravel(),
+        "Count": counts.ravel(),
+    })
+    hist.to_sql("cube_hist", con, if_exists="append", index=False)
+
+    # box-plot quantiles + outliers, capped per side (the total count is
+    # kept in cube_box so the chart can say how many are shown)
+    for grp, flag in BOX_GROUPS.items():
+        values = demand if flag is None else np.where(promo == flag, demand, np.nan)
+        with np.errstate(all="ignore"):
+            stats, outliers, lo_lim, hi_lim = _box_stats(values)
+
+        box = pd.DataFrame(stats)
+        box.insert(0, "Grp", grp)
+        box.insert(0, "Product_Code", products)
+        box.to_sql("cube_box", con, if_exists="append", index=False)
+
+        p_idx, kept = _extreme_outliers(outliers, lo_lim, hi_lim)
+        pd.DataFrame({
+            "Product_Code": products[p_idx],
+            "Grp": grp,
+            "Value": kept,
+        }).to_sql("cube_box_outliers", con, if_exists="append", index=False)
+
+    con.commit()
+
+
+# =========================================================
+# QUERIES
+# =========================================================
+def monthly_mean(con, product):
+    return pd.read_sql_query(
+        """
+        SELECT Month, SUM(Total) / SUM(Days) AS Total_Order_Demand
+        FROM cube_month
+        WHERE Product_Code = ?
+        GROUP BY Month
+        ORDER BY Month
+        """,
+        con, params=(product,),
+    )
+
+
+def month_series(con, product):
+    # one row per calendar month of the history
+    df = pd.read_sql_query(
+        """
+        SELECT Year, Month, Days, Mean, Max, Zero_Days
+        FROM cube_month
+        WHERE Product_Code = ?
+        ORDER BY Year, Month
+        """,
+        con, params=(product,),
+    )
+    df["Date"] = pd.to_datetime(dict(year=df["Year"], month=df["Month"], day=1))
+    return df
+
+
+def season_months(con, product, season):
+    df = pd.read_sql_query(
+        """
+        SELECT Year, Month, Mean AS Total_Order_Demand, Max, Zero_Days
+        FROM cube_month
+        WHERE Product_Code = ? AND Season = ?
+        ORDER BY Year, Month
+        """,
+        con, params=(product, season),
+    )
+    df["Date"] = pd.to_datetime(dict(year=df["Year"], month=df["Month"], day=1))
+    return df
+
+
+def histogram(con, product):
+    return pd.read_sql_query(
+        "SELECT Bin_Left, Bin_Right, Count FROM cube_hist WHERE Product_Code = ? ORDER BY Bin",
+        con, params=(product,),
+    )
+
+
+def box_stats(con, product, groups):
+    marks = ", ".join("?" * len(groups))
+    box = pd.read_sql_query(
+        f"SELECT * FROM cube_box WHERE Product_Code = ? AND Grp IN ({marks})",
+        con, params=(product, *groups),
+    ).set_index("Grp").loc[list(groups)].reset_index()
+
+    outliers = pd.read_sql_query(
+        f"SELECT Grp, Value FROM cube_box_outliers WHERE Product_Code = ? AND Grp IN ({marks})",
+        con, params=(product, *groups),
+    )
+    return box, outliers
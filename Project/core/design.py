@@ -0,0 +1,280 @@
+import json
+import os
+
+import numpy as np
+
+from core import store
+
+# =========================================================
+# Design matrix with a fixed column layout
+# =========================================================
+# Same columns, in the same order, as pd.get_dummies(drop_first=True) on the
+# enriched table (numeric columns first, then Season dummies with Autumn
+# as the reference level) — but independent of which seasons a chunk
+# happens to contain, so partitions/batches can be encoded one at a time.
+
+NUMERIC_COLUMNS = ["Order_Count", "Holiday", "Black_Friday", "Promotion"]
+SEASON_LEVELS = ["Spring", "Summer", "Winter"]
+SEASONS = ["Autumn"] + SEASON_LEVELS
+DESIGN_COLUMNS = NUMERIC_COLUMNS + [f"Season_{s}" for s in SEASON_LEVELS]
+
+# Compute precision for design matrices, targets, fits and batched
+# predictions: DEMAND_PRECISION=float32 halves memory traffic (sklearn
+# trees work in float32 anyway). Normal-equation solves always
+# accumulate in float64, see normal_solve.
+PRECISIONS = ("float64", "float32")
+PRECISION = np.dtype(os.environ.get("DEMAND_PRECISION", "float64"))
+if PRECISION.name not in PRECISIONS:
+    raise ValueError(f"DEMAND_PRECISION must be one of {PRECISIONS}, got {PRECISION.name}")
+
+
+def encode(frame, dtype=np.float64):
+    X = np.empty((len(frame), len(DESIGN_COLUMNS)), dtype=dtype)
+    for j, c in enumerate(NUMERIC_COLUMNS):
+        X[:, j] = frame[c].to_numpy()
+    season = frame["Season"].to_numpy()
+    for j, s in enumerate(SEASON_LEVELS, start=len(NUMERIC_COLUMNS)):
+        X[:, j] = season == s
+    return X
+
+
+def normal_solve(X, y):
+    # β = (XᵀX)⁺ Xᵀy with the products accumulated in float64; β comes
+    # back in the design's dtype so predictions stay in that precision
+    X64 = np.asarray(X, dtype=np.float64)
+    beta = np.linalg.pinv(X64.T @ X64) @ (X64.T @ np.asarray(y, dtype=np.float64))
+    return beta.astype(X.dtype, copy=False)
+
+
+class NormalEquationRegression:
+    # sklearn-style OLS through normal_solve; pinv drops directions the
+    # training rows never vary in (e.g. a season absent from a block), where
+    # an lstsq fit can blow up on the test rows
+
+    def fit(self, X, y):
+        X = np.asarray(X)
+        self.coef_ = normal_solve(np.hstack((np.ones((len(X), 1), dtype=X.dtype), X)), np.ravel(y))
+        return self
+
+    def predict(self, X):
+        return self.coef_[0] + np.asarray(X) @ self.coef_[1:]
+
+
+# =========================================================
+# Memory-mapped design matrix (all products, bias precomputed)
+# =========================================================
+# Materialized once per store version as a C-contiguous .npy:
+#   column 0 = bias, columns 1.. = DESIGN_COLUMNS
+#   rows     = products stacked in code order, each in date order
+# Every model, block and worker slices zero-copy views out of it
+# (row slices of a C-contiguous array stay contiguous; joblib hands
+# memmap-backed arrays to worker processes by file reference).
+
+DESIGN_DIR = os.path.join(store.DATA_DIR, "design")
+
+
+class DesignIndex:
+
+    def __init__(self, meta):
+        self.meta = meta
+        self.columns = ["bias"] + meta["columns"]
+        self.offsets = dict(zip(meta["products"], zip(meta["starts"], meta["stops"])))
+
+    def rows(self, product):
+        start, stop = self.offsets[product]
+        return slice(start, stop)
+
+
+def _paths(dtype, out_dir):
+    name = np.dtype(dtype).name
+    return (os.path.join(out_dir, f"design_{name}.npy"),
+            os.path.join(out_dir, f"design_{name}.json"))
+
+
+def materialize_design(con, dtype=np.float64, out_dir=DESIGN_DIR):
+    npy_path, meta_path = _paths(dtype, out_dir)
+    os.makedirs(out_dir, exist_ok=True)
+
+    counts = con.execute(
+        "SELECT Product_Code, COUNT(*) FROM enriched GROUP BY Product_Code ORDER BY Product_Code"
+    ).fetchall()
+    total = sum(n for _, n in counts)
+
+    tmp_path = npy_path + ".tmp.npy"
+    mm = np.lib.format.open_memmap(
+        tmp_path, mode="w+", dtype=dtype, shape=(total, 1 + len(DESIGN_COLUMNS))
+    )
+    starts, stops, offset = [], [], 0
+    for product, n in counts:
+        frame = store.enriched_frame(con, product, columns=["Season"] + NUMERIC_COLUMNS)
+        mm[offset:offset + n, 0] = 1.0
+        mm[offset:offset + n, 1:] = encode(frame, dtype)
+        starts.append(offset)
+        stops.append(offset + n)
+        offset += n
+    mm.flush()
+    del mm
+    os.replace(tmp_path, npy_path)
+
+    meta = {
+        "source_version": store.source_version(con),
+        "columns": DESIGN_COLUMNS,
+        "products": [p for p, _ in counts],
+        "starts": starts,
+        "stops": stops,
+    }
+    with open(meta_path, "w", encoding="utf-8") as f:
+        json.dump(meta, f)
+
+
+def load_design(con, dtype=np.float64, out_dir=DESIGN_DIR):
+    # read-only memmap + index; rebuilt when the store has new data
+    npy_path, meta_path = _paths(dtype, out_dir)
+    meta = None
+    if os.path.exists(npy_path) and os.path.exists(meta_path):
+        with open(meta_path, encoding="utf-8") as f:
+            meta = json.load(f)
+    if meta is None or meta["source_version"] != store.source_version(con):
+        materialize_design(con, dtype, out_dir)
+        with open(meta_path, encoding="utf-8") as f:
+            meta = json.load(f)
+
+    return np.load(npy_path, mmap_mode="r"), DesignIndex(meta)
+
+
+# =========================================================
+# CLI: peak RSS (copies vs memmap), float64 vs float32
+# =========================================================
+def _backtest(X_with_bias, y):
+    # the Model page's linear + tree fits over the rolling blocks;
+    # returns (y_true, linear pred, tree pred) over all test rows
+    from sklearn.tree import DecisionTreeRegressor
+    from core.tuning import block_splits
+
+    out = []
+    for train, test in block_splits(len(y)):
+        beta = normal_solve(X_with_bias[train], y[train])
+        tree = DecisionTreeRegressor(max_depth=8, random_state=42)
+        tree.fit(X_with_bias[train, 1:], y[train])
+        out.append((y[test], X_with_bias[test] @ beta, tree.predict(X_with_bias[test, 1:])))
+    return [np.concatenate(parts) for parts in zip(*out)]
+
+
+def _target(con, product, dtype):
+    y = store.enriched_frame(con, product, columns=["Total_Order_Demand"])
+    return y["Total_Order_Demand"].to_numpy(dtype=dtype)
+
+
+def _run_copies(con, products):
+    import pandas as pd
+
+    for product in products:
+        df = store.enriched_frame(con, product)
+        X = pd.get_dummies(
+            df.drop(columns=["Date", "Total_Order_Demand"]), drop_first=True
+        ).values.astype(float)
+        X_with_bias = np.hstack((np.ones((len(X), 1)), X))
+        _backtest(X_with_bias, df["Total_Order_Demand"].to_numpy(dtype=float))
+
+
+def _run_memmap(con, products, dtype):
+    design, index = load_design(con, dtype)
+    return {
+        product: _backtest(design[index.rows(product)], _target(con, product, dtype))
+        for product in products
+    }
+
+
+def _measure_child(mode, products, dtype, results):
+    # runs in a fresh process, so one mode's freed heap cannot hide the
+    # other's: peak RSS over the run (memmap pages touched count too) and
+    # PSS at the end, both above the baseline after imports and warm-up
+    import time
+    from core import memstat
+
+    con = store.connect()
+    run = {"per-product copies": lambda: _run_copies(con, products),
+           "shared memmap": lambda: _run_memmap(con, products, dtype)}[mode]
+    _run_memmap(con, products[:1], dtype)       # warm imports
+    rss0, pss0 = memstat.memory_kb()
+    memstat.reset_peak()
+    t0 = time.perf_counter()
+    run()
+    elapsed = time.perf_counter() - t0
+    peak = memstat.peak_rss_kb()
+    _, pss = memstat.memory_kb()
+    results.put((elapsed, (peak - rss0) / 1024, (pss - pss0) / 1024))
+
+
+def _memory_report(products, dtype):
+    import multiprocessing as mp
+
+    ctx = mp.get_context("spawn")
+    for mode in ["per-product copies", "shared memmap"]:
+        results = ctx.Queue()
+        proc = ctx.Process(target=_measure_child, args=(mode, products, dtype, results))
+        proc.start()
+        elapsed, peak, pss = results.get()
+        proc.join()
+        print(f"{mode:<20} {elapsed:6.2f} s   peak RSS +{peak:7.1f} MiB   PSS after +{pss:7.1f} MiB")
+
+
+def _precision_report(con, products, repeat=5):
+    import time
+    import pandas as pd
+
+    timings, results = {}, {}
+    for dtype in PRECISIONS:
+        runs = []
+        for _ in range(repeat):
+            t0 = time.perf_counter()
+            results[dtype] = _run_memmap(con, products, dtype)
+            runs.append(time.perf_counter() - t0)
+        timings[dtype] = min(runs)
+
+    rows = []
+    for product in products:
+        y, *pred64 = results["float64"][product]
+        _, *pred32 = results["float32"][product]
+        for name, p64, p32 in zip(["Linear", "DecisionTree"], pred64, pred32):
+            mae64 = np.abs(y - p64).mean()
+            mae32 = np.abs(y - p32).mean()
+            rows.append([product, name, mae64, mae32, mae32 - mae64,
+                         np.abs(p64 - p32.astype(np.float64)).max()])
+
+    table = pd.DataFrame(rows, columns=["Product", "Model", "MAE float64", "MAE float32",
+                                        "MAE delta", "max |pred delta|"])
+    print(table.to_string(index=False, float_format=lambda v: f"{v:.6g}"))
+    print(f"\nfloat64 {timings['float64']:.2f} s, float32 {timings['float32']:.2f} s "
+          f"-> speedup x{timings['float64'] / timings['float32']:.2f}")
+
+
+def main(argv=None):
+    import argparse
+
+    parser = argparse.ArgumentParser(
+        description="Design matrix checks: peak memory of per-product copies vs the shared "
+                    "memmap, or accuracy/speed of float32 vs float64"
+    )
+    parser.add_argument("--products", nargs="*", help="product codes (default: all)")
+    parser.add_argument("--dtype", default=PRECISION.name, choices=PRECISIONS)
+    parser.add_argument("--precision", action="store_true",
+                        help="compare float32 against float64 instead of measuring memory")
+    args = parser.parse_args(argv)
+
+    con = store.connect()
+    products = args.products or [
+        p for (p,) in con.execute("SELECT DISTINCT Product_Code FROM enriched ORDER BY Product_Code")
+    ]
+    for dtype in PRECISIONS:
+        load_design(con, dtype)    # materialize outside the measurement
+
+    if args.precision:
+        _run_memmap(con, products[:1], args.dtype)    # warm imports as well
+        _precision_report(con, products)
+    else:
+        _memory_report(products, args.dtype)
+
+
+if __name__ == "__main__":
+    main()
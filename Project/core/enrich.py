@@ -0,0 +1,61 @@
+import numpy as np
+import pandas as pd
+
+# ====================================================
+# Feature engineering shared by the Dataset page and the store
+# ====================================================
+START_DATE = "2012-01-01"
+END_DATE = "2016-12-31"
+
+ENRICHED_COLUMNS = [
+    "Date", "Total_Order_Demand", "Order_Count",
+    "Season", "Holiday", "Black_Friday", "Promotion",
+]
+
+# month → season lookup (index 0 unused)
+SEASON_BY_MONTH = np.array([
+    "", "Winter", "Winter", "Spring", "Spring", "Spring",
+    "Summer", "Summer", "Summer", "Autumn", "Autumn", "Autumn", "Winter",
+], dtype=object)
+
+
+def get_season(month):
+    return SEASON_BY_MONTH[month]
+
+
+def get_black_friday(year):
+    november = pd.date_range(f"{year}-11-01", f"{year}-11-30")
+    thursdays = november[november.weekday == 3]
+    thanksgiving = thursdays[3]
+    return thanksgiving + pd.Timedelta(days=1)
+
+
+def enrich_daily(daily, start=START_DATE, end=END_DATE):
+    # daily: Date, Total_Order_Demand, Order_Count (one product, cleaned)
+    full_range = pd.date_range(start=start, end=end)
+
+    df = (
+        daily.assign(Date=pd.to_datetime(daily["Date"]))
+        .set_index("Date")[["Total_Order_Demand", "Order_Count"]]
+        .reindex(full_range)
+        .rename_axis("Date")
+        .reset_index()
+    )
+    df["Total_Order_Demand"] = df["Total_Order_Demand"].fillna(0)
+    df["Order_Count"] = df["Order_Count"].fillna(0)
+
+    dates = df["Date"].dt
+    df["Season"] = SEASON_BY_MONTH[dates.month.values]
+    df["Holiday"] = (
+        ((dates.month == 1) & (dates.day == 1)) |
+        ((dates.month == 12) & (dates.day == 25))
+    ).astype(int)
+
+    black_fridays = [get_black_friday(y) for y in range(full_range[0].year, full_range[-1].year + 1)]
+    df["Black_Friday"] = df["Date"].isin(black_fridays).astype(int)
+
+    demand = df["Total_Order_Demand"]
+    threshold = demand.mean() + 2 * demand.std()
+    df["Promotion"] = (demand >= threshold).astype(int)
+
+    return df[ENRICHED_COLUMNS]
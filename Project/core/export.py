@@ -0,0 +1,468 @@
+import argparse
+import hashlib
+import html as htmllib
+import json
+import os
+import re
+import shutil
+import textwrap
+import urllib.error
+import urllib.parse
+import urllib.request
+
+import dash
+
+# =========================================================
+# Static export of the dashboard
+# =========================================================
+# Renders every registered page — layouts evaluated once, callbacks run
+# with their initial input values, Plotly figures serialized — into plain
+# HTML files that any file server or CDN can serve without Python:
+#
+#   site/index.html, dataset.html, story.html, model.html, about.html
+#   site/assets/<name>.<content hash>.<ext>   (plotly.js shared by all pages)
+#
+# Links between pages and to assets are relative, so the bundle also works
+# from a sub-path or straight from disk. Interactive controls are shown in
+# their initial state (disabled).
+#
+# External stylesheets (the Bootstrap theme) are bundled like the local
+# CSS: downloaded once into data/vendor/, then copied into the hashed
+# assets, so the site needs no CDN and works offline. Later exports reuse
+# the downloaded copy.
+
+SITE_DIR = "site"
+ASSETS_DIR = "assets"
+VENDOR_DIR = os.path.join("data", "vendor")
+
+VOID_TAGS = {"br", "hr", "img", "input", "meta", "link", "col", "wbr"}
+SKIP_PROPS = {"children", "n_clicks", "n_clicks_timestamp", "key", "loading_state",
+              "disable_n_clicks", "setProps"}
+ATTR_NAMES = {"className": "class", "htmlFor": "for", "colSpan": "colspan", "rowSpan": "rowspan"}
+UNITLESS = {"opacity", "zIndex", "fontWeight", "lineHeight", "flex", "flexGrow",
+            "flexShrink", "order", "zoom"}
+
+# plots every figure embedded as JSON next to its container
+FIGURES_JS = """\
+document.querySelectorAll("script[data-figure]").forEach(function (s) {
+  var fig = JSON.parse(s.textContent);
+  Plotly.newPlot(s.dataset.figure, fig.data || [], fig.layout || {}, fig.config || {});
+});
+"""
+
+
+# =========================================================
+# ASSETS
+# =========================================================
+class AssetBundle:
+    # copies files under content-hashed names; url() maps a source name
+    # (as referenced by the app) to the hashed relative URL
+
+    def __init__(self, out_dir):
+        self.out_dir = os.path.join(out_dir, ASSETS_DIR)
+        self.urls = {}
+        os.makedirs(self.out_dir, exist_ok=True)
+
+    def add_bytes(self, name, data):
+        stem, ext = os.path.splitext(name)
+        if name.endswith(".min.js"):
+            stem, ext = name[:-len(".min.js")], ".min.js"
+        digest = hashlib.sha256(data).hexdigest()[:12]
+        hashed = f"{stem}.{digest}{ext}"
+        with open(os.path.join(self.out_dir, hashed), "wb") as f:
+            f.write(data)
+        self.urls[name] = f"{ASSETS_DIR}/{hashed}"
+        return self.urls[name]
+
+    def add_file(self, path):
+        with open(path, "rb") as f:
+            return self.add_bytes(os.path.basename(path), f.read())
+
+    def url(self, ref):
+        # "/assets/x.png", "assets/x.png" → hashed URL; anything else unchanged
+        m = re.match(r"^/?assets/(.+)$", ref)
+        return self.urls.get(m.group(1), ref) if m else ref
+
+
+def fetch_stylesheet(url, cache_dir=VENDOR_DIR):
+    # (file name, bytes) of an external stylesheet, from the vendor cache
+    # or downloaded into it
+    name = os.path.basename(urllib.parse.urlparse(url).path) or "stylesheet.css"
+    path = os.path.join(cache_dir, f"{hashlib.sha256(url.encode('utf-8')).hexdigest()[:12]}-{name}")
+    if not os.path.exists(path):
+        try:
+            with urllib.request.urlopen(url, timeout=30) as response:
+                data = response.read()
+        except (urllib.error.URLError, OSError) as exc:
+            raise RuntimeError(
+                f"cannot bundle {url}: download failed ({exc}); export once with network "
+                f"access or place the file at {path}"
+            ) from exc
+        os.makedirs(cache_dir, exist_ok=True)
+        with open(path + ".tmp", "wb") as f:
+            f.write(data)
+        os.replace(path + ".tmp", path)
+    with open(path, "rb") as f:
+        data = f.read()
+    # the source map is not bundled; drop the reference to it
+    return name, re.sub(rb"/\*# sourceMappingURL=.*?\*/", b"", data)
+
+
+# =========================================================
+# MARKDOWN (the subset the pages use)
+# =========================================================
+HEADING = re.compile(r"^(#{1,6})\s+(.*?)\s*#*\s*$")
+LIST_ITEM = re.compile(r"^(\s*)([-*+]|\d+\.)\s+(.*)$")
+
+
+def _inline(text):
+    text = htmllib.escape(text, quote=False)
+    text = re.sub(r"`([^`]+)`", r"<code>\1</code>", text)
+    text = re.sub(r"\*\*(.+?)\*\*", r"<strong>\1</strong>", text)
+    text = re.sub(r"(?<![\w*])\*(?!\s)(.+?)(?<!\s)\*(?![\w*])", r"<em>\1</em>", text)
+    text = re.sub(r"\[([^\]]+)\]\(([^)\s]+)\)", r'<a href="\2">\1</a>', text)
+    return text
+
+
+def _paragraph(lines):
+    # two trailing spaces = hard line break
+    parts = [_inline(line.strip()) + ("<br>" if line.endswith("  ") else "") for line in lines]
+    return "<p>" + "\n".join(parts).removesuffix("<br>") + "</p>"
+
+
+def _indent(line):
+    return len(line) - len(line.lstrip())
+
+
+def _list(lines, i):
+    m = LIST_ITEM.match(lines[i])
+    indent, ordered = len(m.group(1)), m.group(2)[0].isdigit()
+    items = []
+    while i < len(lines):
+        line = lines[i]
+        m = LIST_ITEM.match(line)
+        if m and len(m.group(1)) == indent:
+            items.append([m.group(3)])
+        elif line.strip() and _indent(line) > indent and items:
+            items[-1].append(line)
+        elif not line.strip():
+            nxt = next((l for l in lines[i + 1:] if l.strip()), "")
+            if not (LIST_ITEM.match(nxt) and _indent(nxt) >= indent):
+                break
+        else:
+            break
+        i += 1
+
+    tag = "ol" if ordered else "ul"
+    body = []
+    for first, *rest in items:
+        inner = _blocks([first] + textwrap.dedent("\n".join(rest)).split("\n"))
+        if inner.startswith("<p>"):
+            # tight list: no paragraph around the item text
+            end = inner.index("</p>")
+            inner = inner[3:end] + inner[end + 4:]
+        body.append(f"<li>{inner}</li>")
+    return f"<{tag}>" + "".join(body) + f"</{tag}>", i
+
+
+def _blocks(lines):
+    out = []
+    i = 0
+    while i < len(lines):
+        line = lines[i]
+        if not line.strip():
+            i += 1
+        elif HEADING.match(line):
+            m = HEADING.match(line)
+            n = len(m.group(1))
+            out.append(f"<h{n}>{_inline(m.group(2))}</h{n}>")
+            i += 1
+        elif line.lstrip().startswith(">"):
+            quoted = []
+            while i < len(lines) and lines[i].lstrip().startswith(">"):
+                quoted.append(re.sub(r"^\s*> ?", "", lines[i]))
+                i += 1
+            out.append("<blockquote>" + _blocks(quoted) + "</blockquote>")
+        elif LIST_ITEM.match(line):
+            block, i = _list(lines, i)
+            out.append(block)
+        else:
+            para = []
+            while (i < len(lines) and lines[i].strip() and not HEADING.match(lines[i])
+                   and not LIST_ITEM.match(lines[i]) and not lines[i].lstrip().startswith(">")):
+                para.append(lines[i])
+                i += 1
+            out.append(_paragraph(para))
+    return "\n".join(out)
+
+
+def markdown_to_html(text):
+    return _blocks(textwrap.dedent(text).split("\n"))
+
+
+# =========================================================
+# COMPONENT RENDERING
+# =========================================================
+def _css(style):
+    rules = []
+    for key, value in style.items():
+        prop = re.sub(r"([A-Z])", lambda m: "-" + m.group(1).lower(), key)
+        if isinstance(value, (int, float)) and not isinstance(value, bool) and key not in UNITLESS:
+            value = f"{value}px"
+        rules.append(f"{prop}: {value}")
+    return "; ".join(rules)
+
+
+def _attrs(props):
+    out = []
+    for name, value in props.items():
+        if value is None or value is False:
+            continue
+        name = ATTR_NAMES.get(name, name)
+        if name == "style":
+            value = _css(value)
+        if value is True:
+            out.append(f" {name}")
+        else:
+            out.append(f' {name}="{htmllib.escape(str(value))}"')
+    return "".join(out)
+
+
+class Renderer:
+
+    def __init__(self, assets, page_urls, page_layout):
+        self.assets = assets
+        self.page_urls = page_urls
+        self.page_layout = page_layout
+        self.n_graphs = 0
+
+    def href(self, ref):
+        return self.page_urls.get(ref, self.assets.url(ref))
+
+    def props(self, component):
+        props = {
+            name: getattr(component, name)
+            for name in component._prop_names
+            if name not in SKIP_PROPS and getattr(component, name, None) is not None
+        }
+        for name in ("href", "src"):
+            if name in props:
+                props[name] = self.href(props[name])
+        return props
+
+    def render(self, c):
+        if c is None:
+            return ""
+        if isinstance(c, (list, tuple)):
+            return "".join(self.render(x) for x in c)
+        if not hasattr(c, "_namespace"):
+            # strings, numbers, dates in table cells
+            return htmllib.escape(str(c), quote=False)
+        if c is dash.page_container:
+            return self.render(self.page_layout)
+
+        kind = f"{c._namespace}.{c._type}"
+        handler = getattr(self, "render_" + kind.replace(".", "_").replace("-", "_"), None)
+        if handler is not None:
+            return handler(c)
+        if c._namespace == "dash_html_components":
+            return self.render_html(c)
+        # unknown component: keep its children
+        return self.render(getattr(c, "children", None))
+
+    def render_html(self, c):
+        tag = c._type.lower()
+        props = self.props(c)
+        if tag in VOID_TAGS:
+            return f"<{tag}{_attrs(props)}>"
+        return f"<{tag}{_attrs(props)}>{self.render(getattr(c, 'children', None))}</{tag}>"
+
+    def _wrap(self, c, inner, extra_class=""):
+        props = {k: v for k, v in self.props(c).items() if k in ("id", "className", "style")}
+        if extra_class:
+            props["className"] = (extra_class + " " + props.get("className", "")).strip()
+        return f"<div{_attrs(props)}>{inner}</div>"
+
+    def render_dash_core_components_Markdown(self, c):
+        text = c.children if isinstance(c.children, str) else "\n".join(c.children or [])
+        return self._wrap(c, markdown_to_html(text))
+
+    def render_dash_core_components_Graph(self, c):
+        import plotly.io as pio
+
+        self.n_graphs += 1
+        graph_id = c.id if isinstance(getattr(c, "id", None), str) else f"graph-{self.n_graphs}"
+        figure = c.figure if getattr(c, "figure", None) is not None else {}
+        fig = json.loads(pio.to_json(figure, validate=False))
+        fig["config"] = {"responsive": True, **(getattr(c, "config", None) or {})}
+        payload = json.dumps(fig, separators=(",", ":")).replace("</", "<\\/")
+
+        style = {"height": 450, **(getattr(c, "style", None) or {})}
+        props = {"id": graph_id, "className": getattr(c, "className", None), "style": style}
+        return (f"<div{_attrs(props)}></div>"
+                f'<script type="application/json" data-figure="{graph_id}">{payload}</script>')
+
+    def _options(self, c):
+        options = getattr(c, "options", None) or []
+        if isinstance(options, dict):
+            options = [{"label": v, "value": k} for k, v in options.items()]
+        return [o if isinstance(o, dict) else {"label": o, "value": o} for o in options]
+
+    def render_dash_core_components_Checklist(self, c):
+        selected = set(getattr(c, "value", None) or [])
+        boxes = "".join(
+            f'<label style="margin-right: 12px"><input type="checkbox" disabled'
+            f'{" checked" if o["value"] in selected else ""}> {self.render(o["label"])}</label>'
+            for o in self._options(c)
+        )
+        return self._wrap(c, boxes)
+
+    def render_dash_core_components_Dropdown(self, c):
+        value = getattr(c, "value", None)
+        selected = set(value if isinstance(value, list) else [value])
+        options = "".join(
+            f'<option{" selected" if o["value"] in selected else ""}>{self.render(o["label"])}</option>'
+            for o in self._options(c)
+        )
+        multiple = " multiple" if getattr(c, "multi", False) else ""
+        return self._wrap(c, f'<select class="form-select" disabled{multiple}>{options}</select>')
+
+    # navbar of app.py
+    def render_dash_bootstrap_components_NavbarSimple(self, c):
+        style = _css({"backgroundColor": c.color}) if c.color else ""
+        theme = "navbar-dark" if c.dark else "navbar-light"
+        return (
+            f'<nav class="navbar navbar-expand-md {theme} {c.class_name or ""}" style="{style}">'
+            f'<div class="container"><a class="navbar-brand" href="{self.href(c.brand_href or "/")}">'
+            f'{self.render(c.brand)}</a><ul class="navbar-nav ms-auto">{self.render(c.children)}</ul>'
+            f"</div></nav>"
+        )
+
+    def render_dash_bootstrap_components_NavItem(self, c):
+        return f'<li class="nav-item">{self.render(c.children)}</li>'
+
+    def render_dash_bootstrap_components_NavLink(self, c):
+        return f'<a class="nav-link" href="{self.href(c.href)}">{self.render(c.children)}</a>'
+
+
+# =========================================================
+# LAYOUT EVALUATION
+# =========================================================
+def _walk(component):
+    if isinstance(component, (list, tuple)):
+        for c in component:
+            yield from _walk(c)
+        return
+    if not hasattr(component, "_prop_names"):
+        return
+    yield component
+    yield from _walk(getattr(component, "children", None))
+
+
+def run_initial_callbacks(layout):
+    # fill callback outputs the way the browser's first render would
+    from dash._callback import GLOBAL_CALLBACK_MAP
+
+    by_id = {c.id: c for c in _walk(layout) if isinstance(getattr(c, "id", None), str)}
+    for spec in GLOBAL_CALLBACK_MAP.values():
+        if "callback" not in spec:           # clientside: runs in the browser only
+            continue
+        single = not isinstance(spec["output"], list)
+        outputs = [spec["output"]] if single else spec["output"]
+        ids = [i["id"] for i in spec["inputs"] + spec["state"]] + [o.component_id for o in outputs]
+        if not all(i in by_id for i in ids):
+            continue
+        args = [getattr(by_id[i["id"]], i["property"], None) for i in spec["inputs"] + spec["state"]]
+        result = spec["callback"].__wrapped__(*args)
+        if single:
+            result = [result]
+        for output, value in zip(outputs, result):
+            setattr(by_id[output.component_id], output.component_property, value)
+
+
+def page_filename(path):
+    return "index.html" if path == "/" else path.strip("/").replace("/", "-") + ".html"
+
+
+def _page_html(title, stylesheets, body, scripts):
+    links = "".join(f'<link rel="stylesheet" href="{htmllib.escape(s)}">' for s in stylesheets)
+    tags = "".join(f'<script src="{s}"></script>' for s in scripts)
+    return (
+        "<!DOCTYPE html>\n<html>\n<head>\n"
+        '<meta charset="utf-8">\n'
+        '<meta name="viewport" content="width=device-width, initial-scale=1">\n'
+        f"<title>{htmllib.escape(title)}</title>\n{links}\n</head>\n"
+        f"<body>\n{body}\n{tags}\n</body>\n</html>\n"
+    )
+
+
+def export_site(app, out_dir=SITE_DIR, assets_folder="assets", paths=None, vendor_dir=VENDOR_DIR):
+    # paths: page paths to export (default: every registered page)
+    import plotly.offline
+
+    tmp_dir = out_dir + ".tmp"
+    shutil.rmtree(tmp_dir, ignore_errors=True)
+    assets = AssetBundle(tmp_dir)
+
+    # shared scripts and the app's own assets (background.html is inlined)
+    plotly_js = assets.add_bytes("plotly.min.js", plotly.offline.get_plotlyjs().encode("utf-8"))
+    figures_js = assets.add_bytes("figures.js", FIGURES_JS.encode("utf-8"))
+    background = ""
+    for name in sorted(os.listdir(assets_folder)):
+        path = os.path.join(assets_folder, name)
+        if name == "background.html":
+            with open(path, encoding="utf-8") as f:
+                background = f.read()
+        elif os.path.isfile(path):
+            assets.add_file(path)
+
+    local_css = [assets.urls[n] for n in sorted(assets.urls) if n.endswith(".css")]
+    stylesheets = [
+        assets.add_bytes(*fetch_stylesheet(s if isinstance(s, str) else s["href"], vendor_dir))
+        for s in app.config.external_stylesheets
+    ] + local_css
+
+    pages = list(dash.page_registry.values())
+    page_urls = {p["path"]: page_filename(p["path"]) for p in pages}
+    if paths is not None:
+        pages = [p for p in pages if p["path"] in paths]
+    written = []
+    for page in pages:
+        layout = page["layout"]() if callable(page["layout"]) else page["layout"]
+        run_initial_callbacks(layout)
+
+        # app shell (navbar, page container) with this page's layout inside
+        renderer = Renderer(assets, page_urls, layout)
+        body = renderer.render(app.layout) + background
+        scripts = [plotly_js, figures_js] if renderer.n_graphs else []
+
+        title = page.get("title") or app.title
+        html_text = _page_html(title, stylesheets, body, scripts)
+        with open(os.path.join(tmp_dir, page_filename(page["path"])), "w", encoding="utf-8") as f:
+            f.write(html_text)
+        written.append((page_filename(page["path"]), renderer.n_graphs, len(html_text)))
+
+    shutil.rmtree(out_dir, ignore_errors=True)
+    os.replace(tmp_dir, out_dir)
+    return written
+
+
+# =========================================================
+# CLI
+# =========================================================
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Export every dashboard page as static HTML")
+    parser.add_argument("--out", default=SITE_DIR, help="output folder (replaced)")
+    parser.add_argument("--pages", nargs="*", help="page paths, e.g. / /about (default: all)")
+    args = parser.parse_args(argv)
+
+    from app import app    # registers every page
+
+    for name, n_graphs, size in export_site(app, args.out, paths=args.pages):
+        print(f"{name:<16} {n_graphs:3d} figures  {size / 1024:8.1f} KiB")
+    print(f"\nwrote {args.out}/ — serve it with any static file server, e.g. "
+          f"python -m http.server -d {args.out}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,92 @@
+import numpy as np
+import pandas as pd
+from numpy.lib.stride_tricks import sliding_window_view
+
+# =========================================================
+# Lag / rolling-window / inter-arrival features
+# =========================================================
+# Computed over the long multi-product table (sorted by product, then date,
+# one row per day) with shifted slices, cumsums and strided window views —
+# no per-product Python loop, linear in the number of rows.
+#
+# Leakage: every feature for day t uses demand up to day t-1 only, so in the
+# rolling blocks of the Model page a test day never sees its own demand
+# (one-step-ahead, with earlier test days known as they happen).
+
+TARGET = "Total_Order_Demand"
+LAGS = (1, 7, 14, 28)
+WINDOWS = (7, 28)
+
+
+def _positions(groups):
+    # position of each row inside its group (0 = first day of the product)
+    n = len(groups)
+    if n == 0:
+        return np.zeros(0, dtype=np.int64)
+    new_group = np.ones(n, dtype=bool)
+    new_group[1:] = groups[1:] != groups[:-1]
+    starts = np.flatnonzero(new_group)
+    return np.arange(n) - np.repeat(starts, np.diff(np.append(starts, n)))
+
+
+def _shift(values, k):
+    out = np.zeros_like(values)
+    out[k:] = values[:-k]
+    return out
+
+
+def _rolling_sum(values, pos, w):
+    # sum of values[t-w .. t-1] inside the group
+    c = np.concatenate([[0.0], np.cumsum(values, dtype=float)])
+    t = np.arange(len(values))
+    start = t - np.minimum(pos, w)
+    return c[t] - c[start]
+
+
+def _rolling_max(values, pos, w):
+    # max of values[t-w .. t-1] inside the group; strided view, no copy
+    prev = np.concatenate([np.full(w, -np.inf), values])
+    win = sliding_window_view(prev, w)[:len(values)]   # row t → values[t-w .. t-1]
+    out = win.max(axis=1)
+
+    # rows near a group start would see the previous product → recompute
+    head = np.flatnonzero(pos < w)
+    if len(head):
+        valid = np.arange(w)[None, :] >= (w - pos[head])[:, None]
+        out[head] = np.where(valid, win[head], -np.inf).max(axis=1)
+
+    return np.where(np.isfinite(out), out, 0.0)
+
+
+def _days_since_last(values, pos):
+    # days since the last nonzero day strictly before t (series start if none)
+    t = np.arange(len(values))
+    last = np.where(values > 0, t, -1)
+    last = np.maximum.accumulate(last)
+    last_before = np.concatenate([[-1], last[:-1]])
+    group_start = t - pos
+    return np.where(last_before >= group_start, t - last_before, pos + 1).astype(float)
+
+
+def lag_features(df, target=TARGET, group="Product_Code", lags=LAGS, windows=WINDOWS):
+    # df sorted by (group, Date); single-product frames may omit the group column
+    y = df[target].to_numpy(dtype=float)
+    groups = df[group].to_numpy() if group in df else np.zeros(len(df), dtype=np.int8)
+    pos = _positions(groups)
+
+    out = {}
+    for k in lags:
+        out[f"lag_{k}"] = np.where(pos >= k, _shift(y, k), 0.0)
+
+    nonzero = (y > 0).astype(float)
+    for w in windows:
+        count = np.maximum(np.minimum(pos, w), 1)
+        total = _rolling_sum(y, pos, w)
+        out[f"roll_sum_{w}"] = total
+        out[f"roll_mean_{w}"] = total / count
+        out[f"roll_max_{w}"] = _rolling_max(y, pos, w)
+        out[f"orders_{w}"] = _rolling_sum(nonzero, pos, w)
+
+    out["days_since_order"] = _days_since_last(y, pos)
+
+    return pd.DataFrame(out, index=df.index)
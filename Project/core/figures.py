@@ -0,0 +1,132 @@
+import base64
+import json
+import os
+import time
+
+import numpy as np
+import pandas as pd
+
+# =========================================================
+# Compact figure encoding
+# =========================================================
+# Figures reach the browser as JSON: every number spelled out as text, and
+# index x arrays (0, 1, 2, …) repeated in every trace. The compact encoding
+# rewrites a figure's data arrays before it is sent:
+#
+#   typed arrays : numeric x / y → {"dtype", "bdata"}, the base64 of the raw
+#                  little-endian bytes, which plotly.js (≥ 2.28) decodes
+#                  straight into a typed array. Whole numbers use the
+#                  narrowest integer type that holds them, other values
+#                  float32 (7 significant digits, plenty for a plot)
+#   implicit x   : an evenly spaced numeric x becomes x0 / dx
+#
+# Layout, dates and text are left as they are. FIGURE_ENCODING=json turns
+# the encoding off. Dash serializes responses with orjson when it is
+# installed (plotly.io "auto" engine); payload_report times both engines.
+
+FIGURE_ENCODINGS = ("compact", "json")
+FIGURE_ENCODING = os.environ.get("FIGURE_ENCODING", "compact")
+FLOAT_DTYPE = "f4"
+ARRAY_KEYS = ("x", "y")
+IMPLICIT_X_TYPES = ("scatter", "scattergl", "bar")
+
+_INT_DTYPES = [("i1", np.int8), ("i2", np.int16), ("i4", np.int32)]
+
+
+def typed_array(values, float_dtype=FLOAT_DTYPE):
+    # plotly.js typed-array spec of a numeric array, or None if not numeric
+    arr = np.asarray(values)
+    if arr.dtype.kind not in "biuf" or arr.ndim != 1 or arr.size == 0:
+        return None
+    if arr.dtype.kind == "b":
+        arr = arr.astype(np.int8)
+    dtype = float_dtype
+    if np.all(np.isfinite(arr)) and np.all(arr == np.round(arr)):
+        for code, int_type in _INT_DTYPES:
+            info = np.iinfo(int_type)
+            if arr.min() >= info.min and arr.max() <= info.max:
+                dtype = code
+                break
+    raw = arr.astype(np.dtype(dtype).newbyteorder("<")).tobytes()
+    return {"dtype": dtype, "bdata": base64.b64encode(raw).decode("ascii")}
+
+
+def _even_step(values):
+    # dx of an evenly spaced numeric array, else None
+    arr = np.asarray(values)
+    if arr.dtype.kind not in "iuf" or arr.ndim != 1 or arr.size < 2:
+        return None
+    step = np.diff(arr)
+    return float(step[0]) if np.all(step == step[0]) else None
+
+
+def compact_trace(trace, float_dtype=FLOAT_DTYPE):
+    trace = dict(trace)
+    if trace.get("type", "scatter") in IMPLICIT_X_TYPES and trace.get("x") is not None:
+        dx = _even_step(trace["x"])
+        if dx is not None:
+            x = np.asarray(trace.pop("x"))
+            trace["x0"], trace["dx"] = x[0].item(), dx
+    for key in ARRAY_KEYS:
+        if trace.get(key) is not None:
+            spec = typed_array(trace[key], float_dtype)
+            if spec is not None:
+                trace[key] = spec
+    return trace
+
+
+def compact_figure(fig, float_dtype=FLOAT_DTYPE):
+    # plotly Figure or figure dict → figure dict with compact data arrays
+    fig = fig.to_plotly_json() if hasattr(fig, "to_plotly_json") else fig
+    return {
+        **fig,
+        "data": [compact_trace(t, float_dtype) for t in fig.get("data", [])],
+    }
+
+
+def encode_figure(fig, encoding=FIGURE_ENCODING):
+    if encoding not in FIGURE_ENCODINGS:
+        raise ValueError(f"unknown figure encoding {encoding!r}, expected one of {FIGURE_ENCODINGS}")
+    return compact_figure(fig) if encoding == "compact" else fig
+
+
+# =========================================================
+# PAYLOAD MEASUREMENT
+# =========================================================
+def _timed(func, repeat):
+    best = float("inf")
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        out = func()
+        best = min(best, time.perf_counter() - t0)
+    return out, best
+
+
+def payload_report(figures, repeat=5):
+    # bytes and server encode time of the figures sent as they are vs
+    # compact, with the json and orjson engines, and decode time of each
+    # payload (Python json.loads; the browser's parse is timed on the page)
+    from plotly.io.json import to_json_plotly
+
+    engines = ["json"]
+    try:
+        import orjson  # noqa: F401
+        engines.append("orjson")
+    except ImportError:
+        pass
+
+    # compact figures are built once with the page; what each request pays
+    # is serializing them
+    variants = {"JSON lists": figures, "Compact": [compact_figure(f) for f in figures]}
+    rows, payloads = [], {}
+    for name, figs in variants.items():
+        for engine in engines:
+            text, seconds = _timed(
+                lambda: "[" + ",".join(to_json_plotly(f, engine=engine) for f in figs) + "]",
+                repeat,
+            )
+            _, decode = _timed(lambda: json.loads(text), repeat)
+            rows.append([name, engine, len(text.encode("utf-8")) / 1024, 1000 * seconds, 1000 * decode])
+            payloads[name] = text
+    report = pd.DataFrame(rows, columns=["Encoding", "Engine", "KiB", "Encode_ms", "Decode_ms"])
+    return report, payloads
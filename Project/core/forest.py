@@ -0,0 +1,52 @@
+import warnings
+
+import numpy as np
+
+# =========================================================
+# Random forest grown with warm start
+# =========================================================
+# Trees are added STEP at a time (warm_start keeps the ones already fitted)
+# until the out-of-bag R² stops improving by TOL or MAX_ESTIMATORS is
+# reached, so each block gets as many trees as it needs instead of a fixed
+# 100. Subsampling (max_samples) keeps every tree cheap and leaves OOB rows
+# to score on; n_jobs spreads tree fitting over cores.
+
+STEP = 25
+MAX_ESTIMATORS = 300
+TOL = 1e-3
+
+
+class GrowingForest:
+
+    def __init__(self, step=STEP, max_estimators=MAX_ESTIMATORS, tol=TOL, **params):
+        self.step = step
+        self.max_estimators = max_estimators
+        self.tol = tol
+        self.params = params
+
+    def fit(self, X, y):
+        from sklearn.ensemble import RandomForestRegressor
+
+        forest = RandomForestRegressor(
+            n_estimators=self.step, warm_start=True, bootstrap=True, oob_score=True,
+            **self.params,
+        )
+        best = -np.inf
+        with warnings.catch_warnings():
+            # very small first steps can leave a few rows without OOB votes
+            warnings.simplefilter("ignore", UserWarning)
+            while True:
+                forest.fit(X, np.ravel(y))
+                gain = forest.oob_score_ - best
+                best = max(best, forest.oob_score_)
+                if gain < self.tol or forest.n_estimators >= self.max_estimators:
+                    break
+                forest.n_estimators += self.step
+
+        self.forest_ = forest
+        self.estimators_ = forest.estimators_
+        self.oob_score_ = forest.oob_score_
+        return self
+
+    def predict(self, X):
+        return self.forest_.predict(X)
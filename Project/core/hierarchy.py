@@ -0,0 +1,205 @@
+import numpy as np
+import pandas as pd
+import scipy.sparse as sp
+from scipy.sparse.linalg import spsolve
+
+from core.enrich import START_DATE, END_DATE, SEASON_BY_MONTH, get_black_friday
+from core.features import lag_features
+
+# =========================================================
+# Hierarchical forecasting: warehouse → category → product
+# =========================================================
+# Bottom series are (warehouse, category, product) daily demand. A sparse
+# summing matrix S maps them to every node of the hierarchy, base
+# forecasts for all nodes come from one batched normal-equation solve
+# (shared calendar design + each node's own rolling means), and
+# reconciliation makes them coherent (aggregates = sum of children) with
+# sparse linear algebra:
+#
+#   bottom-up : ỹ = S ŷ_bottom
+#   OLS       : ỹ = S (SᵀS)⁻¹ Sᵀ ŷ
+#   WLS (var) : ỹ = S (SᵀW⁻¹S)⁻¹ SᵀW⁻¹ ŷ, W = diag(base residual variance)
+#               — the diagonal approximation of MinT, not MinT itself
+#
+# A level whose nodes only repeat the level above (e.g. one warehouse under
+# Total) is left out of S. reconciled_forecast() gives planners the
+# coherent forecast of every node for the next days; hierarchical_backtest()
+# scores the methods on the rolling blocks.
+
+LEVELS = ["Total", "Warehouse", "Category", "Product"]
+METHODS = ["base", "bottom_up", "ols", "wls_var"]
+NODE_FEATURES = ["roll_mean_7", "roll_mean_28"]
+HORIZON = 28
+
+
+def bottom_series(con, start=START_DATE, end=END_DATE):
+    df = pd.read_sql_query(
+        """
+        SELECT Warehouse, Product_Category, Product_Code, Date,
+               SUM(Order_Demand) AS Demand
+        FROM raw_orders
+        GROUP BY Warehouse, Product_Category, Product_Code, Date
+        HAVING SUM(Order_Demand) >= 0
+        """,
+        con,
+    )
+    df["Date"] = pd.to_datetime(df["Date"])
+    Y = (
+        df.pivot_table(
+            index="Date",
+            columns=["Warehouse", "Product_Category", "Product_Code"],
+            values="Demand",
+            aggfunc="sum",
+        )
+        .reindex(pd.date_range(start, end))
+        .fillna(0.0)
+    )
+    keys = Y.columns.to_frame(index=False)
+    return Y.index, keys, Y.to_numpy(dtype=float)
+
+
+def summing_matrix(keys):
+    m = len(keys)
+    blocks = [sp.csr_matrix(np.ones((1, m)))]
+    labels = [("Total", "Total")]
+
+    for level, cols in [("Warehouse", ["Warehouse"]),
+                        ("Category", ["Warehouse", "Product_Category"])]:
+        codes, uniques = pd.factorize(pd.MultiIndex.from_frame(keys[cols]))
+        if len(uniques) == blocks[-1].shape[0]:
+            continue                     # one child per node: same series again
+        blocks.append(sp.csr_matrix(
+            (np.ones(m), (codes, np.arange(m))), shape=(len(uniques), m)
+        ))
+        labels += [(level, " / ".join(np.atleast_1d(u))) for u in uniques]
+
+    blocks.append(sp.identity(m, format="csr"))
+    labels += [("Product", " / ".join(k)) for k in keys.itertuples(index=False)]
+
+    return sp.vstack(blocks).tocsr(), pd.DataFrame(labels, columns=["Level", "Node"])
+
+
+def calendar_design(dates):
+    # shared exogenous design for every node: bias, season, holiday,
+    # Black Friday and weekday dummies
+    month = dates.month.values
+    season = SEASON_BY_MONTH[month]
+    black_fridays = [get_black_friday(y) for y in range(dates[0].year, dates[-1].year + 1)]
+
+    cols = [np.ones(len(dates))]
+    cols += [(season == s).astype(float) for s in ["Spring", "Summer", "Winter"]]
+    cols.append((((month == 1) & (dates.day == 1)) | ((month == 12) & (dates.day == 25))).astype(float))
+    cols.append(dates.isin(black_fridays).astype(float))
+    cols += [(dates.weekday == d).astype(float) for d in range(1, 7)]
+    return np.column_stack(cols)
+
+
+def node_designs(X_cal, Y_all):
+    # (nodes × days × features): calendar columns + node's own rolling means
+    days, n_nodes = Y_all.shape
+    long = pd.DataFrame({
+        "Node": np.repeat(np.arange(n_nodes), days),
+        "Demand": Y_all.T.ravel(),
+    })
+    own = lag_features(long, target="Demand", group="Node", lags=())[NODE_FEATURES]
+    own = own.to_numpy().reshape(n_nodes, days, len(NODE_FEATURES))
+    shared = np.broadcast_to(X_cal, (n_nodes,) + X_cal.shape)
+    return np.concatenate([shared, own], axis=2)
+
+
+def fit_base(X_train, Y_train):
+    # X_train: (nodes × days × k), Y_train: (days × nodes); batched solve
+    Xt = np.swapaxes(X_train, 1, 2)
+    beta = np.linalg.pinv(Xt @ X_train) @ (Xt @ Y_train.T[..., None])
+    resid = Y_train.T - (X_train @ beta)[..., 0]
+    return beta, resid.var(axis=1)
+
+
+def predict_base(X_test, beta):
+    return (X_test @ beta)[..., 0].T
+
+
+def reconcile(S, Y_hat, method, resid_var=None):
+    # Y_hat: (horizon × nodes) base forecasts → coherent (horizon × nodes)
+    n_nodes, m = S.shape
+    if method == "base":
+        return Y_hat
+    if method == "bottom_up":
+        return (S @ Y_hat[:, n_nodes - m:].T).T
+
+    if method == "ols":
+        St_Winv = S.T.tocsr()
+    elif method == "wls_var":
+        St_Winv = (S.T @ sp.diags(1.0 / np.maximum(resid_var, 1e-8))).tocsr()
+    else:
+        raise ValueError(f"unknown reconciliation method: {method}")
+
+    A = (St_Winv @ S).tocsc()
+    bottom = spsolve(A, St_Winv @ Y_hat.T)
+    return (S @ bottom.reshape(m, -1)).T
+
+
+def _hierarchy(con):
+    dates, keys, Y_bottom = bottom_series(con)
+    S, nodes = summing_matrix(keys)
+    return dates, S, nodes, (S @ Y_bottom.T).T          # Y_all: (days × nodes)
+
+
+def levels(nodes):
+    return [level for level in LEVELS if (nodes["Level"] == level).any()]
+
+
+def hierarchical_backtest(con, splits):
+    dates, S, nodes, Y_all = _hierarchy(con)
+    X = node_designs(calendar_design(dates), Y_all)
+
+    errors = {method: [] for method in METHODS}
+    for train, test in splits:
+        beta, resid_var = fit_base(X[:, train], Y_all[train])
+        Y_hat = predict_base(X[:, test], beta)
+        for method in METHODS:
+            Y_rec = reconcile(S, Y_hat, method, resid_var)
+            errors[method].append(np.abs(Y_all[test] - Y_rec).mean(axis=0))
+
+    rows = []
+    for method in METHODS:
+        mae = np.mean(errors[method], axis=0)
+        for level in levels(nodes):
+            mask = (nodes["Level"] == level).values
+            rows.append([level, method, mae[mask].mean()])
+
+    table = pd.DataFrame(rows, columns=["Level", "Method", "MAE"])
+    return table.pivot(index="Level", columns="Method", values="MAE").loc[levels(nodes), METHODS].reset_index()
+
+
+def reconciled_forecast(con, horizon=HORIZON, method="wls_var"):
+    # base models fitted on the full history, run forward day by day (each
+    # node's rolling means read its own earlier forecasts), then reconciled
+    # over the horizon. Demand cannot be negative: reconciled product
+    # forecasts are floored at 0 and summed up again through S, so the
+    # result stays coherent. One row per (day, node): base and forecast
+    dates, S, nodes, Y_all = _hierarchy(con)
+    X = node_designs(calendar_design(dates), Y_all)
+    beta, resid_var = fit_base(X, Y_all)
+
+    future = pd.date_range(dates[-1] + pd.Timedelta(days=1), periods=horizon)
+    X_cal = calendar_design(future)
+    windows = [int(f.rsplit("_", 1)[1]) for f in NODE_FEATURES]
+    history = Y_all
+    Y_hat = np.empty((horizon, len(nodes)))
+    for h in range(horizon):
+        own = np.column_stack([history[-w:].mean(axis=0) for w in windows])
+        x = np.concatenate([np.broadcast_to(X_cal[h], (len(nodes), X_cal.shape[1])), own], axis=1)
+        Y_hat[h] = (x[:, None, :] @ beta)[:, 0, 0]
+        history = np.vstack([history, np.maximum(Y_hat[h], 0.0)])
+
+    n_nodes, m = S.shape
+    bottom = np.maximum(reconcile(S, Y_hat, method, resid_var)[:, n_nodes - m:], 0.0)
+    Y_rec = (S @ bottom.T).T
+    return pd.DataFrame({
+        "Date": np.repeat(future, len(nodes)),
+        "Level": np.tile(nodes["Level"].to_numpy(), horizon),
+        "Node": np.tile(nodes["Node"].to_numpy(), horizon),
+        "Base": Y_hat.ravel(),
+        "Forecast": Y_rec.ravel(),
+    })
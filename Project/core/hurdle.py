@@ -0,0 +1,85 @@
+import numpy as np
+
+# =========================================================
+# Two-part hurdle model for zero-inflated demand
+# =========================================================
+#   P(demand > 0)        : logistic regression, fitted by IRLS
+#   E[demand | demand > 0]: linear regression on nonzero days (normal equation)
+#   prediction           : P(demand > 0) · E[demand | demand > 0]
+#
+# Every fit works on a leading batch axis, so (products × days × features)
+# stacks are fitted in one pass — no per-product Python loop.
+
+IRLS_MAX_ITER = 25
+IRLS_TOL = 1e-6
+RIDGE = 1e-4   # keeps IRLS finite under perfect separation (e.g. Promotion)
+
+
+def _sigmoid(z):
+    return 1.0 / (1.0 + np.exp(-np.clip(z, -30, 30)))
+
+
+def _ridge(k, dtype):
+    eye = RIDGE * np.eye(k, dtype=dtype)
+    eye[0, 0] = 0.0   # bias column is not penalized
+    return eye
+
+
+def fit_logistic_irls(X, y, max_iter=IRLS_MAX_ITER, tol=IRLS_TOL):
+    # X: (..., n, k) with bias column, y: (..., n) in {0, 1}
+    beta = np.zeros(X.shape[:-2] + X.shape[-1:])
+    ridge = _ridge(X.shape[-1], X.dtype)
+    Xt = np.swapaxes(X, -1, -2)
+
+    for _ in range(max_iter):
+        p = _sigmoid((X @ beta[..., None])[..., 0])
+        w = p * (1 - p)
+
+        XtWX = Xt @ (X * w[..., None]) + ridge
+        grad = (Xt @ (y - p)[..., None])[..., 0] - beta @ ridge
+
+        step = np.linalg.solve(XtWX, grad[..., None])[..., 0]
+        beta = beta + step
+        if np.max(np.abs(step)) < tol:
+            break
+
+    return beta
+
+
+def fit_weighted_ols(X, y, w):
+    # closed-form (XᵀWX)⁺ XᵀWy on the batch axis; w = 0/1 row mask
+    Xt_w = np.swapaxes(X * w[..., None], -1, -2)
+    XtWX = Xt_w @ X
+    XtWy = Xt_w @ y[..., None]
+    return (np.linalg.pinv(XtWX) @ XtWy)[..., 0]
+
+
+def fit_hurdle_batch(X, y):
+    nonzero = (y > 0).astype(X.dtype)
+    beta_occ = fit_logistic_irls(X, nonzero)
+    beta_size = fit_weighted_ols(X, y, nonzero)
+    return beta_occ, beta_size
+
+
+def predict_hurdle_batch(X, beta_occ, beta_size):
+    p = _sigmoid((X @ beta_occ[..., None])[..., 0])
+    size = np.maximum((X @ beta_size[..., None])[..., 0], 0.0)
+    return p * size
+
+
+def _with_bias(X):
+    X = np.asarray(X, dtype=float)
+    return np.concatenate([np.ones(X.shape[:-1] + (1,)), X], axis=-1)
+
+
+class HurdleRegressor:
+    # sklearn-style wrapper so it plugs into evaluate_model()
+
+    def fit(self, X, y):
+        self.beta_occ_, self.beta_size_ = fit_hurdle_batch(
+            _with_bias(X), np.asarray(y, dtype=float).ravel()
+        )
+        return self
+
+    def predict(self, X):
+        return predict_hurdle_batch(_with_bias(X), self.beta_occ_, self.beta_size_)
@@ -0,0 +1,120 @@
+import argparse
+import json
+import subprocess
+import sys
+
+# =========================================================
+# Import cost of the headless core
+# =========================================================
+# Each module is imported in a fresh interpreter (nothing cached in
+# sys.modules), timing the import itself and listing which heavy
+# third-party packages it pulled in. Dash and Plotly must never show up
+# for the headless modules.
+#
+# --startup checks the Dash app itself: `python -X importtime -c "import
+# app"` lists every module imported at startup with its own import time.
+# Heavy libraries of the lazy pages (core.lazypage) must not be among them,
+# and the summed import time must stay under the budget.
+
+HEADLESS_MODULES = [
+    "core", "core.store", "core.enrich", "core.features", "core.design", "core.encoding",
+    "core.pipeline", "core.tuning", "core.hurdle", "core.forest", "core.intermittent",
+    "core.smoothing", "core.intervals", "core.scenario", "core.hierarchy", "core.analytics",
+    "core.outofcore", "core.pooled", "core.shared", "core.batch", "core.lazypage",
+    "core.figures", "core.memstat",
+]
+HEAVY = ["dash", "plotly", "sklearn", "scipy", "joblib", "pyarrow", "pandas"]
+FORBIDDEN = ["dash", "plotly"]
+
+STARTUP_TARGET = "app"
+STARTUP_BUDGET = 1.2          # seconds of import time before the first request
+STARTUP_FORBIDDEN = [
+    "sklearn", "scipy", "joblib", "plotly.express", "plotly.figure_factory",
+    "plotly.subplots", "plotly.graph_objects",
+]
+
+_PROBE = """
+import json, sys, time
+t0 = time.perf_counter()
+import {module}
+elapsed = time.perf_counter() - t0
+print(json.dumps({{"seconds": elapsed, "loaded": [h for h in {heavy!r} if h in sys.modules]}}))
+"""
+
+
+def measure(module):
+    out = subprocess.run(
+        [sys.executable, "-c", _PROBE.format(module=module, heavy=HEAVY)],
+        capture_output=True, text=True, check=True,
+    )
+    return json.loads(out.stdout.strip().splitlines()[-1])
+
+
+def startup_imports(target=STARTUP_TARGET):
+    # {module: own import time in seconds} from -X importtime (stderr lines
+    # "import time: self [us] | cumulative | name"); the target's own entry
+    # is left out, its time is running the app module rather than importing
+    err = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {target}"],
+        capture_output=True, text=True, check=True,
+    ).stderr
+    times = {}
+    for line in err.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        own, _, name = line[len("import time:"):].split("|")
+        name = name.strip()
+        if own.strip().isdigit() and name != target:
+            times[name] = int(own) / 1e6
+    return times
+
+
+def check_startup(target=STARTUP_TARGET, budget=STARTUP_BUDGET, top=10, repeat=3):
+    # prints the heaviest packages; returns the budget / forbidden-import
+    # violations (empty when startup is within budget). Cold imports are
+    # noisy, so the fastest of `repeat` runs is compared with the budget
+    times = min((startup_imports(target) for _ in range(repeat)), key=lambda t: sum(t.values()))
+    total = sum(times.values())
+    roots = {}
+    for name, seconds in times.items():
+        root = name.split(".")[0]
+        roots[root] = roots.get(root, 0.0) + seconds
+    for root, seconds in sorted(roots.items(), key=lambda kv: -kv[1])[:top]:
+        print(f"{root:<28} {seconds:6.3f} s")
+    print(f"{'total':<28} {total:6.3f} s   ({len(times)} modules, budget {budget:.2f} s)")
+
+    problems = [f"imports {name} at startup" for name in STARTUP_FORBIDDEN if name in times]
+    if total > budget:
+        problems.append(f"startup imports take {total:.2f} s, over the {budget:.2f} s budget")
+    return problems
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Cold import time of the headless core modules")
+    parser.add_argument("modules", nargs="*", default=HEADLESS_MODULES)
+    parser.add_argument("--startup", action="store_true",
+                        help="check the Dash app's startup imports against the budget instead")
+    parser.add_argument("--budget", type=float, default=STARTUP_BUDGET)
+    args = parser.parse_args(argv)
+
+    if args.startup:
+        problems = check_startup(budget=args.budget)
+        if problems:
+            sys.exit(f"{STARTUP_TARGET}: " + "; ".join(problems))
+        return
+
+    failed = []
+    for module in args.modules:
+        result = measure(module)
+        bad = [h for h in FORBIDDEN if h in result["loaded"]]
+        if bad:
+            failed.append(module)
+        print(f"{module:<20} {result['seconds']:6.3f} s   {', '.join(result['loaded']) or '-'}"
+              + (f"   <-- imports {', '.join(bad)}" if bad else ""))
+
+    if failed:
+        sys.exit(f"{len(failed)} headless module(s) import Dash/Plotly: {', '.join(failed)}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,47 @@
+import numpy as np
+
+# =========================================================
+# Prediction intervals
+# =========================================================
+N_BOOT = 2000
+LEVEL = 0.90
+
+
+def _quantile_bounds(samples, level, axis):
+    alpha = (1 - level) / 2
+    lo, hi = np.quantile(samples, [alpha, 1 - alpha], axis=axis)
+    return lo, hi
+
+
+def linear_bootstrap_interval(X_train, y_train, X_test,
+                              n_boot=N_BOOT, level=LEVEL, seed=42):
+    # Residual bootstrap for OLS, all resamples at once:
+    #   Y*  = ŷ + e[idx]          (n × B)
+    #   B*  = (XᵀX)⁺ Xᵀ Y*        (k × B, one matmul)
+    #   P*  = X_test B* + e[idx'] (m × B)
+    # X_train / X_test already carry the bias column. H is formed in
+    # float64; the resampling runs in the design's dtype.
+    y_train = np.ravel(y_train)
+    n = len(y_train)
+
+    X64 = np.asarray(X_train, dtype=np.float64)
+    H = (np.linalg.pinv(X64.T @ X64) @ X64.T).astype(X_train.dtype, copy=False)
+    beta = H @ y_train
+    fitted = X_train @ beta
+    resid = y_train - fitted
+    resid = resid - resid.mean()
+
+    rng = np.random.default_rng(seed)
+    Y_star = fitted[:, None] + resid[rng.integers(0, n, size=(n, n_boot))]
+    B_star = H @ Y_star
+
+    noise = resid[rng.integers(0, n, size=(len(X_test), n_boot))]
+    P_star = X_test @ B_star + noise
+
+    return _quantile_bounds(P_star, level, axis=1)
+
+
+def forest_interval(model, X_test, level=LEVEL):
+    # quantiles of the per-tree predictions of a fitted RandomForest
+    per_tree = np.stack([tree.predict(X_test) for tree in model.estimators_])
+    return _quantile_bounds(per_tree, level, axis=0)
@@ -0,0 +1,29 @@
+import importlib
+
+# =========================================================
+# Pages built on first visit
+# =========================================================
+# Dash imports every page module at startup. A heavy page (data loading,
+# model fits, figures, sklearn / plotly.express) is therefore split:
+#
+#   pages/<name>.py  : route and callbacks only — Dash needs both at startup
+#   pages/_<name>.py : everything else, imported by the first request that
+#                      needs it (page layout or callback)
+#
+# Dash's page scan skips files starting with "_", so the body is never
+# imported at startup. Reloads (core.reload) refresh a body only once it
+# has been imported; until then the first visit reads the current data.
+
+
+class LazyPage:
+
+    def __init__(self, module):
+        self.name = module
+
+    @property
+    def module(self):
+        # import locks make concurrent first requests wait for one import
+        return importlib.import_module(self.name)
+
+    def layout(self, **kwargs):
+        return self.module.layout
@@ -0,0 +1,38 @@
+# =========================================================
+# Process memory from /proc
+# =========================================================
+# tracemalloc only counts allocations made through Python's allocator:
+# memory-mapped pages (the design matrix, the data plane) and buffers that
+# numpy / pyarrow allocate natively never show up, so it cannot compare a
+# memmap against in-memory copies. These read the kernel's numbers for the
+# calling process instead (Linux only):
+#
+#   Rss / Pss : /proc/self/smaps_rollup; Pss splits shared pages between
+#               the processes mapping them, so it sums to the real total
+#   peak      : VmHWM in /proc/self/status (peak RSS), which reset_peak()
+#               sets back to the current RSS
+
+
+def memory_kb():
+    # (Rss, Pss) of this process
+    values = {}
+    with open("/proc/self/smaps_rollup", encoding="utf-8") as f:
+        for line in f:
+            key, _, rest = line.partition(":")
+            if key in ("Rss", "Pss"):
+                values[key] = int(rest.split()[0])
+    return values["Rss"], values["Pss"]
+
+
+def peak_rss_kb():
+    with open("/proc/self/status", encoding="utf-8") as f:
+        for line in f:
+            if line.startswith("VmHWM:"):
+                return int(line.split()[1])
+    raise OSError("VmHWM not in /proc/self/status")
+
+
+def reset_peak():
+    # "5" resets the peak RSS to the current RSS (Linux ≥ 4.0)
+    with open("/proc/self/clear_refs", "w", encoding="utf-8") as f:
+        f.write("5")
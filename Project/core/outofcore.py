@@ -0,0 +1,208 @@
+import argparse
+import glob
+import os
+import shutil
+import time
+
+import numpy as np
+import pandas as pd
+import pyarrow.parquet as pq
+
+from core import memstat, store
+from core.design import DESIGN_COLUMNS, encode
+from core.tuning import block_splits
+
+# =========================================================
+# Out-of-core linear pipeline
+# =========================================================
+# The enriched table is partitioned on disk by product and year
+# (data/partitions/product=<code>/year=<yyyy>.parquet). The normal
+# equation only needs XᵀX and Xᵀy, which are sums over rows, so the fit
+# and the rolling-block backtest stream through partitions in bounded
+# batches and never hold a product's full history in memory.
+
+PARTITION_DIR = os.path.join(store.DATA_DIR, "partitions")
+VERSION_FILE = "_source_version"
+BATCH_ROWS = 100_000
+TARGET = "Total_Order_Demand"
+READ_COLUMNS = ["Date", TARGET, "Order_Count", "Season", "Holiday", "Black_Friday", "Promotion"]
+
+
+# =========================================================
+# PARTITIONS
+# =========================================================
+def write_partitions(con, out_dir=PARTITION_DIR):
+    # one (product, year) slice at a time straight from the store
+    tmp_dir = out_dir + ".tmp"
+    shutil.rmtree(tmp_dir, ignore_errors=True)
+
+    keys = con.execute(
+        "SELECT DISTINCT Product_Code, Year FROM enriched ORDER BY Product_Code, Year"
+    ).fetchall()
+    for product, year in keys:
+        part = pd.read_sql_query(
+            f"""
+            SELECT {", ".join(READ_COLUMNS)}
+            FROM enriched
+            WHERE Product_Code = ? AND Year = ?
+            ORDER BY Date
+            """,
+            con, params=(product, year),
+        )
+        path = os.path.join(tmp_dir, f"product={product}", f"year={year}.parquet")
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        part.to_parquet(path, index=False)
+
+    os.makedirs(tmp_dir, exist_ok=True)
+    with open(os.path.join(tmp_dir, VERSION_FILE), "w", encoding="utf-8") as f:
+        f.write(store.source_version(con) or "")
+
+    shutil.rmtree(out_dir, ignore_errors=True)
+    os.replace(tmp_dir, out_dir)
+
+
+def ensure_partitions(con, out_dir=PARTITION_DIR):
+    # rewrite when missing or written from an older store version
+    try:
+        with open(os.path.join(out_dir, VERSION_FILE), encoding="utf-8") as f:
+            current = f.read() == (store.source_version(con) or "")
+    except FileNotFoundError:
+        current = False
+    if not current:
+        write_partitions(con, out_dir)
+
+
+def partition_paths(product, out_dir=PARTITION_DIR):
+    # year files sort chronologically by name
+    return sorted(glob.glob(os.path.join(out_dir, f"product={product}", "year=*.parquet")))
+
+
+def partition_products(out_dir=PARTITION_DIR):
+    dirs = sorted(glob.glob(os.path.join(out_dir, "product=*")))
+    return [os.path.basename(d).split("=", 1)[1] for d in dirs]
+
+
+def row_count(paths):
+    # from parquet footers only, no data read
+    return sum(pq.read_metadata(p).num_rows for p in paths)
+
+
+def iter_batches(paths, batch_rows=BATCH_ROWS):
+    # yields (row offset, X without bias, y) in chronological order
+    offset = 0
+    for path in paths:
+        for batch in pq.ParquetFile(path).iter_batches(batch_size=batch_rows, columns=READ_COLUMNS):
+            frame = batch.to_pandas()
+            yield offset, encode(frame), frame[TARGET].to_numpy(dtype=float)
+            offset += len(frame)
+
+
+# =========================================================
+# NORMAL EQUATIONS
+# =========================================================
+class NormalEquations:
+    # running XᵀX / Xᵀy with the bias column handled implicitly
+
+    def __init__(self, k):
+        self.XtX = np.zeros((k + 1, k + 1))
+        self.Xty = np.zeros(k + 1)
+        self.n = 0
+
+    def update(self, X, y):
+        if len(X) == 0:
+            return
+        s = X.sum(axis=0)
+        self.XtX[0, 0] += len(X)
+        self.XtX[0, 1:] += s
+        self.XtX[1:, 0] += s
+        self.XtX[1:, 1:] += X.T @ X
+        self.Xty[0] += y.sum()
+        self.Xty[1:] += X.T @ y
+        self.n += len(X)
+
+    def solve(self):
+        return np.linalg.pinv(self.XtX) @ self.Xty
+
+
+def predict(beta, X):
+    return beta[0] + X @ beta[1:]
+
+
+def fit_streaming(paths, batch_rows=BATCH_ROWS):
+    ne = NormalEquations(len(DESIGN_COLUMNS))
+    for _, X, y in iter_batches(paths, batch_rows):
+        ne.update(X, y)
+    return ne.solve()
+
+
+def streaming_block_backtest(paths, splits=None, batch_rows=BATCH_ROWS):
+    # one pass: each batch feeds the train accumulators of the blocks it
+    # overlaps; a block's beta is solved when its first test row arrives
+    # (train rows always come first in time)
+    if splits is None:
+        splits = block_splits(row_count(paths))
+
+    acc = [NormalEquations(len(DESIGN_COLUMNS)) for _ in splits]
+    betas = [None] * len(splits)
+    y_true = [[] for _ in splits]
+    y_pred = [[] for _ in splits]
+
+    for offset, X, y in iter_batches(paths, batch_rows):
+        stop = offset + len(y)
+        for b, (train, test) in enumerate(splits):
+            lo, hi = max(train.start, offset), min(train.stop, stop)
+            if lo < hi:
+                acc[b].update(X[lo - offset:hi - offset], y[lo - offset:hi - offset])
+
+            lo, hi = max(test.start, offset), min(test.stop, stop)
+            if lo < hi:
+                if betas[b] is None:
+                    betas[b] = acc[b].solve()
+                y_true[b].append(y[lo - offset:hi - offset])
+                y_pred[b].append(predict(betas[b], X[lo - offset:hi - offset]))
+
+    rows = []
+    for b in range(len(splits)):
+        yt, yp = np.concatenate(y_true[b]), np.concatenate(y_pred[b])
+        sse = float(np.sum((yt - yp) ** 2))
+        ss_tot = float(np.sum((yt - yt.mean()) ** 2))
+        rows.append([b + 1, sse, sse / len(yt), float(np.mean(np.abs(yt - yp))), 1 - sse / ss_tot])
+
+    return pd.DataFrame(rows, columns=["Block", "SSE", "MSE", "MAE", "R²"])
+
+
+# =========================================================
+# CLI
+# =========================================================
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Out-of-core rolling-block backtest of the linear model"
+    )
+    parser.add_argument("--products", nargs="*", help="product codes (default: all)")
+    parser.add_argument("--batch-rows", type=int, default=BATCH_ROWS)
+    parser.add_argument("--rebuild", action="store_true", help="rewrite the partitions first")
+    args = parser.parse_args(argv)
+
+    con = store.connect()
+    if args.rebuild:
+        write_partitions(con)
+    else:
+        ensure_partitions(con)
+    con.close()
+
+    # peak RSS counts what tracemalloc misses: pyarrow's native buffers
+    rss0, _ = memstat.memory_kb()
+    memstat.reset_peak()
+    t0 = time.perf_counter()
+    for product in args.products or partition_products():
+        metrics = streaming_block_backtest(partition_paths(product), batch_rows=args.batch_rows)
+        print(f"== {product}")
+        print(metrics.round({"SSE": 2, "MSE": 2, "MAE": 2, "R²": 4}).to_string(index=False))
+
+    peak = memstat.peak_rss_kb()
+    print(f"\nelapsed {time.perf_counter() - t0:.2f} s, peak RSS {peak / 1024:.1f} MiB "
+          f"(+{(peak - rss0) / 1024:.1f} MiB over the start)")
+
+
+if __name__ == "__main__":
+    main()
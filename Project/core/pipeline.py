@@ -0,0 +1,81 @@
+import json
+import os
+
+import numpy as np
+import pandas as pd
+import scipy.sparse as sp
+
+from core.design import DESIGN_DIR, SEASONS
+from core.encoding import SparseEncoder
+
+# =========================================================
+# Persisted feature pipeline
+# =========================================================
+# Fitted once on a product's history, it holds everything scoring needs
+# afterwards, so forecasts for new dates never go back to the history:
+#
+#   columns  : vocabulary and order of the design (SparseEncoder); Season,
+#              Month and Weekday always carry every level. Season is a
+#              function of Month, so with Month in the design the Season
+#              dummies are left out (they would be sums of month dummies)
+#   fills    : Order_Count per month of year, for days whose orders are
+#              not known yet (future dates)
+#
+# transform() maps any enriched-style frame onto exactly those columns in
+# one vectorized pass (CSR build, optionally densified).
+
+PIPELINE_DIR = DESIGN_DIR
+
+
+def pipeline_path(name, out_dir=PIPELINE_DIR):
+    return os.path.join(out_dir, f"pipeline_{name}.json")
+
+
+class FeaturePipeline:
+
+    def __init__(self, **encoder_kwargs):
+        encoder_kwargs.setdefault("levels", {"Season": SEASONS})
+        if "Month" in encoder_kwargs.get("calendar", ()):
+            categorical = encoder_kwargs.get("categorical", ("Season",))
+            encoder_kwargs["categorical"] = [c for c in categorical if c != "Season"]
+        self.encoder = SparseEncoder(**encoder_kwargs)
+
+    def fit(self, history):
+        self.encoder.fit(history)
+        month = pd.to_datetime(history["Date"]).dt.month
+        self.order_count_by_month_ = (
+            history.groupby(month)["Order_Count"].mean().reindex(range(1, 13)).fillna(0).tolist()
+        )
+        return self
+
+    @property
+    def columns(self):
+        return self.encoder.feature_names_
+
+    def transform(self, frame, dtype=np.float64, bias=False, sparse=False):
+        # a frame without Order_Count (future days) gets the fitted fills
+        if "Order_Count" not in frame:
+            month = pd.to_datetime(frame["Date"]).dt.month.to_numpy()
+            frame = frame.assign(Order_Count=np.take(self.order_count_by_month_, month - 1))
+        X = self.encoder.transform(frame, dtype)
+        if bias:
+            X = sp.hstack([np.ones((X.shape[0], 1), dtype=dtype), X], format="csr")
+        return X if sparse else X.toarray()
+
+    # ---------- persistence ----------
+    def save(self, path):
+        state = {"encoder": self.encoder.to_dict(), "order_count_by_month": self.order_count_by_month_}
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp_path = path + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(state, f, default=int)
+        os.replace(tmp_path, path)
+
+    @classmethod
+    def load(cls, path):
+        with open(path, encoding="utf-8") as f:
+            state = json.load(f)
+        pipeline = cls.__new__(cls)
+        pipeline.encoder = SparseEncoder.from_dict(state["encoder"])
+        pipeline.order_count_by_month_ = state["order_count_by_month"]
+        return pipeline
@@ -0,0 +1,199 @@
+import argparse
+import os
+import time
+
+import numpy as np
+import pandas as pd
+import pyarrow.parquet as pq
+
+from core import store
+from core.design import DESIGN_DIR
+from core.encoding import SparseEncoder, SparseNormalEquations
+from core.outofcore import (
+    BATCH_ROWS, PARTITION_DIR, READ_COLUMNS, TARGET,
+    ensure_partitions, partition_paths, partition_products, row_count, streaming_block_backtest,
+)
+from core.tuning import block_splits
+
+# =========================================================
+# Pooled global model across products
+# =========================================================
+# One linear model on the stacked multi-product table instead of one per
+# product. Shared effects (order count, holiday, Black Friday, promotion,
+# month, weekday) are learned from every product at once; product level
+# enters through product dummies and per-product order-count and promotion
+# slopes (sparse interactions).
+#
+# No block is a function of another: Season is left out (it is a function
+# of Month), and so are warehouse / category dummies — each product has one
+# main warehouse and category, so they would be sums of product dummies.
+#
+# Demand levels differ by orders of magnitude between products, so the
+# target is demand / (the product's mean training demand) and predictions
+# are scaled back — shared effects then act in relative terms.
+#
+# Training streams mini-batches of whole (product, year) partitions through
+# the sparse encoder into one SparseNormalEquations per block; rows are
+# assigned to blocks by their position in the product's history, with the
+# same block splits as the per-product models.
+
+POOLED_VOCAB_PATH = os.path.join(DESIGN_DIR, "pooled_vocabulary.json")
+
+
+def pooled_encoder(products, path=POOLED_VOCAB_PATH):
+    # vocabulary over the whole catalog (not just the products a batch
+    # holds), refitted and saved on every run so new products get columns
+    dates = pd.date_range("2000-01-01", "2000-12-31")
+    n = max(len(products), len(dates))
+    catalog = pd.DataFrame({
+        "Product_Code": np.resize(np.asarray(products), n),
+        "Date": np.resize(dates, n),
+    })
+    encoder = SparseEncoder(
+        categorical=["Product_Code"],
+        calendar=["Month", "Weekday"],
+        interactions=[("Product_Code", "Order_Count"), ("Product_Code", "Promotion")],
+    )
+    encoder.fit(catalog).save(path)
+    return encoder
+
+
+def iter_stacked(products, batch_rows=BATCH_ROWS, out_dir=PARTITION_DIR):
+    # mini-batches of whole partitions from consecutive products, each row
+    # tagged with its product and its position in that product's history
+    buffer, size = [], 0
+    for product in products:
+        offset = 0
+        for path in partition_paths(product, out_dir):
+            frame = pd.read_parquet(path, columns=READ_COLUMNS)
+            frame["Product_Code"] = product
+            frame["Row"] = np.arange(offset, offset + len(frame))
+            offset += len(frame)
+            buffer.append(frame)
+            size += len(frame)
+            if size >= batch_rows:
+                yield pd.concat(buffer, ignore_index=True)
+                buffer, size = [], 0
+    if buffer:
+        yield pd.concat(buffer, ignore_index=True)
+
+
+def block_scales(products, splits, out_dir=PARTITION_DIR):
+    # (products × blocks) mean training demand, reading the target column only
+    scales = np.ones((len(products), len(splits)))
+    for i, product in enumerate(products):
+        y = np.concatenate([
+            pq.read_table(p, columns=[TARGET]).column(0).to_numpy()
+            for p in partition_paths(product, out_dir)
+        ])
+        for b, (train, _) in enumerate(splits):
+            mean = y[train].mean()
+            scales[i, b] = mean if mean > 0 else 1.0
+    return scales
+
+
+def _metrics(frame, y_true, y_pred):
+    err = frame.assign(err=y_true - y_pred, abs_err=np.abs(y_true - y_pred), y=y_true)
+    rows = []
+    for (product, block), g in err.groupby(["Product_Code", "Block"], sort=True):
+        sse = float(np.sum(g["err"] ** 2))
+        ss_tot = float(np.sum((g["y"] - g["y"].mean()) ** 2))
+        rows.append([product, block, 1 - sse / ss_tot, g["abs_err"].mean(), np.sqrt(sse / len(g))])
+    return pd.DataFrame(rows, columns=["Product_Code", "Block", "R2", "MAE", "RMSE"])
+
+
+def pooled_block_backtest(splits, products=None, batch_rows=BATCH_ROWS, out_dir=PARTITION_DIR):
+    products = products or partition_products(out_dir)
+    encoder = pooled_encoder(products)
+    scales = block_scales(products, splits, out_dir)
+    product_index = pd.Index(products)
+
+    k = len(encoder.feature_names_)
+    acc = [SparseNormalEquations(k) for _ in splits]
+    held = [[] for _ in splits]          # test rows: (X, keys, y, scale)
+
+    for frame in iter_stacked(products, batch_rows, out_dir):
+        X = encoder.transform(frame)
+        y = frame[TARGET].to_numpy(dtype=float)
+        row = frame["Row"].to_numpy()
+        codes = product_index.get_indexer(frame["Product_Code"])
+        for b, (train, test) in enumerate(splits):
+            scale = scales[codes, b]
+            mask = (row >= train.start) & (row < train.stop)
+            if mask.any():
+                acc[b].update(X[mask], y[mask] / scale[mask])
+            mask = (row >= test.start) & (row < test.stop)
+            if mask.any():
+                keys = frame.loc[mask, ["Product_Code"]].assign(Block=b + 1)
+                held[b].append((X[mask], keys, y[mask], scale[mask]))
+
+    keys, y_true, y_pred = [], [], []
+    for b, parts in enumerate(held):
+        beta = acc[b].solve()
+        for X, k_, y, scale in parts:
+            keys.append(k_)
+            y_true.append(y)
+            y_pred.append((beta[0] + X @ beta[1:]) * scale)
+
+    return _metrics(
+        pd.concat(keys, ignore_index=True), np.concatenate(y_true), np.concatenate(y_pred)
+    )
+
+
+def per_product_block_backtest(products, splits, batch_rows=BATCH_ROWS, out_dir=PARTITION_DIR):
+    frames = []
+    for product in products:
+        m = streaming_block_backtest(partition_paths(product, out_dir), splits, batch_rows)
+        frames.append(pd.DataFrame({
+            "Product_Code": product, "Block": m["Block"], "R2": m["R²"],
+            "MAE": m["MAE"], "RMSE": np.sqrt(m["MSE"]),
+        }))
+    return pd.concat(frames, ignore_index=True)
+
+
+def compare_global(con, splits=None, products=None, batch_rows=BATCH_ROWS, out_dir=PARTITION_DIR):
+    # per-product vs pooled on the same block splits: metrics per product
+    # and block, and (mean accuracy, total training time) per approach
+    ensure_partitions(con, out_dir)
+    products = products or partition_products(out_dir)
+    if splits is None:
+        splits = block_splits(row_count(partition_paths(products[0], out_dir)))
+
+    runs = {
+        "Per-product": lambda: per_product_block_backtest(products, splits, batch_rows, out_dir),
+        "Global": lambda: pooled_block_backtest(splits, products, batch_rows, out_dir),
+    }
+    frames, cost = [], []
+    for approach, run in runs.items():
+        t0 = time.perf_counter()
+        metrics = run()
+        elapsed = time.perf_counter() - t0
+        frames.append(metrics.assign(Approach=approach))
+        cost.append([approach, metrics["R2"].mean(), metrics["MAE"].mean(), elapsed])
+
+    metrics = pd.concat(frames, ignore_index=True)
+    cost_df = pd.DataFrame(cost, columns=["Approach", "Mean_R2", "Mean_MAE", "Total_Train_s"])
+    return metrics, cost_df
+
+
+# =========================================================
+# CLI
+# =========================================================
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Pooled global model vs per-product models, rolling blocks")
+    parser.add_argument("--products", nargs="*", help="product codes (default: all)")
+    parser.add_argument("--batch-rows", type=int, default=BATCH_ROWS)
+    args = parser.parse_args(argv)
+
+    con = store.connect()
+    metrics, cost_df = compare_global(con, products=args.products, batch_rows=args.batch_rows)
+    con.close()
+
+    summary = metrics.groupby(["Product_Code", "Approach"])[["R2", "MAE"]].mean().unstack("Approach")
+    print(summary.round(3).to_string())
+    print()
+    print(cost_df.round(3).to_string(index=False))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,156 @@
+import hashlib
+import os
+import sqlite3
+import sys
+import threading
+import time
+
+from core import store
+from core.shared import open_plane
+
+# =========================================================
+# Hot reload of data when source files change
+# =========================================================
+# A background thread polls the source files in data/. When one changes
+# (and has stopped changing, so half-copied files are skipped), the data
+# stages run off the request path:
+#
+#   store   : raw → SQLite store + cubes (store.connect rebuilds when stale;
+#             the model registry is carried over, so tuned hyperparameters
+#             are reused and nothing is re-searched)
+#   plane   : shared-memory data plane (enriched table + design matrix)
+#
+# Page bodies are not executed here. A loaded body (core.lazypage) whose
+# store tables (PAGE_TABLES) now hold different rows is dropped from
+# sys.modules; the next request that needs it imports it again on the new
+# data, and requests already running finish on the old module. A file
+# saved again with the same data drops nothing.
+#
+# Turned on with DATA_WATCH=1 (app.py), under any server. With several
+# worker processes each runs its own watcher: store.connect rebuilds under
+# a file lock, so one process rebuilds and the others find the store
+# current, and each compares the tables with what its pages were built on.
+#
+# Outputs the pages write into data/ (e.g. data0979_*.xlsx) are not sources
+# and are ignored.
+
+WATCH_INTERVAL = 2.0
+
+# source file in data/ → page bodies that read it
+SOURCES = {
+    os.path.basename(store.RAW_PATH): [
+        "pages._home", "pages._dataset", "pages._eda_ml", "pages._model",
+    ],
+}
+
+# store tables each page reads (cubes and the data plane derive from enriched)
+PAGE_TABLES = {
+    "pages._home": ["enriched"],
+    "pages._dataset": ["daily_demand"],
+    "pages._eda_ml": ["enriched"],
+    "pages._model": ["raw_orders", "enriched"],
+}
+TABLES = sorted({t for tables in PAGE_TABLES.values() for t in tables})
+
+
+def _signature(path):
+    try:
+        st = os.stat(path)
+    except FileNotFoundError:
+        return None
+    return st.st_mtime_ns, st.st_size
+
+
+def table_digests(db_path=store.DB_PATH):
+    # content hash of each table a page reads; {} when there is no store yet
+    if not os.path.exists(db_path):
+        return {}
+    con = sqlite3.connect(db_path)
+    try:
+        digests = {}
+        for table in TABLES:
+            h = hashlib.sha1()
+            for row in con.execute(f"SELECT * FROM {table} ORDER BY rowid"):
+                h.update(repr(row).encode("utf-8"))
+            digests[table] = h.hexdigest()
+        return digests
+    except sqlite3.DatabaseError:
+        return {}
+    finally:
+        con.close()
+
+
+def refresh_data():
+    # store and plane stages; returns the new table digests
+    con = store.connect()                    # rebuilds if stale
+    open_plane(con)
+    con.close()
+    return table_digests()
+
+
+def refresh(changed, digests):
+    # digests: tables as the loaded pages last saw them → (pages dropped,
+    # new digests)
+    pages = []
+    for path in changed:
+        for name in SOURCES.get(os.path.basename(path), []):
+            if name not in pages:
+                pages.append(name)
+    if not pages:
+        return [], digests
+
+    t0 = time.perf_counter()
+    after = refresh_data()
+    changed_tables = {t for t in TABLES if digests.get(t) != after.get(t)}
+    dropped = [
+        name for name in pages
+        if name in sys.modules and changed_tables & set(PAGE_TABLES.get(name, TABLES))
+    ]
+    for name in dropped:
+        sys.modules.pop(name, None)          # rebuilt by the next request
+
+    print(f"[reload] {', '.join(os.path.basename(p) for p in changed)} → data refreshed in "
+          f"{time.perf_counter() - t0:.1f} s; "
+          f"{', '.join(dropped) or 'no page (same data)'} rebuilt on next visit", flush=True)
+    return dropped, after
+
+
+class DataWatcher(threading.Thread):
+
+    def __init__(self, data_dir=store.DATA_DIR, interval=WATCH_INTERVAL):
+        super().__init__(name="data-watcher", daemon=True)
+        self.paths = [os.path.join(data_dir, name) for name in SOURCES]
+        self.interval = interval
+        self.seen = {p: _signature(p) for p in self.paths}
+        self.digests = table_digests()
+        self.stop_event = threading.Event()
+
+    def poll(self):
+        return [p for p in self.paths if _signature(p) != self.seen[p]]
+
+    def run(self):
+        while not self.stop_event.wait(self.interval):
+            changed = self.poll()
+            if not changed:
+                continue
+            # wait for the copy to finish: same signature over one interval
+            current = {p: _signature(p) for p in changed}
+            if self.stop_event.wait(self.interval):
+                break
+            if any(_signature(p) != current[p] for p in changed):
+                continue
+            try:
+                _, self.digests = refresh([p for p in changed if current[p] is not None], self.digests)
+            except Exception as exc:
+                # keep serving the current version; retry on the next change
+                print(f"[reload] refresh failed, keeping the current data: {exc!r}", flush=True)
+            self.seen.update(current)
+
+    def stop(self):
+        self.stop_event.set()
+
+
+def start_watcher(data_dir=store.DATA_DIR, interval=WATCH_INTERVAL):
+    watcher = DataWatcher(data_dir, interval)
+    watcher.start()
+    return watcher
@@ -0,0 +1,95 @@
+import numpy as np
+import pandas as pd
+import scipy.sparse as sp
+
+from core.enrich import SEASON_BY_MONTH, get_black_friday
+
+# =========================================================
+# What-if promotion scenarios
+# =========================================================
+# The fitted linear coefficients are applied once to a future calendar to
+# get the baseline prediction vector. A scenario only changes 0/1 flags
+# (Promotion, Black_Friday) on a few days, so its forecast is
+#
+#   ŷ_scenario = ŷ_base + Σ_flag β_flag · (x_new − x_old)
+#
+# where the flag deltas are sparse (scenarios × days) matrices. Many
+# scenarios are evaluated together with a handful of sparse ops.
+
+FLAG_COLUMNS = ["Promotion", "Black_Friday"]
+
+
+def future_frame(start, periods):
+    # enriched-style calendar for future days; Order_Count is unknown ahead
+    # of time and is filled in by the fitted FeaturePipeline
+    dates = pd.date_range(start, periods=periods)
+    month = dates.month.values
+    black_fridays = [get_black_friday(y) for y in range(dates[0].year, dates[-1].year + 1)]
+
+    return pd.DataFrame({
+        "Date": dates,
+        "Season": SEASON_BY_MONTH[month],
+        "Holiday": (((month == 1) & (dates.day == 1)) | ((month == 12) & (dates.day == 25))).astype(int),
+        "Black_Friday": dates.isin(black_fridays).astype(int),
+        "Promotion": 0,
+    })
+
+
+class ScenarioEngine:
+
+    def __init__(self, beta, columns, X_future, dates):
+        # beta / X_future include the bias as their first entry / column
+        self.beta = np.ravel(beta)
+        self.columns = list(columns)
+        self.dates = pd.DatetimeIndex(dates)
+        self.base_flags = {
+            c: np.flatnonzero(X_future[:, 1 + self.columns.index(c)])
+            for c in FLAG_COLUMNS
+        }
+        self.base = X_future @ self.beta
+
+    def days(self, months=(), weekdays=()):
+        mask = self.dates.month.isin(months) & self.dates.weekday.isin(weekdays)
+        return np.flatnonzero(mask)
+
+    def _delta(self, column, flag_days):
+        # sparse (scenarios × days) matrix of x_new − x_old for one flag
+        rows, cols, vals = [], [], []
+        base = self.base_flags[column]
+        for s, days in enumerate(flag_days):
+            on = np.setdiff1d(days, base)
+            off = np.setdiff1d(base, days)
+            rows += [np.full(len(on) + len(off), s)]
+            cols += [on, off]
+            vals += [np.ones(len(on)), -np.ones(len(off))]
+        shape = (len(flag_days), len(self.base))
+        if not rows:
+            return sp.csr_matrix(shape)
+        return sp.csr_matrix(
+            (np.concatenate(vals), (np.concatenate(rows), np.concatenate(cols))),
+            shape=shape,
+        )
+
+    def evaluate(self, scenarios):
+        # scenarios: list of {flag column: day indices where the flag is 1};
+        # flags left out keep their baseline days
+        delta = sp.csr_matrix((len(scenarios), len(self.base)))
+        for c in FLAG_COLUMNS:
+            flag_days = [np.asarray(s.get(c, self.base_flags[c]), dtype=int) for s in scenarios]
+            coef = self.beta[1 + self.columns.index(c)]
+            delta = delta + coef * self._delta(c, flag_days)
+        return delta.toarray() + self.base
+
+    def compare(self, scenarios, names):
+        preds = np.maximum(self.evaluate(scenarios), 0.0)
+        base_total = np.maximum(self.base, 0.0).sum()
+        totals = preds.sum(axis=1)
+        n_days = {c: [len(s.get(c, self.base_flags[c])) for s in scenarios] for c in FLAG_COLUMNS}
+        return preds, pd.DataFrame({
+            "Scenario": names,
+            "Promotion days": n_days["Promotion"],
+            "Black Friday": n_days["Black_Friday"],
+            "Total demand": totals,
+            "Uplift vs baseline": totals - base_total,
+            "Uplift %": 100 * (totals - base_total) / base_total,
+        })
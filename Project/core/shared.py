@@ -0,0 +1,264 @@
+import argparse
+import glob
+import hashlib
+import json
+import multiprocessing as mp
+import os
+import shutil
+import time
+
+import numpy as np
+import pandas as pd
+
+from core import store
+from core.design import PRECISION, SEASONS, load_design
+from core.enrich import ENRICHED_COLUMNS
+from core.memstat import memory_kb
+
+# =========================================================
+# Shared-memory data plane
+# =========================================================
+# The arrays every process reads — the enriched table stacked as
+# (products × days × columns), the season codes, the dates and the
+# design matrix — are published once per dataset version as .npy files
+# in /dev/shm (RAM-backed; data/shared where it does not exist). Pages,
+# CLIs and pool workers attach to them with np.load(mmap_mode="r"): no
+# process loads or copies its own, the pages are mapped once by the
+# kernel and shared, so adding workers keeps total memory (PSS) roughly
+# flat.
+#
+# A plane is a directory named <scope>-<version>: the scope hashes the
+# store path and design precision, the version adds the source version.
+# It is written under a temp name and renamed into place, so attaching
+# processes never see half of one. Publishing removes older source
+# versions of the same scope only — planes of another precision or another
+# store on the host are left alone, and so is a newer plane when a process
+# still on the previous store publishes (processes still mapping a removed
+# plane keep their pages until they let go).
+
+SHARED_ROOT = "/dev/shm" if os.path.isdir("/dev/shm") else os.path.join(store.DATA_DIR, "shared")
+PLANE_COLUMNS = ["Total_Order_Demand", "Order_Count", "Holiday", "Black_Friday", "Promotion"]
+
+_planes = {}          # version key → DataPlane, per process
+
+
+def _digest(text, n):
+    return hashlib.sha1(text.encode("utf-8")).hexdigest()[:n]
+
+
+def plane_scope(dtype=PRECISION, db_path=store.DB_PATH):
+    return f"{os.path.abspath(db_path)}:{np.dtype(dtype).name}"
+
+
+def version_key(con, dtype=PRECISION):
+    return f"{plane_scope(dtype)}:{store.source_version(con)}"
+
+
+def plane_prefix(scope, name="demand", root=SHARED_ROOT):
+    return os.path.join(root, f"{name}-plane-{_digest(scope, 12)}-")
+
+
+def plane_path(scope, version, name="demand", root=SHARED_ROOT):
+    return plane_prefix(scope, name, root) + _digest(version, 16)
+
+
+class DataPlane:
+
+    def __init__(self, path):
+        self.path = path
+        with open(os.path.join(path, "manifest.json"), encoding="utf-8") as f:
+            self.manifest = json.load(f)
+        self.version = self.manifest["version"]
+        self.products = self.manifest["products"]
+        self.columns = self.manifest["columns"]
+        self.design_columns = self.manifest["design_columns"]
+        self.index = {p: i for i, p in enumerate(self.products)}
+        self.dates = self._load("dates")
+        self.enriched = self._load("enriched")         # products × days × columns
+        self.season = self._load("season")             # products × days, codes into SEASONS
+        self.design = self._load("design")             # (products·days) × design columns
+
+    def _load(self, name):
+        return np.load(os.path.join(self.path, f"{name}.npy"), mmap_mode="r")
+
+    @property
+    def days(self):
+        return len(self.dates)
+
+    def rows(self, product):
+        # row slice of the product in the design matrix
+        i = self.index[product]
+        return slice(i * self.days, (i + 1) * self.days)
+
+    def stacked(self, columns=PLANE_COLUMNS):
+        # (products × days × columns); a zero-copy view in plane order
+        if list(columns) == self.columns:
+            return self.enriched
+        return self.enriched[..., [self.columns.index(c) for c in columns]]
+
+    def enriched_frame(self, product=store.PRODUCT):
+        # same frame as store.enriched_frame, built from the mapped arrays
+        i = self.index[product]
+        frame = pd.DataFrame(self.enriched[i].astype(np.int64), columns=self.columns)
+        frame["Date"] = self.dates.astype("datetime64[ns]")
+        frame["Season"] = np.take(SEASONS, self.season[i])
+        return frame[ENRICHED_COLUMNS]
+
+
+# =========================================================
+# PUBLISH / ATTACH
+# =========================================================
+def attach(scope, version, name="demand", root=SHARED_ROOT):
+    # None when not published (or removed by a newer version meanwhile)
+    try:
+        return DataPlane(plane_path(scope, version, name, root))
+    except FileNotFoundError:
+        return None
+
+
+def publish(scope, version, arrays, meta, name="demand", root=SHARED_ROOT):
+    # arrays: name → ndarray; meta goes into the manifest
+    path = plane_path(scope, version, name, root)
+    tmp_path = f"{path}.tmp-{os.getpid()}"
+    shutil.rmtree(tmp_path, ignore_errors=True)
+    os.makedirs(tmp_path)
+    for key, array in arrays.items():
+        np.save(os.path.join(tmp_path, f"{key}.npy"), np.ascontiguousarray(array))
+    with open(os.path.join(tmp_path, "manifest.json"), "w", encoding="utf-8") as f:
+        json.dump({"version": version, **meta}, f)
+    try:
+        os.rename(tmp_path, path)
+    except OSError:
+        # another process published the same version first
+        shutil.rmtree(tmp_path, ignore_errors=True)
+
+    for old in glob.glob(plane_prefix(scope, name, root) + "*"):
+        if old != path and ".tmp-" not in old and _is_older(old, meta.get("source_version")):
+            shutil.rmtree(old, ignore_errors=True)
+    return DataPlane(path)
+
+
+def _is_older(path, source_version):
+    # a process still on the previous store must not remove the newer plane
+    try:
+        with open(os.path.join(path, "manifest.json"), encoding="utf-8") as f:
+            other = json.load(f).get("source_version")
+        return float(other) < float(source_version)
+    except (OSError, ValueError, TypeError):
+        return False
+
+
+def build_arrays(con, dtype=PRECISION):
+    df = pd.read_sql_query(
+        f"SELECT Product_Code, Date, Season, {', '.join(PLANE_COLUMNS)} "
+        "FROM enriched ORDER BY Product_Code, Date",
+        con,
+    )
+    products = df["Product_Code"].unique().tolist()
+    days = len(df) // len(products)
+    if days * len(products) != len(df):
+        raise ValueError("products do not share one daily timeline; cannot stack the plane")
+
+    design, design_index = load_design(con, dtype)
+    arrays = {
+        "dates": pd.to_datetime(df["Date"].iloc[:days]).to_numpy().astype("datetime64[D]"),
+        "enriched": df[PLANE_COLUMNS].to_numpy(dtype=float).reshape(len(products), days, -1),
+        "season": pd.Categorical(df["Season"], categories=SEASONS).codes
+                    .astype(np.int8).reshape(len(products), days),
+        "design": design,
+    }
+    meta = {
+        "source_version": store.source_version(con),
+        "products": products,
+        "columns": PLANE_COLUMNS,
+        "design_columns": design_index.columns,
+    }
+    return arrays, meta
+
+
+def open_plane(con, dtype=PRECISION):
+    # attach to the plane of the store's current version, publishing it if
+    # no process has yet
+    scope, version = plane_scope(dtype), version_key(con, dtype)
+    plane = _planes.get(version)
+    if plane is None:
+        plane = attach(scope, version)
+        if plane is None:
+            plane = publish(scope, version, *build_arrays(con, dtype))
+        _planes.clear()
+        _planes[version] = plane
+    return plane
+
+
+# =========================================================
+# CLI: total memory as workers are added
+# =========================================================
+def _worker(path, mode, barrier, results):
+    plane = DataPlane(path)
+    arrays = [plane.enriched, plane.design]
+    if mode == "copy":
+        arrays = [np.array(a) for a in arrays]
+    checksum = sum(float(a.sum()) for a in arrays)      # touch every page
+    barrier.wait()                                      # all workers hold their data
+    results.put((*memory_kb(), checksum))
+    barrier.wait()
+
+
+def _synthetic_plane(n_products, days=1827):
+    rng = np.random.default_rng(0)
+    version = f"synthetic:{n_products}:{days}"
+    arrays = {
+        "dates": np.datetime64("2012-01-01") + np.arange(days),
+        "enriched": rng.poisson(3.0, (n_products, days, len(PLANE_COLUMNS))).astype(float),
+        "season": rng.integers(0, len(SEASONS), (n_products, days), dtype=np.int8),
+        "design": rng.random((n_products * days, 8)),
+    }
+    meta = {
+        "products": [f"Product_{i:05d}" for i in range(n_products)],
+        "columns": PLANE_COLUMNS,
+        "design_columns": [f"x{j}" for j in range(8)],
+    }
+    return publish("synthetic", version, arrays, meta, name="synthetic")
+
+
+def _run_workers(path, mode, n_workers):
+    ctx = mp.get_context("spawn")
+    barrier, results = ctx.Barrier(n_workers + 1), ctx.Queue()
+    procs = [ctx.Process(target=_worker, args=(path, mode, barrier, results)) for _ in range(n_workers)]
+    for p in procs:
+        p.start()
+    barrier.wait()
+    rows = [results.get() for _ in procs]
+    barrier.wait()
+    for p in procs:
+        p.join()
+    rss = sum(r[0] for r in rows) / 1024
+    pss = sum(r[1] for r in rows) / 1024
+    return rss, pss
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Worker memory: attaching to the shared data plane vs loading private copies"
+    )
+    parser.add_argument("--products", type=int, default=1000, help="synthetic products in the plane")
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4, 8])
+    args = parser.parse_args(argv)
+
+    plane = _synthetic_plane(args.products)
+    size = (plane.enriched.nbytes + plane.design.nbytes) / 2**20
+    print(f"plane {plane.path}: {size:,.0f} MiB (enriched + design)")
+    print(f"{'workers':>7} {'mode':>7} {'total RSS MiB':>14} {'total PSS MiB':>14} {'s':>6}")
+    try:
+        for n in args.workers:
+            for mode in ("shared", "copy"):
+                t0 = time.perf_counter()
+                rss, pss = _run_workers(plane.path, mode, n)
+                print(f"{n:>7} {mode:>7} {rss:14,.0f} {pss:14,.0f} {time.perf_counter() - t0:6.1f}",
+                      flush=True)
+    finally:
+        shutil.rmtree(plane.path, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,312 @@
+import json
+import os
+import sqlite3
+from contextlib import contextmanager
+
+try:
+    import fcntl
+except ImportError:                          # Windows: no cross-process lock
+    fcntl = None
+
+import numpy as np
+import pandas as pd
+
+from core.cubes import build_cubes, cubes_stale
+from core.enrich import enrich_daily, ENRICHED_COLUMNS
+
+# =========================================================
+# Embedded analytical store (SQLite)
+# =========================================================
+# Raw orders, the daily aggregate, enriched features and model outputs
+# live in one indexed database so pages can push aggregates down to SQL
+# instead of loading the whole history into pandas per process.
+
+DATA_DIR = "data"
+RAW_PATH = os.path.join(DATA_DIR, "datasetprj.xlsx")
+DB_PATH = os.path.join(DATA_DIR, "demand.sqlite")
+
+PRODUCT = "Product_0979"
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS meta (
+    key   TEXT PRIMARY KEY,
+    value TEXT
+);
+
+CREATE TABLE IF NOT EXISTS raw_orders (
+    Product_Code     TEXT    NOT NULL,
+    Warehouse        TEXT,
+    Product_Category TEXT,
+    Date             TEXT    NOT NULL,
+    Order_Demand     INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_raw_product_date ON raw_orders (Product_Code, Date);
+
+CREATE TABLE IF NOT EXISTS daily_demand (
+    Product_Code       TEXT    NOT NULL,
+    Date               TEXT    NOT NULL,
+    Total_Order_Demand INTEGER NOT NULL,
+    Order_Count        INTEGER NOT NULL,
+    PRIMARY KEY (Product_Code, Date)
+);
+
+CREATE TABLE IF NOT EXISTS enriched (
+    Product_Code       TEXT    NOT NULL,
+    Date               TEXT    NOT NULL,
+    Year               INTEGER NOT NULL,
+    Month              INTEGER NOT NULL,
+    Total_Order_Demand INTEGER NOT NULL,
+    Order_Count        INTEGER NOT NULL,
+    Season             TEXT    NOT NULL,
+    Holiday            INTEGER NOT NULL,
+    Black_Friday       INTEGER NOT NULL,
+    Promotion          INTEGER NOT NULL,
+    PRIMARY KEY (Product_Code, Date)
+);
+CREATE INDEX IF NOT EXISTS idx_enriched_season ON enriched (Product_Code, Season, Date);
+CREATE INDEX IF NOT EXISTS idx_enriched_month ON enriched (Product_Code, Month);
+
+CREATE TABLE IF NOT EXISTS model_outputs (
+    Product_Code TEXT    NOT NULL,
+    Model        TEXT    NOT NULL,
+    Block        INTEGER NOT NULL,
+    Step         INTEGER NOT NULL,
+    Actual       REAL,
+    Predicted    REAL,
+    PRIMARY KEY (Product_Code, Model, Block, Step)
+);
+
+CREATE TABLE IF NOT EXISTS model_registry (
+    Product_Code TEXT NOT NULL,
+    Model        TEXT NOT NULL,
+    Params       TEXT NOT NULL,
+    Score        REAL,
+    Metric       TEXT,
+    Search_Space TEXT,
+    Created      TEXT NOT NULL,
+    PRIMARY KEY (Product_Code, Model)
+);
+"""
+
+
+# =========================================================
+# BUILD
+# =========================================================
+def _source_version(raw_path):
+    return str(os.path.getmtime(raw_path))
+
+
+def build_store(raw_path=RAW_PATH, db_path=DB_PATH):
+    # build into a temp file and swap, so readers never see a half-built db
+    tmp_path = db_path + ".tmp"
+    if os.path.exists(tmp_path):
+        os.remove(tmp_path)
+
+    con = sqlite3.connect(tmp_path)
+    con.executescript(SCHEMA)
+
+    raw = pd.read_excel(raw_path)
+    raw["Date"] = pd.to_datetime(raw["Date"]).dt.strftime("%Y-%m-%d")
+    raw[["Product_Code", "Warehouse", "Product_Category", "Date", "Order_Demand"]].to_sql(
+        "raw_orders", con, if_exists="append", index=False
+    )
+
+    # daily aggregate + cleaning rules of the Dataset page, in SQL
+    con.execute(
+        """
+        INSERT INTO daily_demand
+        SELECT Product_Code,
+               Date,
+               SUM(Order_Demand),
+               CASE WHEN SUM(Order_Demand) = 0 THEN 0 ELSE COUNT(*) END
+        FROM raw_orders
+        GROUP BY Product_Code, Date
+        HAVING SUM(Order_Demand) >= 0
+        """
+    )
+
+    products = [r[0] for r in con.execute("SELECT DISTINCT Product_Code FROM daily_demand")]
+    for product in products:
+        enriched = enrich_daily(daily_frame(con, product))
+        enriched.insert(0, "Product_Code", product)
+        enriched["Year"] = enriched["Date"].dt.year
+        enriched["Month"] = enriched["Date"].dt.month
+        enriched["Date"] = enriched["Date"].dt.strftime("%Y-%m-%d")
+        enriched.to_sql("enriched", con, if_exists="append", index=False)
+
+    build_cubes(con)
+    _carry_registry(con, db_path)
+
+    con.execute(
+        "INSERT INTO meta VALUES ('source_version', ?)",
+        (_source_version(raw_path),),
+    )
+    con.commit()
+    con.close()
+
+    os.replace(tmp_path, db_path)
+
+
+def _carry_registry(con, old_db_path):
+    # tuned hyperparameters survive a rebuild: new data is refitted with
+    # them instead of searched again (Search_Space still guards grid changes)
+    if not os.path.exists(old_db_path):
+        return
+    con.commit()
+    con.execute("ATTACH DATABASE ? AS old", (old_db_path,))
+    try:
+        con.execute("INSERT OR REPLACE INTO model_registry SELECT * FROM old.model_registry")
+        con.commit()
+    except sqlite3.DatabaseError:
+        con.rollback()                       # unreadable old store: start empty
+    finally:
+        con.execute("DETACH DATABASE old")
+
+
+def is_stale(raw_path=RAW_PATH, db_path=DB_PATH):
+    if not os.path.exists(db_path):
+        return True
+    con = sqlite3.connect(db_path)
+    try:
+        row = con.execute("SELECT value FROM meta WHERE key = 'source_version'").fetchone()
+    except sqlite3.DatabaseError:
+        row = None
+    finally:
+        con.close()
+    return row is None or row[0] != _source_version(raw_path)
+
+
+def source_version(con):
+    row = con.execute("SELECT value FROM meta WHERE key = 'source_version'").fetchone()
+    return None if row is None else row[0]
+
+
+@contextmanager
+def _build_lock(db_path):
+    # processes opening a stale store (app workers, reload watchers, batch)
+    # rebuild it one at a time
+    if fcntl is None:
+        yield
+        return
+    with open(db_path + ".lock", "a") as f:
+        fcntl.flock(f, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(f, fcntl.LOCK_UN)
+
+
+def connect(raw_path=RAW_PATH, db_path=DB_PATH):
+    if is_stale(raw_path, db_path):
+        with _build_lock(db_path):
+            if is_stale(raw_path, db_path):  # not rebuilt by another process meanwhile
+                build_store(raw_path, db_path)
+    con = sqlite3.connect(db_path, check_same_thread=False)
+    con.executescript(SCHEMA)
+    # a store built before the cube tables changed gets its cubes rebuilt
+    if cubes_stale(con):
+        build_cubes(con)
+        con.commit()
+    return con
+
+
+# =========================================================
+# QUERIES
+# =========================================================
+def daily_frame(con, product=PRODUCT):
+    df = pd.read_sql_query(
+        """
+        SELECT Date, Total_Order_Demand, Order_Count
+        FROM daily_demand
+        WHERE Product_Code = ?
+        ORDER BY Date
+        """,
+        con, params=(product,),
+    )
+    df["Date"] = pd.to_datetime(df["Date"])
+    return df
+
+
+def enriched_frame(con, product=PRODUCT, columns=ENRICHED_COLUMNS):
+    cols = ", ".join(columns)
+    df = pd.read_sql_query(
+        f"SELECT {cols} FROM enriched WHERE Product_Code = ? ORDER BY Date",
+        con, params=(product,),
+    )
+    if "Date" in df.columns:
+        df["Date"] = pd.to_datetime(df["Date"])
+    return df
+
+
+def home_stats(con, product=PRODUCT):
+    n_rows, date_min, date_max, zero_days, promo_days = con.execute(
+        """
+        SELECT COUNT(*),
+               MIN(Date),
+               MAX(Date),
+               SUM(Total_Order_Demand = 0),
+               SUM(Promotion = 1)
+        FROM enriched
+        WHERE Product_Code = ?
+        """,
+        (product,),
+    ).fetchone()
+    return {
+        "n_rows": n_rows,
+        "n_cols": len(ENRICHED_COLUMNS),
+        "date_min": pd.Timestamp(date_min).date(),
+        "date_max": pd.Timestamp(date_max).date(),
+        "zero_days": int(zero_days or 0),
+        "promo_days": int(promo_days or 0),
+    }
+
+
+def write_model_outputs(con, model, y_true_blocks, y_pred_blocks, product=PRODUCT):
+    rows = [
+        (product, model, b + 1, step, float(t), float(p))
+        for b, (yt, yp) in enumerate(zip(y_true_blocks, y_pred_blocks))
+        for step, (t, p) in enumerate(zip(np.ravel(yt), np.ravel(yp)))
+    ]
+    with con:
+        con.execute(
+            "DELETE FROM model_outputs WHERE Product_Code = ? AND Model = ?",
+            (product, model),
+        )
+        con.executemany("INSERT INTO model_outputs VALUES (?, ?, ?, ?, ?, ?)", rows)
+
+
+# =========================================================
+# MODEL REGISTRY
+# =========================================================
+# one winning configuration per (product, model); entries are carried into
+# the rebuilt store when the raw data changes (_carry_registry), so a data
+# change refits models with their tuned configuration rather than searching
+def register_model(con, model, params, score, metric, search_space=None, product=PRODUCT):
+    with con:
+        con.execute(
+            "INSERT OR REPLACE INTO model_registry VALUES (?, ?, ?, ?, ?, ?, datetime('now'))",
+            (
+                product, model, json.dumps(params, sort_keys=True),
+                float(score), metric,
+                None if search_space is None else json.dumps(search_space, sort_keys=True),
+            ),
+        )
+
+
+def registered_params(con, model, search_space=None, product=PRODUCT):
+    row = con.execute(
+        "SELECT Params, Search_Space FROM model_registry WHERE Product_Code = ? AND Model = ?",
+        (product, model),
+    ).fetchone()
+    if row is None:
+        return None
+    if search_space is not None and row[1] != json.dumps(search_space, sort_keys=True):
+        return None
+    return json.loads(row[0])
+
+
+def registry_frame(con, product=PRODUCT):
+    return pd.read_sql_query(
+        "SELECT Model, Params, Score, Metric, Created FROM model_registry WHERE Product_Code = ?",
+        con, params=(product,),
+    )
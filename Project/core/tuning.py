@@ -0,0 +1,114 @@
+import itertools
+
+import numpy as np
+
+from core import store
+
+# =========================================================
+# Time-series-aware hyperparameter search (successive halving)
+# =========================================================
+# Folds follow the rolling blocks of the Model page. Inside each block the
+# last VAL_SIZE training rows are held out for validation, so the search
+# never sees the block's test rows. All configurations start on the
+# earliest fold; after each rung only the top 1/ETA survive and get ETA×
+# more folds, until the survivors have been scored on every fold.
+
+VAL_SIZE = 50
+ETA = 3
+
+DT_GRID = {
+    "max_depth": [2, 3, 4, 6, 8, None],
+    "min_samples_leaf": [1, 5, 10, 20],
+    "random_state": [42],
+}
+
+# the forest is grown with warm start (core/forest.py), so the number of
+# trees is not searched
+RF_GRID = {
+    "max_depth": [4, 8, None],
+    "min_samples_leaf": [1, 5],
+    "max_samples": [0.5, 0.8],
+    "random_state": [42],
+}
+
+# ~200 training days per block with rare promotion days: leaves must be
+# allowed to get small
+HGB_GRID = {
+    "learning_rate": [0.05, 0.1],
+    "max_iter": [100, 300],
+    "max_leaf_nodes": [7, 15],
+    "min_samples_leaf": [2, 5, 10],
+    "early_stopping": [False],
+    "random_state": [42],
+}
+
+
+def block_splits(total_rows, num_blocks=6, test_size=100):
+    block_size = total_rows // num_blocks
+    train_size = block_size - test_size
+    return [
+        (slice(start, start + train_size), slice(start + train_size, start + block_size))
+        for start in range(0, block_size * num_blocks, block_size)
+    ]
+
+
+def inner_splits(splits, val_size=VAL_SIZE):
+    return [
+        (slice(train.start, train.stop - val_size), slice(train.stop - val_size, train.stop))
+        for train, _ in splits
+    ]
+
+
+def param_grid(grid):
+    keys = list(grid)
+    return [dict(zip(keys, values)) for values in itertools.product(*grid.values())]
+
+
+def _score(estimator, params, X, y, split):
+    from sklearn.metrics import r2_score
+
+    train, val = split
+    model = estimator(**params).fit(X[train], y[train])
+    return r2_score(y[val], model.predict(X[val]))
+
+
+def successive_halving(estimator, grid, X, y, splits, eta=ETA, n_jobs=-1):
+    # estimator: sklearn class (picklable for the worker pool)
+    from joblib import Parallel, delayed
+
+    y = np.ravel(y)
+    configs = param_grid(grid)
+    scores = [[] for _ in configs]
+    alive = list(range(len(configs)))
+    history = []
+
+    budget = 1
+    with Parallel(n_jobs=n_jobs) as parallel:
+        while True:
+            budget = min(budget, len(splits))
+            tasks = [(i, f) for i in alive for f in range(len(scores[i]), budget)]
+            out = parallel(
+                delayed(_score)(estimator, configs[i], X, y, splits[f]) for i, f in tasks
+            )
+            for (i, _), s in zip(tasks, out):
+                scores[i].append(s)
+
+            history.append({"folds": budget, "configs": len(alive), "fits": len(tasks)})
+            alive.sort(key=lambda i: np.mean(scores[i]), reverse=True)
+            if budget == len(splits):
+                break
+            alive = alive[:max(1, len(alive) // eta)]
+            budget *= eta
+
+    best = alive[0]
+    return configs[best], float(np.mean(scores[best])), history
+
+
+def tuned_params(con, name, estimator, grid, X, y, splits, product=store.PRODUCT, n_jobs=-1):
+    # registry hit → reuse; otherwise search on the inner folds and register
+    params = store.registered_params(con, name, search_space=grid, product=product)
+    if params is None:
+        params, score, _ = successive_halving(estimator, grid, X, y, inner_splits(splits), n_jobs=n_jobs)
+        store.register_model(con, name, params, score, "mean validation R²",
+                             search_space=grid, product=product)
+    return params
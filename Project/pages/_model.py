@@ -0,0 +1,839 @@
+from dash import html, dcc
+
+import time
+
+import numpy as np
+import pandas as pd
+
+import plotly.graph_objects as go
+from plotly.subplots import make_subplots
+
+from sklearn.linear_model import LinearRegression
+from sklearn.tree import DecisionTreeRegressor
+from sklearn.ensemble import HistGradientBoostingRegressor
+from sklearn.metrics import (
+    r2_score,
+    mean_absolute_error,
+    mean_squared_error,
+)
+
+from core import store
+from core.design import PRECISION, normal_solve
+from core.encoding import SparseLinearRegression
+from core.features import lag_features
+from core.figures import encode_figure, payload_report
+from core.forest import GrowingForest
+from core.hierarchy import HORIZON, hierarchical_backtest, levels, reconciled_forecast
+from core.hurdle import HurdleRegressor
+from core.pipeline import FeaturePipeline, pipeline_path
+from core.intermittent import IntermittentForecaster
+from core.smoothing import SmoothingForecaster
+from core.scenario import ScenarioEngine, future_frame
+from core.shared import open_plane
+from core.pooled import compare_global
+from core.intervals import LEVEL, N_BOOT, linear_bootstrap_interval, forest_interval
+from core.tuning import DT_GRID, HGB_GRID, RF_GRID, block_splits, tuned_params
+
+# =========================================================
+# LOAD DATA
+# =========================================================
+con = store.connect()
+# shared-memory data plane: the enriched table and the design are mapped
+# once per dataset version and shared with every other process
+plane = open_plane(con)
+df = plane.enriched_frame(store.PRODUCT)
+
+y = df["Total_Order_Demand"].values.reshape(-1, 1)
+
+# one-hot design with bias column, shared by all products;
+# everything below works on zero-copy views of it
+X_with_bias = plane.design[plane.rows(store.PRODUCT)]
+X_np = X_with_bias[:, 1:]
+X_columns = plane.design_columns[1:]
+
+# fitted feature pipeline: column vocabulary/order and future-day fills,
+# saved so scoring new dates never needs the history again
+pipeline = FeaturePipeline().fit(df)
+pipeline.save(pipeline_path(store.PRODUCT))
+if pipeline.columns != X_columns:
+    raise ValueError(f"pipeline columns {pipeline.columns} do not match the design {X_columns}")
+
+y_np = y.astype(PRECISION)
+
+total_rows = len(X_np)
+num_blocks = 6
+block_size = total_rows // num_blocks
+test_size = 100
+train_size = block_size - test_size
+
+# =========================================================
+# MANUAL NORMAL EQUATION
+# =========================================================
+
+X_test_blocks_manual = []
+y_test_blocks_manual = []
+y_pred_blocks_manual = []
+band_blocks_manual = []
+R2_blocks_manual = []
+SSE_blocks_manual = []
+MSE_blocks_manual = []
+
+block_id = 1
+
+for start in range(0, total_rows, block_size):
+    if start + block_size > total_rows:
+        break
+
+    X_train = X_with_bias[start:start+train_size]
+    X_test  = X_with_bias[start+train_size:start+block_size]
+    y_train = y_np[start:start+train_size]
+    y_test  = y_np[start+train_size:start+block_size]
+
+    beta = normal_solve(X_train, y_train)
+
+    y_pred = X_test @ beta
+    band = linear_bootstrap_interval(X_train, y_train, X_test)
+
+    residual = y_test - y_pred
+    SSE = float(residual.T @ residual)
+    MSE = SSE / len(y_test)
+    SS_tot = float(np.sum((y_test - np.mean(y_test)) ** 2))
+    R2 = 1 - SSE / SS_tot
+
+    X_test_blocks_manual.append(X_test)
+    y_test_blocks_manual.append(y_test)
+    y_pred_blocks_manual.append(y_pred)
+    band_blocks_manual.append(band)
+    R2_blocks_manual.append(R2)
+    SSE_blocks_manual.append(SSE)
+    MSE_blocks_manual.append(MSE)
+
+    block_id += 1
+
+metrics_manual_df = pd.DataFrame({
+    "Block": list(range(1, 7)),
+    "SSE": np.round(SSE_blocks_manual, 2),
+    "MSE": np.round(MSE_blocks_manual, 2),
+    "R²": np.round(R2_blocks_manual, 4)
+})
+
+# =========================================================
+# SKLEARN MODELS
+# =========================================================
+
+def evaluate_model(model, X_train, y_train, X_test, y_test):
+    t0 = time.perf_counter()
+    model.fit(X_train, y_train.ravel())
+    fit_time = time.perf_counter() - t0
+    pred = model.predict(X_test)
+    return (
+        r2_score(y_test, pred),
+        mean_absolute_error(y_test, pred),
+        mean_squared_error(y_test, pred),
+        np.sqrt(mean_squared_error(y_test, pred)),
+        fit_time,
+        pred.reshape(-1,1)
+    )
+
+# tree hyperparameters come from the registry (successive-halving search
+# over the rolling blocks, run once per dataset)
+splits = block_splits(total_rows, num_blocks, test_size)
+dt_params = tuned_params(con, "DecisionTree", DecisionTreeRegressor, DT_GRID, X_np, y_np, splits)
+rf_params = tuned_params(con, "RandomForest", GrowingForest, RF_GRID, X_np, y_np, splits)
+hgb_params = tuned_params(con, "HistGradientBoosting", HistGradientBoostingRegressor, HGB_GRID, X_np, y_np, splits)
+
+registry_df = store.registry_frame(con)
+
+# lagged demand, rolling sums/means/max, order counts and days since the
+# last order — all computed from demand up to the previous day
+lag_df = lag_features(df)
+X_lags_np = np.hstack((X_np, lag_df.to_numpy(dtype=PRECISION)))
+
+# intermittent-demand and exponential smoothing forecasters read the demand
+# series itself (only the days before the one being forecast)
+# base columns plus month and weekday dummies as a CSR matrix (persisted
+# pipeline), fitted through sparse normal equations
+calendar_pipeline = FeaturePipeline(calendar=["Month", "Weekday"]).fit(df)
+calendar_pipeline.save(pipeline_path(f"{store.PRODUCT}_calendar"))
+X_calendar = calendar_pipeline.transform(df, sparse=True)
+
+designs = {"base": X_np, "lags": X_lags_np, "demand": y_np, "calendar": X_calendar}
+
+model_family = {
+    "LinearRegression": (lambda: LinearRegression(), "base"),
+    "DecisionTree": (lambda: DecisionTreeRegressor(**dt_params), "base"),
+    "RandomForest": (lambda: GrowingForest(**rf_params, n_jobs=-1), "base"),
+    "HistGradientBoosting": (lambda: HistGradientBoostingRegressor(**hgb_params), "base"),
+    "Hurdle": (lambda: HurdleRegressor(), "base"),
+    "LinearRegression+Lags": (lambda: LinearRegression(), "lags"),
+    "Croston": (lambda: IntermittentForecaster("croston"), "demand"),
+    "SBA": (lambda: IntermittentForecaster("sba"), "demand"),
+    "TSB": (lambda: IntermittentForecaster("tsb"), "demand"),
+    "SES": (lambda: SmoothingForecaster("ses"), "demand"),
+    "Holt": (lambda: SmoothingForecaster("holt"), "demand"),
+    "HoltWinters": (lambda: SmoothingForecaster("holt_winters"), "demand"),
+    "LinearRegression+Calendar": (lambda: SparseLinearRegression(), "calendar"),
+}
+
+# one line per model for the page, in model_family order (same order and
+# names as the results tables)
+model_notes = {
+    "LinearRegression": "ordinary least squares on the base features",
+    "DecisionTree": "DecisionTreeRegressor (tuned)",
+    "RandomForest": "RandomForestRegressor (tuned, multi-threaded, subsampled, grown with "
+                    "warm start until the out-of-bag R² stops improving)",
+    "HistGradientBoosting": "HistGradientBoostingRegressor (tuned)",
+    "Hurdle": "logistic P(demand > 0) fitted by IRLS × OLS size model on nonzero days",
+    "LinearRegression+Lags": "adds lags (1/7/14/28 days), 7/28-day rolling sum/mean/max, order "
+                             "counts and days since the last order, all from demand up to the previous day",
+    "Croston": "intermittent-demand smoothing on the demand series alone (one-step ahead, "
+               "smoothing constants picked on the training days)",
+    "SBA": "Croston with the Syntetos–Boylan bias correction, same setup",
+    "TSB": "Teunter–Syntetos–Babai: smoothed demand probability × size, same setup",
+    "SES": "simple exponential smoothing, same one-step-ahead setup",
+    "Holt": "exponential smoothing with trend, same setup",
+    "HoltWinters": "trend and weekly-seasonal exponential smoothing, same setup",
+    "LinearRegression+Calendar": "month dummies in place of the season ones, plus weekday dummies, "
+                                 "encoded as a sparse matrix and solved through sparse normal equations",
+}
+models_text = "\n".join(
+    f"{i}. **{name}** – {model_notes[name]}" for i, name in enumerate(model_family, start=1)
+)
+
+results = []
+y_test_blocks = []
+preds = {name: [] for name in model_family}
+band_RF = []
+
+block_id = 1
+
+for start in range(0, total_rows, block_size):
+    if start + block_size > total_rows:
+        break
+
+    y_train = y_np[start:start+train_size]
+    y_test  = y_np[start+train_size:start+block_size]
+
+    y_test_blocks.append(y_test)
+
+    for name, (make_model, design) in model_family.items():
+        X_train = designs[design][start:start+train_size]
+        X_test  = designs[design][start+train_size:start+block_size]
+
+        model = make_model()
+        r2, mae, mse, rmse, fit_time, p = evaluate_model(
+            model, X_train, y_train, X_test, y_test
+        )
+        preds[name].append(p)
+        results.append([block_id, name, r2, mae, mse, rmse, fit_time])
+
+        if name == "RandomForest":
+            band_RF.append(forest_interval(model, X_test))
+
+    block_id += 1
+
+pred_LR = preds["LinearRegression"]
+pred_DT = preds["DecisionTree"]
+pred_RF = preds["RandomForest"]
+pred_HU = preds["Hurdle"]
+pred_HGB = preds["HistGradientBoosting"]
+
+# LinearRegression is the same OLS fit as the manual normal equation,
+# so it shares the bootstrap bands
+band_LR = band_blocks_manual
+
+results_df = pd.DataFrame(
+    results,
+    columns=["Block","Model","R2","MAE","MSE","RMSE","Fit_s"]
+)
+
+# accuracy vs cost per model over the 6 blocks
+cost_df = (
+    results_df.groupby("Model", sort=False)
+    .agg(Mean_R2=("R2","mean"), Mean_MAE=("MAE","mean"), Total_Fit_s=("Fit_s","sum"))
+    .reset_index()
+)
+
+R2_LR = results_df[results_df.Model=="LinearRegression"]["R2"].values
+R2_DT = results_df[results_df.Model=="DecisionTree"]["R2"].values
+R2_RF = results_df[results_df.Model=="RandomForest"]["R2"].values
+R2_HU = results_df[results_df.Model=="Hurdle"]["R2"].values
+R2_HGB = results_df[results_df.Model=="HistGradientBoosting"]["R2"].values
+
+best_models_df = results_df.loc[
+    results_df.groupby("Block")["R2"].idxmax(),
+    ["Block","Model","R2"]
+]
+
+best_models_df.columns = ["Block","Best Model","R²"]
+
+wins_text = "\n".join(
+    f"- **{name} wins {int((best_models_df['Best Model']==name).sum())}/6 blocks**"
+    for name in model_family
+)
+
+# insights computed from the block results (the table above is the evidence)
+r2_std = results_df.groupby("Model", sort=False)["R2"].std()
+wins = best_models_df["Best Model"].value_counts()
+best_r2 = cost_df.loc[cost_df.Mean_R2.idxmax()]
+best_mae = cost_df.loc[cost_df.Mean_MAE.idxmin()]
+near_best = cost_df[cost_df.Mean_R2 >= best_r2.Mean_R2 - 0.01]
+cheapest = near_best.loc[near_best.Total_Fit_s.idxmin()]
+stable = r2_std[near_best.Model].idxmin()
+insights_text = "\n".join([
+    f"- **{best_r2.Model}** has the highest mean R² ({best_r2.Mean_R2:.3f}); "
+    f"**{best_mae.Model}** the lowest mean MAE ({best_mae.Mean_MAE:.1f}).",
+    f"- **{wins.index[0]}** wins the most blocks ({wins.iloc[0]}/6).",
+    f"- Among the models within 0.01 R² of the best, **{stable}** varies least "
+    f"across blocks (R² std {r2_std[stable]:.3f}) and **{cheapest.Model}** is the "
+    f"cheapest to fit ({cheapest.Total_Fit_s:.3f} s for 6 blocks).",
+])
+conclusion_text = (
+    f"**{cheapest.Model}** gives accuracy within 0.01 R² of the best model "
+    f"at the lowest fitting cost on this product's rolling blocks."
+)
+
+# persist per-block predictions to the store
+store.write_model_outputs(con, "ManualNormalEquation",
+                          y_test_blocks_manual, y_pred_blocks_manual)
+for name in model_family:
+    store.write_model_outputs(con, name, y_test_blocks, preds[name])
+
+# =========================================================
+# HIERARCHICAL FORECASTS (warehouse → category → product)
+# =========================================================
+hierarchy_df = hierarchical_backtest(con, splits)
+
+# coherent forecast of every node for the next HORIZON days
+hierarchy_forecast_df = reconciled_forecast(con, HORIZON)
+hierarchy_levels = levels(hierarchy_forecast_df.drop_duplicates("Node"))
+hierarchy_totals_df = (
+    hierarchy_forecast_df.groupby(["Level", "Node"], sort=False)[["Base", "Forecast"]]
+    .sum().reset_index()
+    .rename(columns={"Base": f"Base, next {HORIZON} days",
+                     "Forecast": f"Coherent forecast, next {HORIZON} days"})
+)
+
+# =========================================================
+# GLOBAL MODEL (one pooled model across all products)
+# =========================================================
+global_metrics_df, global_cost_df = compare_global(con, splits)
+global_product_df = global_metrics_df.pivot_table(
+    index="Product_Code", columns="Approach", values=["R2", "MAE"], sort=False
+)
+global_product_df.columns = [f"{metric} ({approach})" for metric, approach in global_product_df.columns]
+global_product_df = global_product_df.reset_index()
+
+# =========================================================
+# WHAT-IF SCENARIOS (next year, linear model on full history)
+# =========================================================
+beta_full = normal_solve(X_with_bias, y_np)
+
+future_df = future_frame(start=df["Date"].max() + pd.Timedelta(days=1), periods=365)
+scenario_engine = ScenarioEngine(
+    beta_full, pipeline.columns,
+    pipeline.transform(future_df, PRECISION, bias=True),
+    future_df["Date"],
+)
+
+SCENARIO_PRESETS = {
+    "Baseline (no promotion)": {"Promotion": []},
+    "Autumn Fridays": {"Promotion": scenario_engine.days([9, 10, 11], [4])},
+    "Spring Fridays": {"Promotion": scenario_engine.days([3, 4, 5], [4])},
+    "Q4 weekdays": {"Promotion": scenario_engine.days([10, 11, 12], [0, 1, 2, 3, 4])},
+    "No Black Friday": {"Black_Friday": []},
+}
+
+MONTH_NAMES = ["Jan", "Feb", "Mar", "Apr", "May", "Jun",
+               "Jul", "Aug", "Sep", "Oct", "Nov", "Dec"]
+WEEKDAY_NAMES = ["Mon", "Tue", "Wed", "Thu", "Fri", "Sat", "Sun"]
+
+# =========================================================
+# HELPER — ADD TABLE
+# =========================================================
+def make_table_from_df(df):
+    header = [html.Th(col) for col in df.columns]
+    rows = [
+        html.Tr([html.Td(df.iloc[i,j]) for j in range(df.shape[1])])
+        for i in range(df.shape[0])
+    ]
+    return html.Table(
+        [html.Tr(header)] + rows,
+        style={"width":"100%", "borderCollapse":"collapse"}
+    )
+# =========================================================
+# PLOTS (Manual + sklearn)
+# =========================================================
+
+def add_band(fig, band, row, col, showlegend):
+    lo, hi = band
+    x = list(range(len(lo)))
+    fig.add_trace(go.Scatter(
+        x=x, y=lo,
+        mode="lines", line=dict(width=0),
+        hoverinfo="skip", showlegend=False
+    ), row=row, col=col)
+    fig.add_trace(go.Scatter(
+        x=x, y=hi,
+        mode="lines", line=dict(width=0),
+        fill="tonexty", fillcolor="rgba(42,114,212,0.18)",
+        name=f"{int(LEVEL*100)}% interval",
+        showlegend=showlegend
+    ), row=row, col=col)
+
+
+def plot_manual_blocks():
+    fig = make_subplots(rows=2, cols=3,
+                        subplot_titles=[f"Block {i}" for i in range(1,7)])
+    for i in range(6):
+        row = i//3 + 1
+        col = i%3 + 1
+
+        y_true = y_test_blocks_manual[i].flatten()
+        y_pred = y_pred_blocks_manual[i].flatten()
+
+        add_band(fig, band_blocks_manual[i], row, col, showlegend=(i==0))
+
+        fig.add_trace(go.Scatter(
+            x=list(range(len(y_true))),
+            y=y_true,
+            mode="lines",
+            name="Actual",
+            showlegend=(i==0)
+        ), row=row, col=col)
+
+        fig.add_trace(go.Scatter(
+            x=list(range(len(y_pred))),
+            y=y_pred,
+            mode="lines",
+            name="Predicted",
+            line=dict(dash="dash"),
+            showlegend=(i==0)
+        ), row=row, col=col)
+
+        fig.add_annotation(
+            x=0.02, y=0.90,
+            xref=f"x{i+1}", yref=f"y{i+1}",
+            text=f"R² = {R2_blocks_manual[i]:.4f}",
+            showarrow=False,
+            bgcolor="white", opacity=0.7,
+            font=dict(size=11)
+        )
+
+    fig.update_layout(
+        height=650, template="plotly_white",
+        title="Manual Linear Regression (Normal Equation) — 6 Rolling Blocks"
+    )
+    return fig
+
+
+fig_manual_blocks = plot_manual_blocks()
+
+
+# MODEL FIGURES
+def plot_model_blocks(model_name, y_test_blocks, pred_blocks, R2_values,
+                      band_blocks=None):
+    fig = make_subplots(rows=2, cols=3,
+                        subplot_titles=[f"Block {i}" for i in range(1,7)])
+
+    for i in range(6):
+        row = i//3 + 1
+        col = i%3 + 1
+
+        yt = y_test_blocks[i].flatten()
+        yp = pred_blocks[i].flatten()
+
+        if band_blocks is not None:
+            add_band(fig, band_blocks[i], row, col, showlegend=(i==0))
+
+        fig.add_trace(go.Scatter(
+            x=list(range(len(yt))), y=yt,
+            mode="lines", name="Actual",
+            showlegend=(i==0)
+        ), row=row, col=col)
+
+        fig.add_trace(go.Scatter(
+            x=list(range(len(yp))), y=yp,
+            mode="lines", name="Predicted",
+            line=dict(dash="dash"),
+            showlegend=(i==0)
+        ), row=row, col=col)
+
+        fig.add_annotation(
+            x=0.02, y=0.90,
+            xref=f"x{i+1}", yref=f"y{i+1}",
+            text=f"R² = {R2_values[i]:.4f}",
+            showarrow=False,
+            bgcolor="white", opacity=0.7,
+            font=dict(size=11)
+        )
+
+    fig.update_layout(
+        height=650,
+        template="plotly_white",
+        title=f"{model_name} — Actual vs Predicted (6 Blocks)"
+    )
+    return fig
+
+
+fig_LR_blocks = plot_model_blocks("Linear Regression",
+                                  y_test_blocks, pred_LR, R2_LR, band_LR)
+fig_DT_blocks = plot_model_blocks("Decision Tree",
+                                  y_test_blocks, pred_DT, R2_DT)
+fig_RF_blocks = plot_model_blocks("Random Forest",
+                                  y_test_blocks, pred_RF, R2_RF, band_RF)
+fig_HU_blocks = plot_model_blocks("Hurdle (Logistic × OLS)",
+                                  y_test_blocks, pred_HU, R2_HU)
+fig_HGB_blocks = plot_model_blocks("Histogram Gradient Boosting",
+                                   y_test_blocks, pred_HGB, R2_HGB)
+
+
+# R2 Comparison Chart
+fig_r2_compare = go.Figure()
+blocks_range = list(range(1,7))
+
+for name in model_family:
+    fig_r2_compare.add_trace(go.Scatter(
+        x=blocks_range,
+        y=results_df[results_df.Model==name]["R2"].values,
+        mode="lines+markers",
+        name=name
+    ))
+
+fig_r2_compare.update_layout(
+    title="R² Across Time Blocks (Model Comparison)",
+    xaxis_title="Block",
+    yaxis_title="R²",
+    template="plotly_white"
+)
+
+
+# Coherent daily forecast: top node and the level below it
+fig_hierarchy = go.Figure()
+for level in hierarchy_levels[:2]:
+    for node, g in hierarchy_forecast_df[hierarchy_forecast_df.Level == level].groupby("Node", sort=False):
+        fig_hierarchy.add_trace(go.Scatter(
+            x=g["Date"], y=g["Forecast"], mode="lines", name=node,
+            stackgroup=None if level == hierarchy_levels[0] else "children",
+            line=dict(width=3) if level == hierarchy_levels[0] else None,
+        ))
+fig_hierarchy.update_layout(
+    title=f"Coherent Forecast, Next {HORIZON} Days ({hierarchy_levels[1]} areas sum to {hierarchy_levels[0]})",
+    xaxis_title="Date", yaxis_title="Forecast demand",
+    template="plotly_white"
+)
+
+
+# Payload of the block figures: JSON lists vs compact encoding (typed
+# arrays, implicit x); figure_payloads feed the browser parse timing
+block_figures = [fig_manual_blocks, fig_LR_blocks, fig_DT_blocks,
+                 fig_RF_blocks, fig_HU_blocks, fig_HGB_blocks]
+payload_df, figure_payloads = payload_report(block_figures)
+payload_json = payload_df.loc[payload_df.Encoding == "JSON lists", "KiB"].iloc[0]
+payload_compact = payload_df.loc[payload_df.Encoding == "Compact", "KiB"].iloc[0]
+
+
+# Scenario comparison (recomputed on every control change; the callback
+# itself is registered in pages/model.py)
+def update_scenarios(months, weekdays, black_friday):
+    current = {"Promotion": scenario_engine.days(months or [], weekdays or [])}
+    if not black_friday:
+        current["Black_Friday"] = []
+
+    names = list(SCENARIO_PRESETS) + ["Your scenario"]
+    preds, table = scenario_engine.compare(
+        list(SCENARIO_PRESETS.values()) + [current], names
+    )
+
+    fig = go.Figure()
+    fig.add_trace(go.Scatter(
+        x=scenario_engine.dates, y=np.maximum(scenario_engine.base, 0),
+        mode="lines", name="Baseline calendar",
+        line=dict(color="#9bb7d4")
+    ))
+    fig.add_trace(go.Scatter(
+        x=scenario_engine.dates, y=preds[-1],
+        mode="lines", name="Your scenario",
+        line=dict(color="#2a72d4")
+    ))
+    fig.update_layout(
+        title="Forecast Demand — Baseline vs Your Scenario",
+        xaxis_title="Date", yaxis_title="Forecast demand",
+        template="plotly_white"
+    )
+    return encode_figure(fig), make_table_from_df(
+        table.round({"Total demand":0, "Uplift vs baseline":0, "Uplift %":1})
+    )
+
+
+# =========================================================
+# FINAL LAYOUT
+# =========================================================
+
+layout = html.Div(
+    className="page fade-in",
+    children=[
+
+        html.H2("Model Performance",
+                className="section-title"),
+
+        # I. Manual Normal Equation
+        html.Div(
+            className="data-card",
+            children=[
+                html.H3("I. Manual Linear Regression (using Normal Equation)",
+                        className="sub-title"),
+                dcc.Markdown(
+                    """
+The dataset is divided into **6 consecutive rolling blocks**.
+Each block contains:
+
+- **Train:** first 204 observations  
+- **Test:** next 100 observations  
+- Coefficients estimated using the **Normal Equation**  
+
+For each block we compute **SSE, MSE, and R²**.
+                    """
+                ),
+                make_table_from_df(metrics_manual_df),
+                html.Br(),
+                dcc.Graph(figure=encode_figure(fig_manual_blocks)),
+            ],
+        ),
+
+        # II. sklearn Models
+        html.Div(
+            className="data-card",
+            children=[
+                html.H3(f"II. Performance Comparison of {len(model_family)} Models",
+                        className="sub-title"),
+                dcc.Markdown(
+                    f"""
+Models evaluated:
+
+{models_text}
+
+Metrics:
+
+- R²  
+- MAE  
+- MSE  
+- RMSE  
+- Fit_s – training time in seconds, to weigh accuracy against cost
+                    """
+                ),
+                make_table_from_df(
+                    results_df.round({"R2":4,"MAE":2,"MSE":2,"RMSE":2,"Fit_s":3})
+                ),
+                html.Br(),
+                html.H4("Accuracy vs Cost", className="sub-title"),
+                make_table_from_df(
+                    cost_df.round({"Mean_R2":4,"Mean_MAE":2,"Total_Fit_s":3})
+                ),
+                html.Br(),
+                html.H4("Tuned Hyperparameters", className="sub-title"),
+                dcc.Markdown(
+                    """
+Tree models are tuned by **successive halving** over the same rolling blocks:
+every configuration is scored on the earliest block first, only the top third
+moves on to more blocks, and the winner is stored in the model registry.
+Validation uses the last 50 training days of each block, never its test days.
+                    """
+                ),
+                make_table_from_df(registry_df.round({"Score":4})),
+                html.Br(),
+                html.H4("R² Across Blocks", className="sub-title"),
+                dcc.Graph(figure=encode_figure(fig_r2_compare)),
+            ],
+        ),
+
+        # III. Actual vs Predicted
+        html.Div(
+            className="data-card",
+            children=[
+                html.H3("III. Actual vs Predicted (6 Blocks per Model)",
+                        className="sub-title"),
+                dcc.Markdown(
+                    f"""
+Shaded bands are **{int(LEVEL*100)}% prediction intervals**:
+
+- **Linear Regression:** residual bootstrap ({N_BOOT} resamples refit in one matrix product)  
+- **Random Forest:** quantiles of the per-tree predictions  
+                    """
+                ),
+
+                html.H4("1. Linear Regression"),
+                dcc.Graph(figure=encode_figure(fig_LR_blocks)),
+
+                html.H4("2. Decision Tree", style={"marginTop":"25px"}),
+                dcc.Graph(figure=encode_figure(fig_DT_blocks)),
+
+                html.H4("3. Random Forest", style={"marginTop":"25px"}),
+                dcc.Graph(figure=encode_figure(fig_RF_blocks)),
+
+                html.H4("4. Hurdle (zero-inflated)", style={"marginTop":"25px"}),
+                dcc.Graph(figure=encode_figure(fig_HU_blocks)),
+
+                html.H4("5. Histogram Gradient Boosting", style={"marginTop":"25px"}),
+                dcc.Graph(figure=encode_figure(fig_HGB_blocks)),
+            ],
+        ),
+
+        # IV. Best Model Summary
+        html.Div(
+            className="data-card",
+            children=[
+                html.H3("IV. Best Performing Model per Block",
+                        className="sub-title"),
+
+                make_table_from_df(best_models_df.round({"R²":4})),
+                html.Br(),
+
+                dcc.Markdown(
+                    f"""
+### Summary
+{wins_text}
+
+### Insights
+{insights_text}
+
+### Conclusion
+{conclusion_text}
+                    """
+                ),
+            ],
+        ),
+
+        # V. Hierarchical forecasts
+        html.Div(
+            className="data-card",
+            children=[
+                html.H3("V. Coherent Forecasts Across the Hierarchy",
+                        className="sub-title"),
+                dcc.Markdown(
+                    f"""
+Every node of **{" → ".join(hierarchy_levels)}** gets a base forecast
+(calendar features + its own 7/28-day rolling means) from one batched
+normal-equation solve, then the forecasts are **reconciled** with a sparse
+summing matrix so each level adds up exactly. Levels that only repeat the
+one above (e.g. a single warehouse) are left out.
+
+**Forecast for planning** – next {HORIZON} days
+({hierarchy_forecast_df['Date'].min().date()} → {hierarchy_forecast_df['Date'].max().date()}),
+models fitted on the full history, reconciled with **wls_var**, product
+forecasts floored at 0:
+                    """
+                ),
+                dcc.Graph(figure=encode_figure(fig_hierarchy)),
+                make_table_from_df(hierarchy_totals_df.round(0)),
+                dcc.Markdown(
+                    """
+**Backtest of the reconciliation methods** – mean MAE over the 6 blocks
+(base forecasts are not coherent):
+
+- **bottom_up:** sum the product forecasts  
+- **ols:** orthogonal projection onto coherent forecasts  
+- **wls_var:** projection weighted by each node's residual variance (the
+  diagonal approximation of MinT)  
+                    """
+                ),
+                make_table_from_df(hierarchy_df.round(1)),
+            ],
+        ),
+
+        # VI. What-if scenarios
+        html.Div(
+            className="data-card",
+            children=[
+                html.H3("VI. What-if Promotion Scenarios",
+                        className="sub-title"),
+                dcc.Markdown(
+                    f"""
+Toggle promotion days and Black Friday on the calendar for
+**{future_df['Date'].min().date()} → {future_df['Date'].max().date()}**.
+The linear model is fitted once on the full history; each scenario only
+adds **β × (flag change)** on the days that change, so all scenarios below
+are recomputed instantly.
+                    """
+                ),
+                html.Label("Promotion months"),
+                dcc.Dropdown(
+                    id="scenario-months",
+                    options=[{"label": m, "value": i + 1} for i, m in enumerate(MONTH_NAMES)],
+                    value=[9, 10, 11],
+                    multi=True,
+                ),
+                html.Label("Promotion weekdays", style={"marginTop":"10px"}),
+                dcc.Checklist(
+                    id="scenario-weekdays",
+                    options=[{"label": d, "value": i} for i, d in enumerate(WEEKDAY_NAMES)],
+                    value=[4],
+                    inline=True,
+                ),
+                dcc.Checklist(
+                    id="scenario-black-friday",
+                    options=[{"label": "Black Friday", "value": "on"}],
+                    value=["on"],
+                    style={"marginTop":"10px"},
+                ),
+                dcc.Graph(id="scenario-graph"),
+                html.Div(id="scenario-table"),
+            ],
+        ),
+
+        # VII. Global model
+        html.Div(
+            className="data-card",
+            children=[
+                html.H3("VII. One Global Model vs Per-Product Models",
+                        className="sub-title"),
+                dcc.Markdown(
+                    f"""
+A single linear model is trained on the stacked table of all
+**{global_metrics_df['Product_Code'].nunique()} products**, streamed in mini-batches
+from the on-disk partitions. Month, weekday, holiday and promotion effects
+are shared; each product keeps its own level, order-count and promotion slope,
+and demand is scaled by the product's mean training demand so small,
+intermittent products borrow strength from the large ones.
+Both approaches use the same 6 rolling blocks (mean over blocks):
+                    """
+                ),
+                make_table_from_df(global_product_df.round(3)),
+                html.Br(),
+                html.H4("Accuracy vs Total Training Time", className="sub-title"),
+                make_table_from_df(
+                    global_cost_df.round({"Mean_R2":4,"Mean_MAE":2,"Total_Train_s":3})
+                ),
+            ],
+        ),
+
+        # VIII. Figure payload
+        html.Div(
+            className="data-card",
+            children=[
+                html.H3("VIII. Figure Payload Sent to the Browser",
+                        className="sub-title"),
+                dcc.Markdown(
+                    f"""
+The block figures above are sent in a compact encoding: numeric arrays as
+base64 typed arrays (whole numbers as the narrowest integer type, the rest
+as float32) and the index x axis as `x0`/`dx` instead of a list per trace.
+For the 6 block figures that is **{payload_compact:.0f} KiB instead of
+{payload_json:.0f} KiB** of JSON. Encode time is the server serializing the
+figures for one request (json vs orjson engine), decode time a JSON parse
+of the payload:
+                    """
+                ),
+                make_table_from_df(
+                    payload_df.round({"KiB":1, "Encode_ms":2, "Decode_ms":2})
+                ),
+                html.Br(),
+                html.Button("Measure parse time in this browser", id="payload-measure",
+                            n_clicks=0),
+                dcc.Store(id="payload-store"),
+                html.Div(id="payload-browser", style={"marginTop":"10px"}),
+            ],
+        ),
+    ],
+)
+
@@ -0,0 +1,74 @@
+import os
+import sys
+
+import numpy as np
+import pandas as pd
+import pytest
+
+PROJECT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, PROJECT_DIR)
+
+from core.encoding import (  # noqa: E402
+    SparseEncoder,
+    SparseLinearRegression,
+    SparseNormalEquations,
+    synthetic_pooled,
+)
+
+
+@pytest.fixture
+def frame():
+    return synthetic_pooled(6, n_days=200, seed=4)
+
+
+@pytest.fixture
+def encoder(frame):
+    return SparseEncoder(
+        categorical=["Product_Code"],
+        calendar=["Month", "Weekday"],
+        interactions=[("Product_Code", "Promotion")],
+    ).fit(frame)
+
+
+def test_save_load_round_trip(encoder, frame, tmp_path):
+    path = str(tmp_path / "vocab" / "encoder.json")
+    encoder.save(path)
+    loaded = SparseEncoder.load(path)
+    assert loaded.feature_names_ == encoder.feature_names_
+    # new rows, including an unseen product, map onto the same columns
+    new = synthetic_pooled(8, n_days=30, seed=5)
+    assert (loaded.transform(new) != encoder.transform(new)).nnz == 0
+
+
+def test_transform_matches_get_dummies(frame):
+    encoder = SparseEncoder(categorical=["Warehouse"], calendar=["Weekday"]).fit(frame)
+    dense = pd.get_dummies(
+        frame.assign(Weekday=pd.to_datetime(frame["Date"]).dt.weekday)[
+            ["Order_Count", "Holiday", "Black_Friday", "Promotion", "Warehouse", "Weekday"]
+        ],
+        columns=["Warehouse", "Weekday"], drop_first=True, dtype=float,
+    )
+    np.testing.assert_array_equal(encoder.transform(frame).toarray(), dense.to_numpy())
+
+
+def test_sparse_regression_equals_lstsq(encoder, frame):
+    X = encoder.transform(frame)
+    y = frame["Total_Order_Demand"].to_numpy()
+    model = SparseLinearRegression().fit(X, y)
+    Xb = np.column_stack([np.ones(X.shape[0]), X.toarray()])
+    expected = np.linalg.lstsq(Xb, y, rcond=None)[0]
+    np.testing.assert_allclose(model.coef_, expected, rtol=1e-7, atol=1e-9)
+    np.testing.assert_allclose(model.predict(X), Xb @ expected, rtol=1e-7)
+
+
+def test_singular_system_returns_min_norm_solution(frame):
+    # Season next to Month is collinear: no hidden ridge, the min-norm
+    # solution like lstsq; Holiday / Black_Friday never occur and get β = 0
+    frame = frame.assign(Season=np.where(pd.to_datetime(frame["Date"]).dt.month <= 6, "H1", "H2"))
+    X = SparseEncoder(categorical=["Season"], calendar=["Month"]).fit_transform(frame)
+    y = frame["Total_Order_Demand"].to_numpy()
+    ne = SparseNormalEquations(X.shape[1])
+    ne.update(X, y)
+    Xb = np.column_stack([np.ones(X.shape[0]), X.toarray()])
+    expected = np.linalg.lstsq(Xb, y, rcond=None)[0]
+    np.testing.assert_allclose(ne.solve(), expected, rtol=1e-6, atol=1e-8)
@@ -0,0 +1,70 @@
+import html
+import os
+import re
+import sys
+
+import pytest
+
+PROJECT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+SNAPSHOT = os.path.join(PROJECT_DIR, "tests", "snapshots", "about.html")
+sys.path.insert(0, PROJECT_DIR)
+
+from core import export  # noqa: E402
+
+
+@pytest.fixture
+def exported_about(tmp_path, monkeypatch):
+    # the About page has no data behind it; the Bootstrap theme is served
+    # from a local file so the test runs offline
+    monkeypatch.chdir(PROJECT_DIR)
+    from app import app
+
+    theme = tmp_path / "bootstrap.min.css"
+    theme.write_text("body { margin: 0 }\n/*# sourceMappingURL=bootstrap.min.css.map */")
+    monkeypatch.setattr(app.config, "external_stylesheets", [theme.as_uri()], raising=False)
+
+    out_dir = tmp_path / "site"
+    export.export_site(app, str(out_dir), paths=["/about"], vendor_dir=str(tmp_path / "vendor"))
+    return app, out_dir, (out_dir / "about.html").read_text(encoding="utf-8")
+
+
+def _normalize(text):
+    # content hashes change with every asset edit
+    return re.sub(r"\.[0-9a-f]{12}\.", ".HASH.", text)
+
+
+def _texts(component):
+    for c in export._walk(component):
+        children = getattr(c, "children", None)
+        for child in children if isinstance(children, (list, tuple)) else [children]:
+            if isinstance(child, str) and child.strip():
+                yield child.strip()
+
+
+def test_export_matches_snapshot(exported_about):
+    _, _, page = exported_about
+    # UPDATE_SNAPSHOTS=1 rewrites the snapshot after an intended change
+    if os.environ.get("UPDATE_SNAPSHOTS"):
+        with open(SNAPSHOT, "w", encoding="utf-8") as f:
+            f.write(_normalize(page))
+    with open(SNAPSHOT, encoding="utf-8") as f:
+        assert _normalize(page) == f.read()
+
+
+def test_export_renders_the_live_layout(exported_about):
+    import dash
+
+    _, _, page = exported_about
+    live = dash.page_registry["pages.about"]["layout"]
+    live = live() if callable(live) else live
+    missing = [t for t in _texts(live) if html.escape(t, quote=False) not in page]
+    assert missing == []
+
+
+def test_export_bundles_external_stylesheets(exported_about):
+    _, out_dir, page = exported_about
+    links = re.findall(r'<link rel="stylesheet" href="([^"]+)">', page)
+    assert links and all(link.startswith("assets/") for link in links)
+    assert all((out_dir / link).exists() for link in links)
+    theme = next(link for link in links if "bootstrap.min" in link)
+    assert "sourceMappingURL" not in (out_dir / theme).read_text(encoding="utf-8")
@@ -0,0 +1,53 @@
+import os
+import sys
+
+import numpy as np
+import pandas as pd
+import pytest
+
+PROJECT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, PROJECT_DIR)
+
+from core.features import TARGET, lag_features  # noqa: E402
+
+
+@pytest.fixture
+def long_df():
+    # three products of different lengths, intermittent demand, sorted by product/day
+    rng = np.random.default_rng(0)
+    frames = []
+    for code, n in [("A", 40), ("B", 35), ("C", 50)]:
+        demand = rng.poisson(3, n) * (rng.random(n) < 0.4)
+        frames.append(pd.DataFrame({"Product_Code": code, "Day": np.arange(n), TARGET: demand}))
+    return pd.concat(frames, ignore_index=True)
+
+
+def test_features_never_see_day_t_or_later(long_df):
+    base = lag_features(long_df)
+    for t in [0, 5, 39, 40, 41, 60, 100]:
+        # scramble demand from row t onward; rows before t must not change,
+        # and neither may row t itself
+        changed = long_df.copy()
+        changed.loc[t:, TARGET] = 1000 + np.arange(len(changed) - t)
+        feats = lag_features(changed)
+        pd.testing.assert_frame_equal(feats.iloc[:t + 1], base.iloc[:t + 1])
+
+
+def test_features_match_per_product_loop(long_df):
+    feats = lag_features(long_df)
+    for code, g in long_df.groupby("Product_Code", sort=False):
+        y = g[TARGET].to_numpy(dtype=float)
+        f = feats.loc[g.index]
+        for t in range(len(y)):
+            past = y[:t]
+            for k in (1, 7, 14, 28):
+                assert f[f"lag_{k}"].iloc[t] == (y[t - k] if t >= k else 0.0)
+            for w in (7, 28):
+                win = past[-w:]
+                assert f[f"roll_sum_{w}"].iloc[t] == pytest.approx(win.sum())
+                assert f[f"roll_mean_{w}"].iloc[t] == pytest.approx(win.mean() if len(win) else 0.0)
+                assert f[f"roll_max_{w}"].iloc[t] == (win.max() if len(win) else 0.0)
+                assert f[f"orders_{w}"].iloc[t] == (win > 0).sum()
+            hits = np.flatnonzero(past > 0)
+            expected = t - hits[-1] if len(hits) else t + 1
+            assert f["days_since_order"].iloc[t] == expected
@@ -0,0 +1,66 @@
+import os
+import sys
+
+import numpy as np
+import pandas as pd
+import pytest
+
+PROJECT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, PROJECT_DIR)
+
+from core.hierarchy import METHODS, levels, reconcile, summing_matrix  # noqa: E402
+
+
+@pytest.fixture
+def hierarchy():
+    # 2 warehouses, 3 (warehouse, category) nodes, 5 products
+    keys = pd.DataFrame(
+        [("Whse_A", "Cat_1", "P1"), ("Whse_A", "Cat_1", "P2"), ("Whse_A", "Cat_2", "P3"),
+         ("Whse_B", "Cat_1", "P4"), ("Whse_B", "Cat_1", "P5")],
+        columns=["Warehouse", "Product_Category", "Product_Code"],
+    )
+    S, nodes = summing_matrix(keys)
+    rng = np.random.default_rng(11)
+    Y_hat = rng.gamma(2.0, 10.0, size=(14, S.shape[0]))      # incoherent base forecasts
+    resid_var = rng.uniform(0.5, 5.0, size=S.shape[0])
+    return S, nodes, Y_hat, resid_var
+
+
+def test_summing_matrix_levels(hierarchy):
+    S, nodes, _, _ = hierarchy
+    assert S.shape == (1 + 2 + 3 + 5, 5)
+    assert levels(nodes) == ["Total", "Warehouse", "Category", "Product"]
+    np.testing.assert_array_equal(S[0].toarray(), np.ones((1, 5)))
+
+
+@pytest.mark.parametrize("method", [m for m in METHODS if m != "base"])
+def test_reconciled_forecast_is_coherent(hierarchy, method):
+    S, _, Y_hat, resid_var = hierarchy
+    n_nodes, m = S.shape
+    Y_rec = reconcile(S, Y_hat, method, resid_var)
+    bottom = Y_rec[:, n_nodes - m:]
+    np.testing.assert_allclose((S @ bottom.T).T, Y_rec, rtol=1e-10)
+
+
+@pytest.mark.parametrize("method", ["ols", "wls_var"])
+def test_coherent_base_forecast_is_left_unchanged(hierarchy, method):
+    # projection methods must be the identity on already coherent forecasts
+    S, _, Y_hat, resid_var = hierarchy
+    n_nodes, m = S.shape
+    coherent = (S @ Y_hat[:, n_nodes - m:].T).T
+    np.testing.assert_allclose(reconcile(S, coherent, method, resid_var), coherent, rtol=1e-10)
+
+
+def test_wls_var_matches_dense_generalised_least_squares(hierarchy):
+    S, _, Y_hat, resid_var = hierarchy
+    Sd = S.toarray()
+    W_inv = np.diag(1.0 / resid_var)
+    P = np.linalg.solve(Sd.T @ W_inv @ Sd, Sd.T @ W_inv)
+    expected = (Sd @ P @ Y_hat.T).T
+    np.testing.assert_allclose(reconcile(S, Y_hat, "wls_var", resid_var), expected, rtol=1e-10)
+
+
+def test_unknown_method_is_rejected(hierarchy):
+    S, _, Y_hat, resid_var = hierarchy
+    with pytest.raises(ValueError):
+        reconcile(S, Y_hat, "mint", resid_var)
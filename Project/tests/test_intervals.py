@@ -0,0 +1,46 @@
+import os
+import sys
+
+import numpy as np
+import pytest
+
+PROJECT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, PROJECT_DIR)
+
+from core.intervals import LEVEL, linear_bootstrap_interval  # noqa: E402
+
+
+def _simulate(rng, n, noise):
+    X = np.column_stack([np.ones(n), rng.normal(size=(n, 3))])
+    y = X @ np.array([5.0, 2.0, -1.0, 0.5]) + noise(n)
+    return X, y
+
+
+@pytest.mark.parametrize("noise_name", ["normal", "skewed"])
+def test_bootstrap_coverage_is_about_level(noise_name):
+    rng = np.random.default_rng(7)
+    noise = {
+        "normal": lambda n: rng.normal(scale=2.0, size=n),
+        "skewed": lambda n: rng.exponential(scale=2.0, size=n),
+    }[noise_name]
+
+    # fresh train / test draws per repeat, coverage pooled over all test days
+    hits = []
+    for _ in range(10):
+        X_train, y_train = _simulate(rng, 400, noise)
+        X_test, y_test = _simulate(rng, 500, noise)
+        lo, hi = linear_bootstrap_interval(X_train, y_train, X_test, n_boot=500,
+                                           seed=int(rng.integers(1 << 31)))
+        hits.append((y_test >= lo) & (y_test <= hi))
+
+    coverage = np.concatenate(hits).mean()
+    assert abs(coverage - LEVEL) < 0.03
+
+
+def test_bootstrap_interval_brackets_the_ols_prediction():
+    rng = np.random.default_rng(3)
+    X_train, y_train = _simulate(rng, 300, lambda n: rng.normal(size=n))
+    X_test, _ = _simulate(rng, 50, lambda n: rng.normal(size=n))
+    lo, hi = linear_bootstrap_interval(X_train, y_train, X_test, n_boot=500)
+    pred = X_test @ np.linalg.lstsq(X_train, y_train, rcond=None)[0]
+    assert np.all(lo < pred) and np.all(pred < hi)
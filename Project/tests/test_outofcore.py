@@ -0,0 +1,80 @@
+import os
+import sys
+
+import numpy as np
+import pandas as pd
+import pytest
+
+PROJECT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, PROJECT_DIR)
+
+from core.design import SEASONS, encode  # noqa: E402
+from core.outofcore import (  # noqa: E402
+    TARGET,
+    NormalEquations,
+    fit_streaming,
+    partition_paths,
+    row_count,
+    streaming_block_backtest,
+)
+from core.tuning import block_splits  # noqa: E402
+
+
+def _with_bias(X):
+    return np.column_stack([np.ones(len(X)), X])
+
+
+@pytest.fixture
+def history():
+    # two years of one product's enriched rows
+    rng = np.random.default_rng(31)
+    dates = pd.date_range("2016-01-01", "2017-12-31")
+    n = len(dates)
+    frame = pd.DataFrame({
+        "Date": dates,
+        "Order_Count": rng.poisson(4, n),
+        "Season": np.array(SEASONS)[(dates.month.values % 12) // 3],
+        "Holiday": (rng.random(n) < 0.01).astype(int),
+        "Black_Friday": (rng.random(n) < 0.01).astype(int),
+        "Promotion": (rng.random(n) < 0.1).astype(int),
+    })
+    frame[TARGET] = 20 + 5 * frame["Order_Count"] + 30 * frame["Promotion"] + rng.normal(0, 3, n)
+    return frame
+
+
+@pytest.fixture
+def partitions(history, tmp_path):
+    for year, part in history.groupby(history["Date"].dt.year):
+        path = tmp_path / "product=P1" / f"year={year}.parquet"
+        path.parent.mkdir(parents=True, exist_ok=True)
+        part.to_parquet(path, index=False)
+    return partition_paths("P1", out_dir=str(tmp_path))
+
+
+def test_batched_normal_equations_equal_in_memory_lstsq(history):
+    X, y = encode(history), history[TARGET].to_numpy()
+    ne = NormalEquations(X.shape[1])
+    for start in range(0, len(y), 97):                  # uneven batches
+        ne.update(X[start:start + 97], y[start:start + 97])
+    ne.update(X[:0], y[:0])                             # empty batch is a no-op
+
+    expected = np.linalg.lstsq(_with_bias(X), y, rcond=None)[0]
+    assert ne.n == len(y)
+    np.testing.assert_allclose(ne.solve(), expected, rtol=1e-8, atol=1e-8)
+
+
+def test_streaming_fit_equals_in_memory_lstsq(history, partitions):
+    assert row_count(partitions) == len(history)
+    X, y = encode(history), history[TARGET].to_numpy()
+    expected = np.linalg.lstsq(_with_bias(X), y, rcond=None)[0]
+    beta = fit_streaming(partitions, batch_rows=50)
+    np.testing.assert_allclose(beta, expected, rtol=1e-8, atol=1e-8)
+
+
+def test_streaming_backtest_equals_in_memory_blocks(history, partitions):
+    X, y = _with_bias(encode(history)), history[TARGET].to_numpy()
+    splits = block_splits(len(y))
+    table = streaming_block_backtest(partitions, splits, batch_rows=64)
+    for (train, test), mae in zip(splits, table["MAE"]):
+        beta = np.linalg.lstsq(X[train], y[train], rcond=None)[0]
+        assert mae == pytest.approx(np.mean(np.abs(y[test] - X[test] @ beta)), rel=1e-8)
@@ -0,0 +1,64 @@
+import os
+import sys
+
+import numpy as np
+import pytest
+
+PROJECT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, PROJECT_DIR)
+
+from core.design import SEASONS  # noqa: E402
+from core.encoding import SparseLinearRegression  # noqa: E402
+from core.pipeline import FeaturePipeline, pipeline_path  # noqa: E402
+from core.scenario import future_frame  # noqa: E402
+
+
+@pytest.fixture
+def history():
+    # one product's enriched history, without some seasons in it
+    rng = np.random.default_rng(41)
+    frame = future_frame("2016-03-01", 200)
+    frame["Season"] = np.where(frame["Date"].dt.month <= 5, "Spring", "Summer")
+    frame["Order_Count"] = rng.poisson(3, len(frame))
+    frame["Promotion"] = (rng.random(len(frame)) < 0.1).astype(int)
+    frame["Total_Order_Demand"] = 10 + 4 * frame["Order_Count"] + rng.normal(0, 1, len(frame))
+    return frame
+
+
+@pytest.mark.parametrize("kwargs", [{}, {"calendar": ["Month", "Weekday"]}])
+def test_save_load_round_trip(history, tmp_path, kwargs):
+    pipeline = FeaturePipeline(**kwargs).fit(history)
+    model = SparseLinearRegression().fit(pipeline.transform(history, sparse=True),
+                                         history["Total_Order_Demand"])
+    path = pipeline_path("test", out_dir=str(tmp_path))
+    pipeline.save(path)
+    loaded = FeaturePipeline.load(path)
+
+    # future days: no Order_Count, months and seasons the history never saw
+    future = future_frame("2016-10-01", 120)
+    assert loaded.columns == pipeline.columns
+    np.testing.assert_array_equal(loaded.transform(future), pipeline.transform(future))
+    np.testing.assert_array_equal(
+        model.predict(loaded.transform(future, sparse=True)),
+        model.predict(pipeline.transform(future, sparse=True)),
+    )
+
+
+def test_columns_keep_every_level(history):
+    pipeline = FeaturePipeline().fit(history)
+    seasons = [c for c in pipeline.columns if c.startswith("Season_")]
+    assert seasons == [f"Season_{s}" for s in SEASONS[1:]]
+
+    calendar = FeaturePipeline(calendar=["Month", "Weekday"]).fit(history)
+    # Season is a function of Month, so it is left out next to the month dummies
+    assert not [c for c in calendar.columns if c.startswith("Season_")]
+    assert len([c for c in calendar.columns if c.startswith("Month_")]) == 11
+    assert len([c for c in calendar.columns if c.startswith("Weekday_")]) == 6
+
+
+def test_future_order_count_is_the_monthly_mean(history):
+    pipeline = FeaturePipeline().fit(history)
+    future = future_frame("2017-04-01", 30)
+    X = pipeline.transform(future)
+    expected = history.loc[history["Date"].dt.month == 4, "Order_Count"].mean()
+    np.testing.assert_allclose(X[:, pipeline.columns.index("Order_Count")], expected)
@@ -0,0 +1,90 @@
+import os
+import sys
+
+import numpy as np
+import pandas as pd
+import pytest
+
+PROJECT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, PROJECT_DIR)
+
+from core import pooled  # noqa: E402
+from core.design import SEASONS  # noqa: E402
+from core.outofcore import READ_COLUMNS, TARGET  # noqa: E402
+from core.tuning import block_splits  # noqa: E402
+
+PRODUCTS = ["Product_0001", "Product_0002", "Product_0003", "Product_0004"]
+
+
+@pytest.fixture
+def catalogue(tmp_path, monkeypatch):
+    # four products, two years each, written as (product, year) partitions;
+    # the vocabulary goes to tmp_path instead of data/design
+    rng = np.random.default_rng(51)
+    dates = pd.date_range("2016-01-01", "2017-12-31")
+    n = len(dates)
+    frames = []
+    for i, product in enumerate(PRODUCTS):
+        level = 10.0 ** (i + 1)
+        frame = pd.DataFrame({
+            "Date": dates,
+            "Order_Count": rng.poisson(2 + i, n),
+            "Season": np.array(SEASONS)[(dates.month.values % 12) // 3],
+            "Holiday": (rng.random(n) < 0.01).astype(int),
+            "Black_Friday": (rng.random(n) < 0.01).astype(int),
+            "Promotion": (rng.random(n) < 0.1).astype(int),
+        })
+        frame[TARGET] = level * (1 + 0.1 * frame["Order_Count"] + 0.5 * frame["Promotion"]
+                                 + 0.2 * (dates.weekday.values >= 5) + rng.normal(0, 0.1, n))
+        for year, part in frame.groupby(dates.year):
+            path = tmp_path / "partitions" / f"product={product}" / f"year={year}.parquet"
+            path.parent.mkdir(parents=True, exist_ok=True)
+            part[READ_COLUMNS].to_parquet(path, index=False)
+        frames.append(frame.assign(Product_Code=product, Row=np.arange(n)))
+
+    vocab_path = str(tmp_path / "design" / "pooled_vocabulary.json")
+    encoder = pooled.pooled_encoder
+    monkeypatch.setattr(pooled, "pooled_encoder", lambda products: encoder(products, vocab_path))
+    return str(tmp_path / "partitions"), pd.concat(frames, ignore_index=True), vocab_path
+
+
+def _direct(stacked, splits):
+    # dense design of the whole stacked table, one lstsq per block
+    X = pooled.pooled_encoder(PRODUCTS).transform(stacked).toarray()
+    X = np.column_stack([np.ones(len(X)), X])
+    y = stacked[TARGET].to_numpy()
+    row = stacked["Row"].to_numpy()
+    out = []
+    for b, (train, test) in enumerate(splits):
+        in_train = (row >= train.start) & (row < train.stop)
+        scale = stacked.loc[in_train].groupby("Product_Code")[TARGET].mean()
+        scale = stacked["Product_Code"].map(scale).to_numpy()
+        beta = np.linalg.lstsq(X[in_train], y[in_train] / scale[in_train], rcond=None)[0]
+        in_test = (row >= test.start) & (row < test.stop)
+        pred = X[in_test] @ beta * scale[in_test]
+        g = stacked.loc[in_test, ["Product_Code"]].assign(err=np.abs(y[in_test] - pred))
+        for product, mae in g.groupby("Product_Code")["err"].mean().items():
+            out.append([product, b + 1, mae])
+    frame = pd.DataFrame(out, columns=["Product_Code", "Block", "MAE"])
+    return frame.sort_values(["Product_Code", "Block"], ignore_index=True)
+
+
+def test_pooled_fit_matches_direct_solve(catalogue):
+    out_dir, stacked, vocab_path = catalogue
+    splits = block_splits(stacked["Row"].max() + 1)
+    metrics = pooled.pooled_block_backtest(splits, PRODUCTS, batch_rows=300, out_dir=out_dir)
+    expected = _direct(stacked, splits)
+
+    assert os.path.exists(vocab_path)
+    assert len(metrics) == len(PRODUCTS) * len(splits)
+    keys = ["Product_Code", "Block"]
+    pd.testing.assert_frame_equal(metrics[keys], expected[keys])
+    np.testing.assert_allclose(metrics["MAE"], expected["MAE"], rtol=1e-6)
+
+
+def test_pooled_design_has_full_rank(catalogue):
+    # no one-hot block is a function of another, so XᵀX is nonsingular
+    _, stacked, _ = catalogue
+    X = pooled.pooled_encoder(PRODUCTS).transform(stacked).toarray()
+    X = np.column_stack([np.ones(len(X)), X])
+    assert np.linalg.matrix_rank(X) == X.shape[1]
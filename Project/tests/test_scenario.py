@@ -0,0 +1,64 @@
+import os
+import sys
+
+import numpy as np
+import pandas as pd
+import pytest
+
+PROJECT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, PROJECT_DIR)
+
+from core.scenario import FLAG_COLUMNS, ScenarioEngine  # noqa: E402
+
+COLUMNS = ["Holiday", "Black_Friday", "Promotion", "Order_Count"]
+
+
+@pytest.fixture
+def engine():
+    rng = np.random.default_rng(21)
+    dates = pd.date_range("2017-01-01", periods=90)
+    X = np.column_stack([
+        np.ones(len(dates)),
+        rng.random(len(dates)) < 0.05,
+        rng.random(len(dates)) < 0.05,
+        rng.random(len(dates)) < 0.2,
+        rng.poisson(3, len(dates)),
+    ]).astype(float)
+    beta = np.array([50.0, -10.0, 80.0, 25.0, 4.0])
+    return ScenarioEngine(beta, COLUMNS, X, dates), X, beta
+
+
+def _recompute(X, beta, scenario):
+    # rebuild the whole design with the scenario's flags and multiply again
+    X_new = X.copy()
+    for c in FLAG_COLUMNS:
+        if c in scenario:
+            col = 1 + COLUMNS.index(c)
+            X_new[:, col] = 0.0
+            X_new[np.asarray(scenario[c], dtype=int), col] = 1.0
+    return X_new @ beta
+
+
+def test_flag_deltas_equal_full_recompute(engine):
+    eng, X, beta = engine
+    scenarios = [
+        {},                                                         # baseline
+        {"Promotion": eng.days(months=[2], weekdays=[4, 5])},       # Fri/Sat promos in February
+        {"Promotion": []},                                          # no promotions at all
+        {"Black_Friday": [10, 11], "Promotion": np.arange(0, 90, 3)},
+        {"Promotion": np.flatnonzero(X[:, 3]), "Black_Friday": np.flatnonzero(X[:, 2])},
+    ]
+    preds = eng.evaluate(scenarios)
+    for row, scenario in zip(preds, scenarios):
+        np.testing.assert_allclose(row, _recompute(X, beta, scenario), rtol=1e-12)
+
+
+def test_compare_reports_uplift_against_baseline(engine):
+    eng, X, beta = engine
+    promo = eng.days(months=[1, 2, 3], weekdays=[0])
+    preds, table = eng.compare([{}, {"Promotion": promo}], ["Baseline", "Mondays"])
+    expected = np.maximum(_recompute(X, beta, {"Promotion": promo}), 0.0)
+    np.testing.assert_allclose(preds[1], expected, rtol=1e-12)
+    assert table["Uplift vs baseline"].iloc[0] == pytest.approx(0.0)
+    assert table["Total demand"].iloc[1] == pytest.approx(expected.sum())
+    assert table["Promotion days"].iloc[1] == len(promo)
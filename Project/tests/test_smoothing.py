@@ -0,0 +1,64 @@
+import os
+import sys
+
+import numpy as np
+import pytest
+
+PROJECT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, PROJECT_DIR)
+
+from core.smoothing import (  # noqa: E402
+    METHODS,
+    WEEKLY,
+    fit_params,
+    forecast,
+    parameter_grid,
+    synthetic_series,
+)
+
+
+def reference(y, method, alpha, beta, gamma, m=WEEKLY):
+    # one series, one day at a time, additive level / trend / season
+    level = float(np.mean(y[:m]))
+    trend = 0.0
+    season = list(y[:m] - level) if method == "holt_winters" else [0.0] * m
+    out = []
+    for t, value in enumerate(y):
+        s = season[t % m]
+        out.append(level + trend + s)
+        new_level = alpha * (value - s) + (1 - alpha) * (level + trend)
+        if method == "holt_winters":
+            season[t % m] = gamma * (value - level - trend) + (1 - gamma) * s
+        if method in ("holt", "holt_winters"):
+            trend = beta * (new_level - level) + (1 - beta) * trend
+        level = new_level
+    return np.array(out)
+
+
+@pytest.fixture
+def series():
+    return synthetic_series(5, 90, seed=5)
+
+
+@pytest.mark.parametrize("method", METHODS)
+def test_vectorized_recurrence_matches_scalar_loop(series, method):
+    alpha = np.array([0.05, 0.1, 0.2, 0.4, 0.3])
+    beta = np.array([0.01, 0.05, 0.1, 0.2, 0.3])
+    gamma = np.array([0.05, 0.1, 0.3, 0.2, 0.5])
+    F = forecast(series, method, (alpha, beta, gamma))
+    for i, y in enumerate(series):
+        expected = reference(y, method, alpha[i], beta[i], gamma[i])
+        np.testing.assert_allclose(F[i], expected, rtol=1e-10)
+
+
+@pytest.mark.parametrize("method", METHODS)
+def test_fit_params_picks_the_lowest_scalar_sse(series, method):
+    params = np.column_stack(fit_params(series, method))
+    for i, y in enumerate(series):
+        sse = {g: ((y - reference(y, method, *g)) ** 2).sum() for g in parameter_grid(method)}
+        assert sse[tuple(params[i])] == pytest.approx(min(sse.values()))
+
+
+def test_too_short_series_is_rejected():
+    with pytest.raises(ValueError):
+        forecast(np.ones((2, WEEKLY - 1)), "ses", (0.1, 0.0, 0.0))
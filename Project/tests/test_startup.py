@@ -0,0 +1,30 @@
+import os
+import sys
+
+import pytest
+
+PROJECT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, PROJECT_DIR)
+
+from core import store  # noqa: E402
+from core.imports import STARTUP_BUDGET, check_startup  # noqa: E402
+
+
+@pytest.fixture(scope="session")
+def built_store():
+    # no page opens the store at startup any more; build it up front anyway
+    # so a stale store on this machine cannot leak into the timing
+    cwd = os.getcwd()
+    os.chdir(PROJECT_DIR)            # store paths are relative to the project
+    try:
+        store.connect().close()
+    finally:
+        os.chdir(cwd)
+
+
+def test_app_startup_imports_within_budget(built_store, monkeypatch):
+    # app.py reads assets/ and data/ relative to the project folder
+    monkeypatch.chdir(PROJECT_DIR)
+    # the first, cold run must be within budget, not only the best of several
+    assert check_startup(budget=STARTUP_BUDGET, repeat=1) == []
+    assert check_startup(budget=STARTUP_BUDGET) == []